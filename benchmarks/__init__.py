@@ -0,0 +1 @@
+"""Benchmarks for the textkit and dataval hot paths."""
@@ -0,0 +1,433 @@
+"""
+Benchmark the hot library functions and compare runs against a baseline.
+
+Usage:
+    python -m benchmarks.run run --sizes 1KB,1MB,64MB -o results.json
+    python -m benchmarks.run compare baseline.json results.json --threshold 10
+"""
+
+import argparse
+import json
+import platform
+import re
+import sys
+import time
+import tracemalloc
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from importlib.util import find_spec
+from itertools import cycle, islice
+from typing import Any
+
+from dataval.analyzer import (
+    is_credit_card,
+    is_credit_card_batch,
+    is_date,
+    is_email,
+)
+from dataval.transformer import convert_keys, to_snake_case
+from dataval.validation.summarizer import Field, Schema
+from textkit.advanced.validator import summarize
+from textkit.transformers import extract_emails, replace_all, slugify
+from textkit.validators import get_top_words, word_frequency
+
+DEFAULT_SIZES = "1KB,1MB,16MB"
+DEFAULT_THRESHOLD = 10.0
+
+_UNITS = {"B": 1, "KB": 1 << 10, "MB": 1 << 20, "GB": 1 << 30}
+_SEED_TEXT = (
+    "The quick brown fox jumps over the lazy dog. Contact jane.doe@example"
+    ".com or visit https://example.org/docs for details! Python 3.13 is "
+    "fast, isn't it? Mr. Smith paid $4.50 for 2 coffees.\n"
+)
+_VALUES = {
+    "email": ["user@example.com", "not-an-email", "a.b+c@sub.domain.org"],
+    "card": ["4111 1111 1111 1111", "1234-5678-9012-3456", "4012888888881881"],
+    "date": ["2024-02-29", "2023-13-01", "1999-12-31"],
+    "name": ["HelloWorldExample", "some value-here", "already_snake_case"],
+}
+
+
+@dataclass
+class Benchmark:
+    """A function benchmarked over synthetic input of a given size."""
+
+    name: str
+    setup: Callable[[int], Any]
+    run: Callable[[Any], object]
+
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(
+    name: str, setup: Callable[[int], Any], requires: str | None = None
+) -> Callable[..., Any]:
+    """
+    Register a benchmark.
+
+    Args:
+        name: Benchmark name, usually the benchmarked function
+        setup: Function building the input for a size in bytes
+        requires: Optional dependency the benchmark needs; the benchmark
+            is skipped when it is not installed
+
+    Returns:
+        Decorator registering the benchmarked callable
+    """
+
+    def register(run: Callable[[Any], object]) -> Callable[[Any], object]:
+        if requires is None or find_spec(requires) is not None:
+            BENCHMARKS[name] = Benchmark(name, setup, run)
+        return run
+
+    return register
+
+
+def parse_size(size: str) -> int:
+    """
+    Parse a size such as "64MB" into bytes.
+
+    Args:
+        size: Number followed by B, KB, MB or GB
+
+    Returns:
+        Size in bytes
+
+    Raises:
+        ValueError: If the size cannot be parsed.
+    """
+    match = re.fullmatch(r"(\d+)\s*([KMG]?B)", size.strip().upper())
+    if match is None:
+        raise ValueError(f"Invalid size: {size}")
+    return int(match.group(1)) * _UNITS[match.group(2)]
+
+
+def synthetic_text(size: int) -> str:
+    """Build a text of about ``size`` characters."""
+    repeats = size // len(_SEED_TEXT) + 1
+    return (_SEED_TEXT * repeats)[:size]
+
+
+def synthetic_values(kind: str) -> Callable[[int], tuple[list[str], int]]:
+    """Build a setup producing values of one kind totalling a size."""
+
+    def setup(size: int) -> tuple[list[str], int]:
+        pool = _VALUES[kind]
+        average = sum(map(len, pool)) / len(pool)
+        return pool, max(1, int(size / average))
+
+    return setup
+
+
+def iter_values(payload: tuple[list[Any], int]) -> Iterator[Any]:
+    """Yield ``count`` values cycling through the pool, without copies."""
+    pool, count = payload
+    return islice(cycle(pool), count)
+
+
+def consume(results: Iterable[object]) -> None:
+    """Exhaust an iterator without keeping its results alive."""
+    deque(results, maxlen=0)
+
+
+@benchmark("word_frequency", synthetic_text)
+def _word_frequency(text: str) -> object:
+    return word_frequency(text)
+
+
+@benchmark("get_top_words", synthetic_text)
+def _get_top_words(text: str) -> object:
+    return get_top_words(text, n=10)
+
+
+@benchmark("replace_all", synthetic_text)
+def _replace_all(text: str) -> object:
+    return replace_all(text, {"fox": "cat", "dog": "wolf", "fast": "quick"})
+
+
+@benchmark("extract_emails", synthetic_text)
+def _extract_emails(text: str) -> object:
+    return extract_emails(text)
+
+
+@benchmark("summarize", synthetic_text)
+def _summarize(text: str) -> object:
+    return summarize(text, sentence_count=3)
+
+
+@benchmark("slugify", synthetic_values("name"))
+def _slugify(payload: tuple[list[str], int]) -> object:
+    return consume(map(slugify, iter_values(payload)))
+
+
+@benchmark("is_email", synthetic_values("email"))
+def _is_email(payload: tuple[list[str], int]) -> object:
+    return sum(map(is_email, iter_values(payload)))
+
+
+@benchmark("is_credit_card", synthetic_values("card"))
+def _is_credit_card(payload: tuple[list[str], int]) -> object:
+    return sum(map(is_credit_card, iter_values(payload)))
+
+
+def _card_column(size: int) -> list[str]:
+    return list(iter_values(synthetic_values("card")(size)))
+
+
+@benchmark("is_credit_card_batch", _card_column, requires="numpy")
+def _is_credit_card_batch(column: list[str]) -> object:
+    return is_credit_card_batch(column)
+
+
+@benchmark("is_date", synthetic_values("date"))
+def _is_date(payload: tuple[list[str], int]) -> object:
+    return sum(map(is_date, iter_values(payload)))
+
+
+@benchmark("to_snake_case", synthetic_values("name"))
+def _to_snake_case(payload: tuple[list[str], int]) -> object:
+    return consume(map(to_snake_case, iter_values(payload)))
+
+
+_SCHEMA = Schema(
+    {
+        "email": Field(str, validators=[is_email]),
+        "joined": Field(str, validators=[is_date]),
+        "age": Field(int, validators=[lambda n: n >= 18]),
+    }
+)
+
+
+def _records(size: int) -> tuple[list[dict[str, Any]], int]:
+    pool = [
+        {"email": "user@example.com", "joined": "2024-01-31", "age": 30},
+        {"email": "broken", "joined": "2024-02-30", "age": 12},
+        {"email": "x@y.io", "age": 45},
+    ]
+    average = sum(len(json.dumps(record)) for record in pool) / len(pool)
+    return pool, max(1, int(size / average))
+
+
+@benchmark("Schema.validate", _records)
+def _schema_validate(payload: tuple[list[dict[str, Any]], int]) -> object:
+    return consume(map(_SCHEMA.validate, iter_values(payload)))
+
+
+_PAYLOAD_RECORD = {
+    "userId": 42,
+    "displayName": "Jane Doe",
+    "emailAddress": "jane.doe@example.com",
+    "createdAt": "2024-01-31T12:00:00",
+    "billingAddress": {
+        "streetLine": "1 Main St",
+        "postalCode": "12345",
+        "countryCode": "US",
+    },
+    "orderItems": [
+        {"itemId": 1, "unitPrice": 9.99, "itemQuantity": 2},
+        {"itemId": 7, "unitPrice": 4.5, "itemQuantity": 1},
+    ],
+}
+
+
+def _payload(size: int) -> list[dict[str, Any]]:
+    count = max(1, size // len(json.dumps(_PAYLOAD_RECORD)))
+    return [_PAYLOAD_RECORD] * count
+
+
+@benchmark("convert_keys", _payload)
+def _convert_keys(payload: list[dict[str, Any]]) -> object:
+    return convert_keys(payload, "snake")
+
+
+def measure(
+    bench: Benchmark, size: int, repeat: int = 3, memory: bool = True
+) -> dict[str, Any]:
+    """
+    Measure one benchmark at one input size.
+
+    Timing runs are separate from the tracemalloc run, since tracing
+    slows allocations down considerably.
+
+    Args:
+        bench: Benchmark to run
+        size: Input size in bytes
+        repeat: Number of timed runs; the fastest one is kept
+        memory: Whether to record peak memory with tracemalloc
+
+    Returns:
+        Result with the best time, throughput and peak memory
+    """
+    payload = bench.setup(size)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        bench.run(payload)
+        best = min(best, time.perf_counter() - start)
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        try:
+            bench.run(payload)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "name": bench.name,
+        "size": size,
+        "seconds": best,
+        "mb_per_s": size / (1 << 20) / best if best else float("inf"),
+        "peak_bytes": peak,
+    }
+
+
+def run_suite(
+    sizes: Iterable[int],
+    names: Iterable[str] | None = None,
+    repeat: int = 3,
+    memory: bool = True,
+) -> dict[str, Any]:
+    """
+    Run benchmarks over every size.
+
+    Args:
+        sizes: Input sizes in bytes
+        names: Benchmarks to run (default: all)
+        repeat: Number of timed runs per measurement
+        memory: Whether to record peak memory
+
+    Returns:
+        JSON-serializable report keyed by "name@size"
+
+    Raises:
+        ValueError: If an unknown benchmark is requested.
+    """
+    selected = list(names) if names else list(BENCHMARKS)
+    unknown = set(selected) - set(BENCHMARKS)
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {sorted(unknown)}")
+
+    results = {}
+    for size in sizes:
+        for name in selected:
+            result = measure(BENCHMARKS[name], size, repeat, memory)
+            results[f"{name}@{size}"] = result
+            print(
+                f"{name:>20} {size:>12} B  {result['mb_per_s']:10.2f} MB/s",
+                file=sys.stderr,
+            )
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[str]:
+    """
+    Find benchmarks whose throughput regressed against a baseline.
+
+    Only measurements present in both reports are compared.
+
+    Args:
+        baseline: Report from run_suite() used as reference
+        current: Report from run_suite() to check
+        threshold: Allowed throughput loss in percent
+
+    Returns:
+        Descriptions of the regressions (empty if none)
+    """
+    regressions = []
+    for key, result in current["results"].items():
+        reference = baseline["results"].get(key)
+        if reference is None:
+            continue
+        change = (result["mb_per_s"] / reference["mb_per_s"] - 1) * 100
+        if change < -threshold:
+            regressions.append(
+                f"{key}: {reference['mb_per_s']:.2f} -> "
+                f"{result['mb_per_s']:.2f} MB/s ({change:+.1f}%)"
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Command-line entry point.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+
+    Returns:
+        Exit status: 1 if the comparison found regressions, else 0
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark textkit and dataval functions"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument(
+        "--sizes",
+        default=DEFAULT_SIZES,
+        help=f"Comma-separated input sizes (default: {DEFAULT_SIZES})",
+    )
+    run_parser.add_argument(
+        "--only",
+        action="append",
+        choices=sorted(BENCHMARKS),
+        help="Benchmark to run (repeatable, default: all)",
+    )
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument(
+        "--no-memory", action="store_true", help="Skip peak memory"
+    )
+    run_parser.add_argument("-o", "--output", help="JSON report file")
+
+    compare_parser = commands.add_parser(
+        "compare", help="Fail on throughput regressions"
+    )
+    compare_parser.add_argument("baseline", help="Baseline JSON report")
+    compare_parser.add_argument("current", help="Current JSON report")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed throughput loss in percent",
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        sizes = [parse_size(size) for size in args.sizes.split(",")]
+        report = run_suite(sizes, args.only, args.repeat, not args.no_memory)
+        output = json.dumps(report, indent=2)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.write(output + "\n")
+        else:
+            print(output)
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.current, encoding="utf-8") as f:
+        current = json.load(f)
+    regressions = compare(baseline, current, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,18 +2,29 @@
 """
 Interactive command shell example using the cmd package.
 This example demonstrates an interactive shell for the delta-313 package.
+
+Run without arguments for an interactive session, or pass script files
+of shell commands to run them non-interactively:
+
+    python cmd_example.py investigation.txt
 """
 
+import argparse
 import cmd
+import contextlib
+import io
 import shlex
+import sys
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
 
-from textkit.analyzer import (
-    average_word_length,
-    get_top_words,
-)
-from textkit.transformer import extract_emails, slugify, truncate
-from dataval.validators import is_date, is_email, is_url
-from dataval.transformers import to_camel_case, to_snake_case, to_title_case
+from dataval.registry import REGISTRY
+from dataval.transformer import to_camel_case, to_snake_case, to_title_case
+from textkit.document import Document
+from textkit.transformers import extract_emails, slugify, truncate
+from textkit.validators import average_word_length, get_top_words
 
 
 class Delta313Shell(cmd.Cmd):
@@ -26,25 +37,104 @@ class Delta313Shell(cmd.Cmd):
     """
     prompt = "delta313> "
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the shell with an empty document cache."""
+        super().__init__(*args, **kwargs)
+        # Loaded documents by name; their tokens and frequencies are
+        # computed once and reused by every command
+        self.documents: dict[str, Document] = {}
+
+    def _document(self, arg: str) -> Document | None:
+        """
+        Resolve a command argument to a document.
+
+        Args:
+            arg: Inline text, or "@name" for a loaded document
+
+        Returns:
+            The document, or None if the name is not loaded
+        """
+        if not arg.startswith("@"):
+            return Document(arg)
+        doc = self.documents.get(arg[1:])
+        if doc is None:
+            print(f"No document named {arg[1:]!r}; use 'load' first.")
+        return doc
+
+    def do_load(self, arg: str) -> None:
+        """
+        Load a file as a named document for later commands.
+        Usage: load path/to/file.txt [name]
+
+        The name defaults to the file name without its extension; refer
+        to the document as @name in analyze, transform, validate and
+        extract.
+        """
+        args = shlex.split(arg)
+        if not args or len(args) > 2:
+            print("Usage: load path/to/file.txt [name]")
+            return
+
+        path = Path(args[0])
+        name = args[1] if len(args) > 1 else path.stem
+        try:
+            doc = Document(path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Error: {e}")
+            return
+
+        start = time.perf_counter()
+        # Tokenize up front so later commands only read the cache
+        words = len(doc.tokens)
+        sentences = len(doc.sentence_spans)
+        elapsed = time.perf_counter() - start
+        self.documents[name] = doc
+        print(
+            f"Loaded @{name}: {len(doc)} chars, {words} words, "
+            f"{sentences} sentences ({elapsed * 1000:.1f} ms)"
+        )
+
+    def do_docs(self, arg: str) -> None:
+        """
+        List the loaded documents.
+        Usage: docs
+        """
+        if not self.documents:
+            print("No documents loaded.")
+            return
+        for name, doc in self.documents.items():
+            print(f"  @{name}: {len(doc)} chars, {len(doc.tokens)} words")
+
+    def do_unload(self, arg: str) -> None:
+        """
+        Forget a loaded document.
+        Usage: unload name
+        """
+        if self.documents.pop(arg.strip().lstrip("@"), None) is None:
+            print(f"No document named {arg.strip()!r}.")
+
     def do_analyze(self, arg: str) -> None:
         """
         Analyze text and show statistics.
-        Usage: analyze "Your text here"
+        Usage: analyze "Your text here" | analyze @name
         """
         if not arg:
             print("Please provide text to analyze.")
             return
 
         try:
-            text = shlex.split(arg)[0]
-            print(f"\nText Analysis for: {text}\n" + "-" * 40)
-            print(f"Word Count: {len(text.split())}")
-            print(f"Character Count: {len(text)}")
-            print(f"Average Word Length: {average_word_length(text):.2f}")
+            doc = self._document(shlex.split(arg)[0])
+            if doc is None:
+                return
+            label = arg.strip() if arg.startswith("@") else doc.text
+            print(f"\nText Analysis for: {label}\n" + "-" * 40)
+            print(f"Word Count: {len(doc.tokens)}")
+            print(f"Character Count: {len(doc)}")
+            print(f"Average Word Length: {average_word_length(doc):.2f}")
 
             # Show word frequency
             print("\nTop Words:")
-            for word, count in get_top_words(text, n=5):
+            for word, count in get_top_words(doc, n=5):
                 print(f"  {word}: {count}")
         except Exception as e:
             print(f"Error: {e}")
@@ -52,7 +142,7 @@ class Delta313Shell(cmd.Cmd):
     def do_transform(self, arg: str) -> None:
         """
         Transform text with different methods.
-        Usage: transform [method] "Your text here"
+        Usage: transform [method] "Your text here" | transform [method] @name
 
         Available methods:
           - slug: Convert to URL-friendly slug
@@ -66,10 +156,14 @@ class Delta313Shell(cmd.Cmd):
             print('Usage: transform [method] "Your text here"')
             return
 
-        method, text = args[0], args[1]
+        method = args[0]
+        doc = self._document(args[1])
+        if doc is None:
+            return
+        text = doc.text
 
         try:
-            print(f"\nTransforming text: {text}\n" + "-" * 40)
+            print(f"\nTransforming text: {args[1]}\n" + "-" * 40)
 
             if method == "slug":
                 print(f"Slug: {slugify(text)}")
@@ -89,11 +183,14 @@ class Delta313Shell(cmd.Cmd):
     def do_validate(self, arg: str) -> None:
         """
         Validate data based on specified type.
-        Usage: validate [type] "data to validate"
+        Usage: validate [type] "data to validate" | validate [type] @name
+
+        With a loaded document, every non-blank line is validated.
 
         Available types:
           - email: Validate email address
           - url: Validate URL
+          - credit_card: Validate card number (Luhn checksum)
           - date: Validate date (YYYY-MM-DD)
         """
         args = shlex.split(arg)
@@ -102,28 +199,34 @@ class Delta313Shell(cmd.Cmd):
             return
 
         data_type, data = args[0], args[1]
+        if data_type not in REGISTRY:
+            print(f"Unknown validation type: {data_type}")
+            return
+        validator = REGISTRY.get(data_type)
 
         try:
             print(f"\nValidating {data_type}: {data}\n" + "-" * 40)
 
-            if data_type == "email":
-                result = is_email(data)
-                print(f"Is valid email: {result}")
-            elif data_type == "url":
-                result = is_url(data)
-                print(f"Is valid URL: {result}")
-            elif data_type == "date":
-                result = is_date(data)
-                print(f"Is valid date: {result}")
+            if data.startswith("@"):
+                doc = self._document(data)
+                if doc is None:
+                    return
+                values = [v.strip() for v in doc.text.splitlines()]
+                values = [v for v in values if v]
+                valid = sum(1 for value in values if validator(value))
+                print(f"Valid {data_type} lines: {valid} of {len(values)}")
+                stats = REGISTRY.stats().get(data_type)
+                if stats:
+                    print(f"Cache hit rate: {stats['hit_rate']:.1%}")
             else:
-                print(f"Unknown validation type: {data_type}")
+                print(f"Is valid {data_type}: {validator(data)}")
         except Exception as e:
             print(f"Error: {e}")
 
     def do_extract(self, arg: str) -> None:
         """
         Extract data from text.
-        Usage: extract [type] "Your text here"
+        Usage: extract [type] "Your text here" | extract [type] @name
 
         Available types:
           - emails: Extract email addresses
@@ -133,13 +236,16 @@ class Delta313Shell(cmd.Cmd):
             print('Usage: extract [type] "Your text here"')
             return
 
-        extract_type, text = args[0], args[1]
+        extract_type = args[0]
+        doc = self._document(args[1])
+        if doc is None:
+            return
 
         try:
-            print(f"\nExtracting from text: {text}\n" + "-" * 40)
+            print(f"\nExtracting from text: {args[1]}\n" + "-" * 40)
 
             if extract_type == "emails":
-                emails = extract_emails(text)
+                emails = extract_emails(doc.text)
                 if emails:
                     print("Emails found:")
                     for email in emails:
@@ -151,6 +257,74 @@ class Delta313Shell(cmd.Cmd):
         except Exception as e:
             print(f"Error: {e}")
 
+    def do_timeit(self, arg: str) -> None:
+        """
+        Time another command, discarding its output.
+        Usage: timeit [-n runs] command arguments...
+
+        Example: timeit -n 100 analyze @sample
+        """
+        args = arg.split(maxsplit=2)
+        runs = 10
+        if args and args[0] == "-n":
+            if len(args) < 3 or not args[1].isdigit() or int(args[1]) < 1:
+                print("Usage: timeit [-n runs] command arguments...")
+                return
+            runs = int(args[1])
+            line = args[2]
+        else:
+            line = arg.strip()
+        if not line or line.split()[0] == "timeit":
+            print("Usage: timeit [-n runs] command arguments...")
+            return
+
+        times = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(runs):
+                start = time.perf_counter()
+                self.onecmd(line)
+                times.append(time.perf_counter() - start)
+        print(
+            f"{runs} runs: best {min(times) * 1000:.3f} ms, "
+            f"mean {sum(times) / runs * 1000:.3f} ms"
+        )
+
+    def do_source(self, arg: str) -> bool | None:
+        """
+        Run the commands of a script file.
+        Usage: source path/to/script.txt
+        """
+        if not arg.strip():
+            print("Usage: source path/to/script.txt")
+            return None
+        try:
+            with open(arg.strip(), encoding="utf-8") as f:
+                return self.run_script(f)
+        except OSError as e:
+            print(f"Error: {e}")
+            return None
+
+    def run_script(self, lines: Iterable[str]) -> bool:
+        """
+        Run commands non-interactively, echoing each one.
+
+        Blank lines and lines starting with "#" are skipped.
+
+        Args:
+            lines: Command lines, such as an open script file
+
+        Returns:
+            True if a command asked to stop the shell
+        """
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            print(f"{self.prompt}{line}")
+            if self.onecmd(line):
+                return True
+        return False
+
     def do_quit(self, arg: str) -> bool:
         """Exit the program."""
         print("Goodbye!")
@@ -164,10 +338,30 @@ class Delta313Shell(cmd.Cmd):
         """Handle empty line."""
 
 
-def main() -> None:
-    """Start the interactive shell."""
-    Delta313Shell().cmdloop()
+def main(argv: list[str] | None = None) -> None:
+    """
+    Start the interactive shell, or run script files.
+
+    Args:
+        argv: Script files to run in order (default: none, which starts
+            an interactive session)
+    """
+    parser = argparse.ArgumentParser(description="Delta-313 shell")
+    parser.add_argument(
+        "scripts", nargs="*", help="Files of shell commands to run"
+    )
+    args = parser.parse_args(argv or [])
+
+    shell = Delta313Shell()
+    if not args.scripts:
+        shell.cmdloop()
+        return
+    # One shell for all scripts, so documents loaded by one stay cached
+    for script in args.scripts:
+        with open(script, encoding="utf-8") as f:
+            if shell.run_script(f):
+                break
 
 
 if __name__ == "__main__":
-    main()
+    main(sys.argv[1:])
@@ -7,20 +7,19 @@ This script demonstrates both packages:
 - dataval: Data validation library
 """
 
+# Heavy imports are deferred to the demo that needs them, so that
+# argument parsing and --help stay fast
 import argparse
 
-from rich.console import Console
-from rich.panel import Panel
-
-import textkit.analyzer as text_analysis
-import textkit.transformer as text_transform
-import dataval.validators as validators
-import dataval.transformers as transformers
-from dataval.validation.schema import Field, Schema
-
 
 def demo_text_utils(sample_text: str) -> None:
     """Demonstrate text utilities from textkit."""
+    from rich.console import Console  # pylint: disable=C0415
+    from rich.panel import Panel  # pylint: disable=C0415
+
+    import textkit.transformers as text_transform  # pylint: disable=C0415
+    import textkit.validators as text_analysis  # pylint: disable=C0415
+
     console = Console()
 
     console.print(
@@ -59,6 +58,16 @@ def demo_text_utils(sample_text: str) -> None:
 
 def demo_data_validation() -> None:
     """Demonstrate data validation from dataval."""
+    from rich.console import Console  # pylint: disable=C0415
+    from rich.panel import Panel  # pylint: disable=C0415
+
+    import dataval.analyzer as validators  # pylint: disable=C0415
+    import dataval.transformer as transformers  # pylint: disable=C0415
+    from dataval.validation.summarizer import (  # pylint: disable=C0415
+        Field,
+        Schema,
+    )
+
     console = Console()
 
     console.print(
@@ -136,6 +145,8 @@ def run_cmd_example() -> None:
 
         cmd_example.main()
     except ImportError:
+        from rich.console import Console  # pylint: disable=C0415
+
         console = Console()
         console.print("[bold red]Error:[/] cmd_example.py not found")
 
@@ -149,6 +160,8 @@ def run_unittest_example() -> None:
 
         unittest.main(module=tests.unittest_example)
     except ImportError:
+        from rich.console import Console  # pylint: disable=C0415
+
         console = Console()
         console.print(
             "[bold red]Error:[/] \
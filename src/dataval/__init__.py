@@ -1,3 +1,95 @@
 """Data validation and transformation library."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
+
+# Public names and the submodules defining them. Submodules are only
+# imported on first access (PEP 562), so "import dataval" stays cheap.
+_EXPORTS = {
+    "is_email": "dataval.analyzer",
+    "is_url": "dataval.analyzer",
+    "is_credit_card": "dataval.analyzer",
+    "is_credit_card_batch": "dataval.analyzer",
+    "is_date": "dataval.analyzer",
+    "is_number_in_range": "dataval.analyzer",
+    "is_number_in_range_batch": "dataval.analyzer",
+    "to_snake_case": "dataval.transformer",
+    "to_camel_case": "dataval.transformer",
+    "to_title_case": "dataval.transformer",
+    "convert_keys": "dataval.transformer",
+    "format_date": "dataval.transformer",
+    "dict_to_json": "dataval.transformer",
+    "DateFormat": "dataval.dates",
+    "compile_format": "dataval.dates",
+    "ValidatorRegistry": "dataval.registry",
+    "REGISTRY": "dataval.registry",
+    "Field": "dataval.validation.summarizer",
+    "Schema": "dataval.validation.summarizer",
+    "DatasetProfile": "dataval.validation.inference",
+    "infer_schema": "dataval.validation.inference",
+}
+
+__all__ = [
+    "__version__",
+    "is_email",
+    "is_url",
+    "is_credit_card",
+    "is_credit_card_batch",
+    "is_date",
+    "is_number_in_range",
+    "is_number_in_range_batch",
+    "to_snake_case",
+    "to_camel_case",
+    "to_title_case",
+    "convert_keys",
+    "format_date",
+    "dict_to_json",
+    "DateFormat",
+    "compile_format",
+    "ValidatorRegistry",
+    "REGISTRY",
+    "Field",
+    "Schema",
+    "DatasetProfile",
+    "infer_schema",
+]
+
+if TYPE_CHECKING:
+    from dataval.analyzer import (
+        is_credit_card,
+        is_credit_card_batch,
+        is_date,
+        is_email,
+        is_number_in_range,
+        is_number_in_range_batch,
+        is_url,
+    )
+    from dataval.dates import DateFormat, compile_format
+    from dataval.registry import REGISTRY, ValidatorRegistry
+    from dataval.transformer import (
+        convert_keys,
+        dict_to_json,
+        format_date,
+        to_camel_case,
+        to_snake_case,
+        to_title_case,
+    )
+    from dataval.validation.inference import DatasetProfile, infer_schema
+    from dataval.validation.summarizer import Field, Schema
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names from their submodule on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes, including lazy exports."""
+    return sorted({*globals(), *_EXPORTS})
@@ -1,7 +1,27 @@
 """Data validators for common data types."""
 
 import re
-from datetime import datetime
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from dataval.dates import compile_format
+from dataval.instrument import timed
+from dataval.optional import require_numpy
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+# Unanchored patterns, shared with the textkit entity scanner
+EMAIL_PATTERN = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
+URL_PATTERN = r"(?:https?|ftp):\/\/[^\s/$.?#].[^\s]*"
+# Anchored versions, compiled once for the validators
+_EMAIL = re.compile(rf"^{EMAIL_PATTERN}$")
+_URL = re.compile(rf"^{URL_PATTERN}$")
+# Card numbers have 13 to 19 digits
+_CARD_MIN, _CARD_MAX = 13, 19
+# Rows of the digit matrix built at once by is_credit_card_batch()
+_CARD_CHUNK = 1 << 16
 
 
 def is_email(value: str) -> bool:
@@ -14,8 +34,7 @@ def is_email(value: str) -> bool:
     Returns:
         True if valid email, False otherwise
     """
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(pattern, value))
+    return _EMAIL.match(value) is not None
 
 
 def is_url(value: str) -> bool:
@@ -28,8 +47,7 @@ def is_url(value: str) -> bool:
     Returns:
         True if valid URL, False otherwise
     """
-    pattern = r"^(https?|ftp):\/\/[^\s/$.?#].[^\s]*$"
-    return bool(re.match(pattern, value))
+    return _URL.match(value) is not None
 
 
 def is_credit_card(value: str) -> bool:
@@ -50,7 +68,7 @@ def is_credit_card(value: str) -> bool:
         return False
 
     # Check length (most credit cards are between 13-19 digits)
-    if not 13 <= len(value) <= 19:
+    if not _CARD_MIN <= len(value) <= _CARD_MAX:
         return False
 
     # Luhn algorithm
@@ -77,11 +95,7 @@ def is_date(value: str, format_str: str = "%Y-%m-%d") -> bool:
     Returns:
         True if valid date, False otherwise
     """
-    try:
-        datetime.strptime(value, format_str)
-        return True
-    except ValueError:
-        return False
+    return compile_format(format_str).is_valid(value)
 
 
 def is_number_in_range(
@@ -105,3 +119,102 @@ def is_number_in_range(
     if max_val is not None and value > max_val:
         return False
     return True
+
+
+@timed
+def is_credit_card_batch(
+    values: "Iterable[str] | np.ndarray", chunk_size: int = _CARD_CHUNK
+) -> "np.ndarray":
+    """
+    Validate a column of credit card numbers, like is_credit_card().
+
+    Separators are removed only from the values that contain any, then
+    the numbers are right-aligned into a matrix of digits padded with
+    zeros, which do not change a Luhn checksum. Every second column from
+    the right is doubled, so the checksums of a whole chunk come out of
+    one matrix-vector product. Only ``chunk_size`` rows are expanded at
+    a time, so memory stays bounded for columns of millions of values.
+
+    Unlike is_credit_card(), only ASCII digits are accepted.
+
+    Args:
+        values: Card numbers, as a list or NumPy array (non-string
+            values are converted with str())
+        chunk_size: Number of values processed per chunk
+
+    Returns:
+        Boolean mask, True where the value is a valid card number
+
+    Raises:
+        ImportError: If NumPy is not installed.
+        ValueError: If chunk_size is not positive.
+    """
+    np: Any = require_numpy("Batch credit card validation")
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+    numbers = np.asarray(values).ravel()
+    if numbers.dtype.kind != "U":
+        numbers = numbers.astype(str)
+    valid: NDArray[Any] = np.zeros(len(numbers), dtype=bool)
+    if not len(numbers):
+        return valid
+
+    separated = (np.strings.find(numbers, " ") >= 0) | (
+        np.strings.find(numbers, "-") >= 0
+    )
+    if separated.any():
+        numbers = numbers.copy()
+        stripped = np.strings.replace(numbers[separated], " ", "")
+        numbers[separated] = np.strings.replace(stripped, "-", "")
+    lengths = np.strings.str_len(numbers)
+    usable = (lengths >= _CARD_MIN) & (lengths <= _CARD_MAX)
+
+    # Weight 2 on every second digit from the right; doubled digits
+    # above 4 lose 9 (the digit sum of 2 * d is 2 * d - 9)
+    weights = np.ones(_CARD_MAX, dtype=np.float32)
+    weights[-2::-2] = 2
+    for start in range(0, len(numbers), chunk_size):
+        rows = slice(start, start + chunk_size)
+        chunk = np.where(usable[rows], numbers[rows], "")
+        chunk = np.strings.rjust(chunk.astype(f"<U{_CARD_MAX}"), _CARD_MAX, "0")
+        digits = chunk.view(np.uint32).reshape(-1, _CARD_MAX) - ord("0")
+        # Code points below "0" wrap around to large values
+        is_number = digits.max(axis=1) <= 9
+        digits = np.minimum(digits, 9).astype(np.float32)
+        high = (digits[:, -2::-2] > 4).sum(axis=1, dtype=np.int32)
+        checksum = (digits @ weights).astype(np.int32) - 9 * high
+        valid[rows] = usable[rows] & is_number & (checksum % 10 == 0)
+    return valid
+
+
+@timed
+def is_number_in_range_batch(
+    values: "Iterable[int | float] | np.ndarray",
+    min_val: int | float | None = None,
+    max_val: int | float | None = None,
+) -> "np.ndarray":
+    """
+    Validate a column of numbers, like is_number_in_range().
+
+    The bounds are checked with array comparisons. As with the scalar
+    validator, NaN is never out of range.
+
+    Args:
+        values: Numbers, as a list or NumPy array
+        min_val: Minimum allowed value (inclusive)
+        max_val: Maximum allowed value (inclusive)
+
+    Returns:
+        Boolean mask, True where the value is in range
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    np: Any = require_numpy("Batch range validation")
+    numbers = np.asarray(values)
+    valid: NDArray[Any] = np.ones(numbers.shape, dtype=bool)
+    if min_val is not None:
+        valid &= ~(numbers < min_val)
+    if max_val is not None:
+        valid &= ~(numbers > max_val)
+    return valid
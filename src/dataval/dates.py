@@ -0,0 +1,257 @@
+"""Compiled date formats with fast paths for fixed-width layouts."""
+
+import re
+from collections.abc import Iterable
+from datetime import datetime
+from functools import lru_cache
+
+from dataval.instrument import timed
+
+# Format name parsed with datetime.fromisoformat() instead of strptime
+ISO_FORMAT = "iso"
+DEFAULT_CACHE_SIZE = 4096
+
+# Directive -> (digits pattern, slot in the datetime() arguments)
+_FIELDS = {
+    "Y": (r"(\d{4})", 0),
+    "m": (r"(\d{2})", 1),
+    "d": (r"(\d{2})", 2),
+    "H": (r"(\d{2})", 3),
+    "M": (r"(\d{2})", 4),
+    "S": (r"(\d{2})", 5),
+    "f": (r"(\d{1,6})", 6),  # Fractions padded to microseconds
+}
+# datetime() arguments of a field that is absent from a format, as in
+# datetime.strptime()
+_DEFAULTS = (1900, 1, 1, 0, 0, 0, 0)
+_MICROSECOND = 6
+
+# Regex over the whole value and the datetime() slot of each group
+Plan = tuple[re.Pattern[str], tuple[int, ...]]
+
+
+def _fixed_width_plan(fmt: str) -> Plan | None:
+    """
+    Compile a format into a regex over zero-padded fields, if possible.
+
+    Only %Y, %m, %d, %H, %M, %S, a final %f and literal characters are
+    supported; other formats return None and always go through
+    strptime.
+    """
+    pattern = []
+    slots: list[int] = []
+    i = 0
+    while i < len(fmt):
+        char = fmt[i]
+        if char != "%":
+            pattern.append(re.escape(char))
+            i += 1
+            continue
+        directive = fmt[i + 1 : i + 2]
+        i += 2
+        if directive == "%":
+            pattern.append("%")
+            continue
+        field = _FIELDS.get(directive)
+        if field is None or field[1] in slots:
+            return None
+        if directive == "f" and i < len(fmt):
+            return None
+        pattern.append(field[0])
+        slots.append(field[1])
+    return re.compile("".join(pattern), re.ASCII), tuple(slots)
+
+
+class DateFormat:
+    """
+    A date format compiled once and reused for many values.
+
+    Layouts made of zero-padded numeric fields, such as "%Y-%m-%d" or
+    "%Y-%m-%dT%H:%M:%S.%f", are parsed by a precompiled regex and
+    datetime(); any value that does not fit the fast path, and every
+    other format, goes through datetime.strptime(), so results and
+    errors are always the same as with strptime. The format "iso" uses
+    datetime.fromisoformat().
+
+    Results are memoized per value in a bounded LRU cache, since the
+    same date strings tend to repeat many times in logs and columns.
+    """
+
+    def __init__(self, fmt: str, cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Compile a format.
+
+        Args:
+            fmt: strptime() format, or "iso" for ISO 8601
+            cache_size: Number of parsed values remembered (0 disables
+                memoization)
+        """
+        self.format = fmt
+        self._plan = None if fmt == ISO_FORMAT else _fixed_width_plan(fmt)
+        self._lookup = (
+            lru_cache(maxsize=cache_size)(self._try_parse)
+            if cache_size > 0
+            else self._try_parse
+        )
+
+    def __repr__(self) -> str:
+        """Return a short representation of the format."""
+        return f"DateFormat({self.format!r})"
+
+    def _strptime(self, value: str) -> datetime:
+        if self.format == ISO_FORMAT:
+            return datetime.fromisoformat(value)
+        return datetime.strptime(value, self.format)
+
+    def _try_parse(self, value: str) -> datetime | None:
+        """Parse a value, returning None if it is not a valid date."""
+        if self._plan is not None and type(value) is str:
+            pattern, slots = self._plan
+            match = pattern.fullmatch(value)
+            if match is not None:
+                parts = list(_DEFAULTS)
+                for slot, digits in zip(slots, match.groups(), strict=True):
+                    if slot == _MICROSECOND:
+                        digits = digits.ljust(6, "0")
+                    parts[slot] = int(digits)
+                year, month, day, hour, minute, second, microsecond = parts
+                try:
+                    return datetime(
+                        year, month, day, hour, minute, second, microsecond
+                    )
+                except ValueError:
+                    pass
+        try:
+            return self._strptime(value)
+        except ValueError:
+            return None
+
+    def parse(self, value: str) -> datetime:
+        """
+        Parse a date string.
+
+        Args:
+            value: Date string
+
+        Returns:
+            The parsed datetime
+
+        Raises:
+            ValueError: If the value does not match the format.
+        """
+        parsed = self._lookup(value)
+        if parsed is None:
+            # Raise the error strptime reports for this value
+            self._strptime(value)
+            raise ValueError(f"Invalid date for {self.format!r}: {value!r}")
+        return parsed
+
+    def is_valid(self, value: str) -> bool:
+        """
+        Check whether a string is a valid date in this format.
+
+        Args:
+            value: String to validate
+
+        Returns:
+            True if valid date, False otherwise
+        """
+        return self._lookup(value) is not None
+
+    def reformat(self, value: str, output_format: str) -> str:
+        """
+        Convert a date string to another format.
+
+        Args:
+            value: Date string in this format
+            output_format: strftime() format of the result
+
+        Returns:
+            Formatted date string
+
+        Raises:
+            ValueError: If the value does not match the format.
+        """
+        return self.parse(value).strftime(output_format)
+
+    @timed(name="dataval.dates.DateFormat.parse_many")
+    def parse_many(self, values: Iterable[str]) -> list[datetime | None]:
+        """
+        Parse a column of date strings.
+
+        Args:
+            values: Date strings
+
+        Returns:
+            Parsed datetimes, None for invalid values
+        """
+        return list(map(self._lookup, values))
+
+    @timed(name="dataval.dates.DateFormat.validate_many")
+    def validate_many(self, values: Iterable[str]) -> list[bool]:
+        """
+        Validate a column of date strings.
+
+        Args:
+            values: Strings to validate
+
+        Returns:
+            True for each valid date, False otherwise
+        """
+        lookup = self._lookup
+        return [lookup(value) is not None for value in values]
+
+    @timed(name="dataval.dates.DateFormat.reformat_many")
+    def reformat_many(
+        self, values: Iterable[str], output_format: str
+    ) -> list[str | None]:
+        """
+        Convert a column of date strings to another format.
+
+        Each distinct value is only parsed and formatted once per call.
+
+        Args:
+            values: Date strings in this format
+            output_format: strftime() format of the results
+
+        Returns:
+            Formatted date strings, None for invalid values
+        """
+        lookup = self._lookup
+        formatted: dict[str, str | None] = {}
+        results = []
+        for value in values:
+            if value not in formatted:
+                parsed = lookup(value)
+                formatted[value] = (
+                    None if parsed is None else parsed.strftime(output_format)
+                )
+            results.append(formatted[value])
+        return results
+
+    def cache_info(self) -> tuple[int, int] | None:
+        """
+        Get the memoization statistics.
+
+        Returns:
+            (hits, misses), or None if memoization is disabled
+        """
+        cache_info = getattr(self._lookup, "cache_info", None)
+        if cache_info is None:
+            return None
+        info = cache_info()
+        return info.hits, info.misses
+
+
+@lru_cache(maxsize=64)
+def compile_format(fmt: str) -> DateFormat:
+    """
+    Get the shared compiled DateFormat for a format string.
+
+    Args:
+        fmt: strptime() format, or "iso" for ISO 8601
+
+    Returns:
+        The compiled format
+    """
+    return DateFormat(fmt)
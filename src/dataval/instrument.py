@@ -0,0 +1,191 @@
+"""Lightweight call counting and timing for library functions."""
+
+import time
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from functools import wraps
+from typing import Any, overload
+
+_enabled = False
+# Stage name -> [calls, wall seconds, CPU seconds]
+_stats: dict[str, list[float]] = {}
+_NULL_STAGE = nullcontext()
+
+
+def enable(flag: bool = True) -> None:
+    """
+    Turn recording on or off.
+
+    Args:
+        flag: Whether to record stages (default: True)
+    """
+    global _enabled  # pylint: disable=global-statement
+    _enabled = flag
+
+
+def is_enabled() -> bool:
+    """Return whether stages are being recorded."""
+    return _enabled
+
+
+def reset() -> None:
+    """Forget all recorded stages."""
+    _stats.clear()
+
+
+def record(name: str, wall: float, cpu: float) -> None:
+    """
+    Add one call to the statistics of a stage.
+
+    Args:
+        name: Stage name
+        wall: Wall-clock seconds spent
+        cpu: CPU seconds spent
+    """
+    entry = _stats.get(name)
+    if entry is None:
+        _stats[name] = [1, wall, cpu]
+    else:
+        entry[0] += 1
+        entry[1] += wall
+        entry[2] += cpu
+
+
+class _Stage:
+    """Context manager timing one execution of a stage."""
+
+    __slots__ = ("name", "wall", "cpu")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.wall = 0.0
+        self.cpu = 0.0
+
+    def __enter__(self) -> "_Stage":
+        self.wall = time.perf_counter()
+        self.cpu = time.process_time()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        record(
+            self.name,
+            time.perf_counter() - self.wall,
+            time.process_time() - self.cpu,
+        )
+
+
+def stage(name: str) -> AbstractContextManager[Any]:
+    """
+    Time a block of code as a named stage.
+
+    When recording is disabled a shared no-op context manager is
+    returned, so instrumented code pays almost nothing.
+
+    Args:
+        name: Stage name
+
+    Returns:
+        Context manager recording the block
+    """
+    if not _enabled:
+        return _NULL_STAGE
+    return _Stage(name)
+
+
+@overload
+def timed[**P, R](
+    func: Callable[P, R], *, name: str | None = None
+) -> Callable[P, R]: ...
+
+
+@overload
+def timed[**P, R](
+    func: None = None, *, name: str | None = None
+) -> Callable[[Callable[P, R]], Callable[P, R]]: ...
+
+
+def timed[**P, R](
+    func: Callable[P, R] | None = None, *, name: str | None = None
+) -> Callable[P, R] | Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Decorate a function to record its calls as a stage.
+
+    Can be used bare (``@timed``) or with a stage name
+    (``@timed(name="stage")``); the default name is the qualified name
+    of the function. The decorated function keeps its signature.
+
+    The wrapper costs an extra call even while recording is disabled,
+    so functions called once per value, such as the scalar validators,
+    are left undecorated; their batch and whole-text callers are timed
+    instead.
+
+    Args:
+        func: Function to decorate
+        name: Stage name (default: module.qualname of the function)
+
+    Returns:
+        The decorated function, or a decorator when func is None
+    """
+
+    def decorate(func: Callable[P, R]) -> Callable[P, R]:
+        key = name or f"{func.__module__}.{func.__qualname__}"
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not _enabled:
+                return func(*args, **kwargs)
+            wall = time.perf_counter()
+            cpu = time.process_time()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(
+                    key,
+                    time.perf_counter() - wall,
+                    time.process_time() - cpu,
+                )
+
+        return wrapper
+
+    if func is None:
+        return decorate
+    return decorate(func)
+
+
+def report() -> dict[str, dict[str, float]]:
+    """
+    Get the recorded statistics, slowest stages first.
+
+    Returns:
+        Per stage: number of calls and cumulative wall and CPU time in
+        milliseconds
+    """
+    ordered = sorted(_stats.items(), key=lambda item: -item[1][1])
+    return {
+        name: {
+            "calls": int(calls),
+            "wall_ms": round(wall * 1000, 3),
+            "cpu_ms": round(cpu * 1000, 3),
+        }
+        for name, (calls, wall, cpu) in ordered
+    }
+
+
+def format_report() -> str:
+    """
+    Format the recorded statistics as an aligned text table.
+
+    Returns:
+        Table with one line per stage
+    """
+    rows = report()
+    width = max((len(name) for name in rows), default=5)
+    lines = [
+        f"{'stage':<{width}}  {'calls':>8}  {'wall ms':>10}  {'cpu ms':>10}"
+    ]
+    for name, row in rows.items():
+        lines.append(
+            f"{name:<{width}}  {row['calls']:>8}  "
+            f"{row['wall_ms']:>10.3f}  {row['cpu_ms']:>10.3f}"
+        )
+    return "\n".join(lines)
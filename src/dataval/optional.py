@@ -0,0 +1,25 @@
+"""Helpers for optional third-party dependencies."""
+
+from types import ModuleType
+
+
+def require_numpy(feature: str) -> ModuleType:
+    """
+    Import NumPy, explaining how to install it if it is missing.
+
+    Args:
+        feature: Description of the feature that needs NumPy
+
+    Returns:
+        The numpy module
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    try:
+        import numpy  # pylint: disable=C0415
+    except ImportError as e:
+        raise ImportError(
+            f"{feature} requires NumPy: pip install demo-project[numpy]"
+        ) from e
+    return numpy
@@ -0,0 +1,184 @@
+"""Named validators with bounded result caches."""
+
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import lru_cache, wraps
+from typing import Any
+
+from dataval import analyzer
+
+Validator = Callable[[Any], bool]
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+def _memoize(func: Validator, maxsize: int) -> Validator:
+    """Wrap a validator in an LRU cache that tolerates unhashable values."""
+    # typed=True keeps 1, 1.0 and True apart
+    cached = lru_cache(maxsize=maxsize, typed=True)(func)
+
+    @wraps(func)
+    def validator(value: Any) -> bool:
+        try:
+            return cached(value)
+        except TypeError:
+            # Unhashable values such as lists bypass the cache
+            return func(value)
+
+    validator.cache_info = cached.cache_info  # type: ignore[attr-defined]
+    validator.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
+    return validator
+
+
+class ValidatorRegistry:
+    """
+    Validators looked up by name, each with an optional LRU result cache.
+
+    Datasets often repeat the same values (emails, domains, dates) many
+    times; caching per validator means each distinct value is only
+    checked once while it stays in the cache.
+    """
+
+    def __init__(
+        self,
+        validators: Mapping[str, Validator] | None = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        """
+        Initialize a registry.
+
+        Args:
+            validators: Validators to register, keyed by name
+            cache_size: Default number of results cached per validator
+                (0 disables caching)
+        """
+        self.cache_size = cache_size
+        self._validators: dict[str, Validator] = {}
+        for name, func in (validators or {}).items():
+            self.register(name, func)
+
+    def __contains__(self, name: object) -> bool:
+        """Check whether a validator name is registered."""
+        return name in self._validators
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the registered names."""
+        return iter(self._validators)
+
+    def __len__(self) -> int:
+        """Return the number of registered validators."""
+        return len(self._validators)
+
+    def register(
+        self, name: str, func: Validator, cache_size: int | None = None
+    ) -> Validator:
+        """
+        Register a validator under a name, replacing any previous one.
+
+        Args:
+            name: Validator name
+            func: Function returning True for valid values
+            cache_size: Number of cached results (default: the registry
+                default, 0 disables caching)
+
+        Returns:
+            The registered, possibly cached, validator
+        """
+        size = self.cache_size if cache_size is None else cache_size
+        validator = _memoize(func, size) if size > 0 else func
+        self._validators[name] = validator
+        return validator
+
+    def get(self, name: str) -> Validator:
+        """
+        Look up a validator.
+
+        Args:
+            name: Validator name
+
+        Returns:
+            The registered validator
+
+        Raises:
+            ValueError: If the name is not registered.
+        """
+        validator = self._validators.get(name)
+        if validator is None:
+            raise ValueError(
+                f"Unknown validator: {name} "
+                f"(expected one of {sorted(self._validators)})"
+            )
+        return validator
+
+    def resolve(self, validators: Iterable[str | Validator]) -> list[Validator]:
+        """
+        Replace validator names by the registered validators.
+
+        Args:
+            validators: Names and callables; callables are kept as is
+
+        Returns:
+            List of callables
+
+        Raises:
+            ValueError: If a name is not registered.
+        """
+        return [
+            self.get(v) if isinstance(v, str) else v for v in validators
+        ]
+
+    def validate(self, name: str, value: Any) -> bool:
+        """
+        Run a validator by name.
+
+        Args:
+            name: Validator name
+            value: Value to validate
+
+        Returns:
+            True if the value is valid
+
+        Raises:
+            ValueError: If the name is not registered.
+        """
+        return self.get(name)(value)
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """
+        Get the cache statistics of the cached validators.
+
+        Returns:
+            Per validator: cache hits, misses, current size and hit rate
+        """
+        stats = {}
+        for name, validator in self._validators.items():
+            cache_info = getattr(validator, "cache_info", None)
+            if cache_info is None:
+                continue
+            info = cache_info()
+            calls = info.hits + info.misses
+            stats[name] = {
+                "hits": info.hits,
+                "misses": info.misses,
+                "size": info.currsize,
+                "hit_rate": round(info.hits / calls, 4) if calls else 0.0,
+            }
+        return stats
+
+    def clear_caches(self) -> None:
+        """Empty the result caches and reset their statistics."""
+        for validator in self._validators.values():
+            cache_clear = getattr(validator, "cache_clear", None)
+            if cache_clear is not None:
+                cache_clear()
+
+
+# Registry of the built-in validators, shared by Field, the CLI, the
+# shell and the HTTP service
+REGISTRY = ValidatorRegistry(
+    {
+        "email": analyzer.is_email,
+        "url": analyzer.is_url,
+        "credit_card": analyzer.is_credit_card,
+        "date": analyzer.is_date,
+    }
+)
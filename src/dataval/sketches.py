@@ -0,0 +1,240 @@
+"""Bounded-memory frequency and cardinality sketches."""
+
+import hashlib
+import heapq
+import math
+from collections import Counter
+from collections.abc import Iterable, Mapping
+
+# Bias correction constants of HyperLogLog for small register counts
+_SMALL_ALPHA = {16: 0.673, 32: 0.697, 64: 0.709}
+
+
+def stable_hash64(item: str) -> int:
+    """
+    Hash a string to 64 bits, identically in every process.
+
+    The built-in hash() is randomized per interpreter, which would make
+    sketches built in different worker processes impossible to merge.
+
+    Args:
+        item: String to hash
+
+    Returns:
+        Unsigned 64-bit hash value
+    """
+    digest = hashlib.blake2b(item.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class SpaceSaving:
+    """
+    Space-Saving summary for approximate top-k counting.
+
+    At most ``capacity`` items are tracked. Every reported count
+    overestimates the true count by at most ``error(item)``, which is
+    itself at most N / capacity for a stream of N items. Every item whose
+    true count exceeds N / capacity is guaranteed to be tracked.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        """
+        Initialize an empty summary.
+
+        Args:
+            capacity: Maximum number of tracked items (default: 1000)
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        self.capacity = capacity
+        self.total = 0
+        self.counts: dict[str, int] = {}
+        self.errors: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of tracked items."""
+        return len(self.counts)
+
+    @property
+    def floor(self) -> int:
+        """Upper bound on the count of any untracked item."""
+        if len(self.counts) < self.capacity:
+            return 0
+        return min(self.counts.values())
+
+    def add(self, item: str, count: int = 1) -> None:
+        """
+        Add occurrences of a single item.
+
+        Prefer update() for many items; it merges a whole batch at once.
+
+        Args:
+            item: Item to count
+            count: Number of occurrences (default: 1)
+        """
+        self.update_counts({item: count})
+
+    def update(self, items: Iterable[str]) -> None:
+        """
+        Add a batch of items.
+
+        Args:
+            items: Items to count
+        """
+        self.update_counts(Counter(items))
+
+    def update_counts(self, counts: Mapping[str, int]) -> None:
+        """
+        Add exact counts for a batch of items.
+
+        Args:
+            counts: Mapping of items to their number of occurrences
+        """
+        self._combine(counts, {}, sum(counts.values()), 0)
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        """
+        Merge another summary into this one.
+
+        Args:
+            other: Summary to merge
+
+        Returns:
+            This object, for chaining
+        """
+        self._combine(other.counts, other.errors, other.total, other.floor)
+        return self
+
+    def _combine(
+        self,
+        counts: Mapping[str, int],
+        errors: Mapping[str, int],
+        total: int,
+        floor: int,
+    ) -> None:
+        own_floor = self.floor
+        # Build the union in insertion order so ties resolve deterministically
+        merged = {
+            item: count + counts.get(item, floor)
+            for item, count in self.counts.items()
+        }
+        for item, count in counts.items():
+            if item not in merged:
+                merged[item] = own_floor + count
+        keep = heapq.nlargest(self.capacity, merged, key=merged.__getitem__)
+        self.errors = {
+            item: self.errors.get(item, own_floor) + errors.get(item, floor)
+            for item in keep
+        }
+        self.counts = {item: merged[item] for item in keep}
+        self.total += total
+
+    def error(self, item: str) -> int:
+        """
+        Get the maximum overestimation of an item's count.
+
+        Args:
+            item: Tracked or untracked item
+
+        Returns:
+            Maximum difference between the estimated and the true count
+        """
+        return self.errors.get(item, self.floor)
+
+    def top(self, n: int = 10) -> list[tuple[str, int]]:
+        """
+        Get the N items with the highest estimated counts.
+
+        Args:
+            n: Number of items to return (default: 10)
+
+        Returns:
+            List of (item, estimated count) tuples
+        """
+        return heapq.nlargest(n, self.counts.items(), key=lambda x: x[1])
+
+
+class HyperLogLog:
+    """
+    HyperLogLog estimator for the number of distinct items.
+
+    Uses 2 ** precision one-byte registers. The relative standard error
+    of the estimate is about 1.04 / sqrt(2 ** precision), i.e. 0.81% for
+    the default precision of 14 (16 KiB of registers).
+    """
+
+    def __init__(self, precision: int = 14):
+        """
+        Initialize an empty estimator.
+
+        Args:
+            precision: Number of index bits, between 4 and 18 (default: 14)
+
+        Raises:
+            ValueError: If precision is out of range.
+        """
+        if not 4 <= precision <= 18:
+            raise ValueError("Precision must be between 4 and 18")
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, item: str) -> None:
+        """
+        Add an item.
+
+        Args:
+            item: Item to add
+        """
+        value = stable_hash64(item)
+        index = value >> (64 - self.precision)
+        remainder = value & ((1 << (64 - self.precision)) - 1)
+        rank = 64 - self.precision - remainder.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, items: Iterable[str]) -> None:
+        """
+        Add a batch of items, hashing each distinct item once.
+
+        Args:
+            items: Items to add
+        """
+        for item in set(items):
+            self.add(item)
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """
+        Merge another estimator into this one.
+
+        Args:
+            other: Estimator with the same precision
+
+        Returns:
+            This object, for chaining
+
+        Raises:
+            ValueError: If the precisions differ.
+        """
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge sketches of different precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+    def count(self) -> int:
+        """
+        Estimate the number of distinct items added.
+
+        Returns:
+            Estimated distinct count
+        """
+        m = len(self.registers)
+        alpha = _SMALL_ALPHA.get(m) or 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0**-r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # Small-range correction: fall back to linear counting
+            estimate = m * math.log(m / zeros)
+        return round(estimate)
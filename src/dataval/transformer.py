@@ -2,9 +2,21 @@
 
 import json
 import re
-from datetime import datetime
+from collections.abc import Callable, Iterator
+from functools import lru_cache
 from typing import Any
 
+from dataval.dates import compile_format
+from dataval.instrument import timed
+
+_NON_ALNUM_RUNS = re.compile(r"[^a-zA-Z0-9]+")
+_NON_ALNUM = re.compile(r"[^a-zA-Z0-9]")
+_CASE_BOUNDARY = re.compile(r"([a-z0-9])([A-Z])")
+_UNDERSCORES = re.compile(r"_+")
+
+# Number of converted keys remembered per style by convert_keys()
+KEY_CACHE_SIZE = 4096
+
 
 def to_snake_case(text: str) -> str:
     """
@@ -17,16 +29,16 @@ def to_snake_case(text: str) -> str:
         snake_case string
     """
     # Replace non-alphanumeric characters with underscores
-    result = re.sub(r"[^a-zA-Z0-9]+", "_", text)
+    result = _NON_ALNUM_RUNS.sub("_", text)
 
     # Add underscore at the transition from lowercase to uppercase
-    result = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", result)
+    result = _CASE_BOUNDARY.sub(r"\1_\2", result)
 
     # Convert to lowercase and clean up
     result = result.lower().strip("_")
 
     # Remove duplicate underscores
-    result = re.sub(r"_+", "_", result)
+    result = _UNDERSCORES.sub("_", result)
 
     return result
 
@@ -42,7 +54,7 @@ def to_camel_case(text: str) -> str:
         camelCase string
     """
     # Replace any non-alphanumeric character with space
-    s1 = re.sub(r"[^a-zA-Z0-9]", " ", text)
+    s1 = _NON_ALNUM.sub(" ", text)
     # Split, capitalize each word except first, and join
     words = s1.split()
     if not words:
@@ -64,6 +76,89 @@ def to_title_case(text: str) -> str:
     return " ".join(word.capitalize() for word in text.split())
 
 
+# Key conversions memoized per style
+_KEY_STYLES: dict[str, Callable[[str], str]] = {
+    name: lru_cache(maxsize=KEY_CACHE_SIZE)(func)
+    for name, func in (
+        ("snake", to_snake_case),
+        ("camel", to_camel_case),
+        ("title", to_title_case),
+    )
+}
+
+
+@timed
+def convert_keys(obj: Any, style: str = "snake") -> Any:
+    """
+    Convert the keys of nested dictionaries to another case.
+
+    Dictionaries and lists are walked iteratively, so nesting depth is
+    not limited by the recursion limit, and copied into new containers;
+    other values, including non-string keys, are kept as they are.
+    Converted keys are memoized in a bounded cache per style, since
+    payloads usually repeat the same keys. Keys that convert to the same
+    string collide, the last one winning.
+
+    Args:
+        obj: Dictionary, list or scalar value
+        style: "snake", "camel" or "title"
+
+    Returns:
+        Copy of obj with converted keys
+
+    Raises:
+        ValueError: If the style is unknown or obj contains itself.
+    """
+    convert = _KEY_STYLES.get(style)
+    if convert is None:
+        raise ValueError(
+            f"Unknown key style: {style} "
+            f"(expected one of {sorted(_KEY_STYLES)})"
+        )
+    if not isinstance(obj, (dict, list)):
+        return obj
+
+    root: Any = {} if isinstance(obj, dict) else []
+    # Containers on the current path, with their unvisited entries
+    stack = [(obj, root, _entries(obj))]
+    path = {id(obj)}
+    while stack:
+        source, target, entries = stack[-1]
+        child: Any = None
+        if isinstance(target, dict):
+            for key, value in entries:
+                if isinstance(value, (dict, list)):
+                    child = {} if isinstance(value, dict) else []
+                target[convert(key) if isinstance(key, str) else key] = (
+                    value if child is None else child
+                )
+                if child is not None:
+                    break
+        else:
+            append = target.append
+            for value in entries:
+                if isinstance(value, (dict, list)):
+                    child = {} if isinstance(value, dict) else []
+                    append(child)
+                    break
+                append(value)
+        if child is None:
+            stack.pop()
+            path.discard(id(source))
+        elif id(value) in path:
+            raise ValueError("Cannot convert keys of a cyclic value")
+        else:
+            stack.append((value, child, _entries(value)))
+            path.add(id(value))
+    return root
+
+
+def _entries(container: dict[Any, Any] | list[Any]) -> Iterator[Any]:
+    if isinstance(container, dict):
+        return iter(container.items())
+    return iter(container)
+
+
 def format_date(
     date_str: str,
     input_format: str = "%Y-%m-%d",
@@ -79,11 +174,14 @@ def format_date(
 
     Returns:
         Formatted date string
+
+    Raises:
+        ValueError: If date_str does not match input_format.
     """
-    date_obj = datetime.strptime(date_str, input_format)
-    return date_obj.strftime(output_format)
+    return compile_format(input_format).reformat(date_str, output_format)
 
 
+@timed
 def dict_to_json(data: dict[str, Any], pretty: bool = False) -> str:
     """
     Convert dictionary to JSON string.
@@ -0,0 +1,697 @@
+"""Streaming dataset profiles and schema inference from sampled records."""
+
+import csv
+import json
+import os
+import random
+import re
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent import futures
+from itertools import chain, islice
+from pathlib import Path
+from typing import Any
+
+from dataval.instrument import timed
+from dataval.registry import REGISTRY, ValidatorRegistry
+from dataval.sketches import HyperLogLog, SpaceSaving
+from dataval.validation.summarizer import Field, Schema
+
+DEFAULT_SAMPLE_SIZE = 1000
+# Registered validators tried on string fields
+INFERRED_VALIDATORS = ("email", "url", "date", "credit_card")
+NDJSON_SUFFIXES = (".ndjson", ".jsonl", ".json")
+
+# Records buffered before they are added to the field profiles
+_BATCH = 4096
+# Rows read ahead to choose the type of each CSV column
+_CSV_LOOKAHEAD = 1000
+# Smallest byte range of an NDJSON file given to a worker process
+_MIN_SPLIT = 1 << 20
+_TYPES: dict[str, type] = {
+    t.__name__: t for t in (str, int, float, bool, list, dict)
+}
+# Digit strings with a leading zero (ZIP codes, identifiers) or more
+# digits than a double holds exactly (card numbers) are codes, not ints
+_INTEGER = re.compile(r"[+-]?(?:0|[1-9]\d{0,14})")
+_DIGITS = re.compile(r"[+-]?\d+")
+_FLOAT = re.compile(r"[+-]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?")
+
+
+class Reservoir:
+    """Uniform random sample of fixed size from a stream (Algorithm R)."""
+
+    def __init__(
+        self, size: int = DEFAULT_SAMPLE_SIZE, seed: int | None = None
+    ):
+        """
+        Initialize an empty sample.
+
+        Args:
+            size: Maximum number of sampled items
+            seed: Seed of the random generator (default: random)
+
+        Raises:
+            ValueError: If size is not positive.
+        """
+        if size <= 0:
+            raise ValueError("Sample size must be positive")
+        self.size = size
+        self.seen = 0
+        self.items: list[Any] = []
+        self._random = random.Random(seed)
+
+    def add(self, item: Any) -> None:
+        """
+        Offer an item to the sample.
+
+        Args:
+            item: Item from the stream
+        """
+        self.seen += 1
+        if len(self.items) < self.size:
+            self.items.append(item)
+            return
+        index = self._random.randrange(self.seen)
+        if index < self.size:
+            self.items[index] = item
+
+    def merge(self, other: "Reservoir") -> "Reservoir":
+        """
+        Merge the sample of another part of the stream.
+
+        Items are drawn from either sample in proportion to the number of
+        stream items it still stands for, so the result is a uniform
+        sample of both parts.
+
+        Args:
+            other: Sample of a disjoint part of the stream
+
+        Returns:
+            This object, for chaining
+        """
+        mine, theirs = self.items[:], other.items[:]
+        self._random.shuffle(mine)
+        self._random.shuffle(theirs)
+        left_mine, left_theirs = self.seen, other.seen
+        merged: list[Any] = []
+        while len(merged) < self.size and left_mine + left_theirs:
+            if self._random.randrange(left_mine + left_theirs) < left_mine:
+                merged.append(mine.pop())
+                left_mine -= 1
+            else:
+                merged.append(theirs.pop())
+                left_theirs -= 1
+        self.items = merged
+        self.seen += other.seen
+        return self
+
+
+class FieldProfile:
+    """
+    Bounded-memory statistics of the values of one field.
+
+    Counts are exact; distinct values are estimated with HyperLogLog and
+    the most common values with a Space-Saving summary.
+    """
+
+    def __init__(self, top_capacity: int = 64, precision: int = 12):
+        """
+        Initialize an empty profile.
+
+        Args:
+            top_capacity: Number of values tracked for the top values
+            precision: HyperLogLog precision of the distinct count
+        """
+        self.count = 0
+        self.nulls = 0
+        self.types: Counter[str] = Counter()
+        self.minimum: Any = None
+        self.maximum: Any = None
+        self.distinct = HyperLogLog(precision)
+        self.top = SpaceSaving(top_capacity)
+
+    @property
+    def null_rate(self) -> float:
+        """Fraction of records where the field is missing or None."""
+        total = self.count + self.nulls
+        return self.nulls / total if total else 0.0
+
+    def update(self, values: list[Any]) -> None:
+        """
+        Add a batch of values of the field (None where it is missing).
+
+        Args:
+            values: Field values
+        """
+        present = [value for value in values if value is not None]
+        self.nulls += len(values) - len(present)
+        if not present:
+            return
+        self.count += len(present)
+        for kind, count in Counter(map(type, present)).items():
+            self.types[kind.__name__] += count
+        try:
+            self._bound(min(present))
+            self._bound(max(present))
+        except TypeError:
+            for value in present:
+                self._bound(value)
+        keys = [v if type(v) is str else repr(v) for v in present]
+        self.distinct.update(keys)
+        self.top.update(keys)
+
+    def merge(self, other: "FieldProfile") -> "FieldProfile":
+        """
+        Merge the profile of the same field from another part of the data.
+
+        Args:
+            other: Profile to merge
+
+        Returns:
+            This object, for chaining
+        """
+        self.count += other.count
+        self.nulls += other.nulls
+        self.types.update(other.types)
+        for value in (other.minimum, other.maximum):
+            if value is not None:
+                self._bound(value)
+        self.distinct.merge(other.distinct)
+        self.top.merge(other.top)
+        return self
+
+    def _bound(self, value: Any) -> None:
+        """Widen the bounds to include a value."""
+        try:
+            if self.minimum is None or value < self.minimum:
+                self.minimum = value
+            if self.maximum is None or value > self.maximum:
+                self.maximum = value
+        except TypeError:
+            # Values of mixed, unorderable types keep the first bounds
+            pass
+
+    def field_type(self) -> type:
+        """
+        Get the Python type of the non-null values.
+
+        Ints and floats mix into float, as in CSV columns.
+
+        Returns:
+            The type shared by all values, or object if they differ or
+            all values are null
+        """
+        if self.types.keys() == {"int", "float"}:
+            return float
+        if len(self.types) != 1:
+            return object
+        return _TYPES.get(next(iter(self.types)), object)
+
+    def to_dict(self, top: int = 10) -> dict[str, Any]:
+        """
+        Describe the profile as JSON-serializable data.
+
+        Args:
+            top: Number of top values to include
+
+        Returns:
+            Counts, null rate, types, distinct estimate, bounds and top
+            values
+        """
+        return {
+            "count": self.count,
+            "nulls": self.nulls,
+            "null_rate": round(self.null_rate, 4),
+            "types": dict(self.types),
+            "distinct": self.distinct.count(),
+            "min": _jsonable(self.minimum),
+            "max": _jsonable(self.maximum),
+            "top": self.top.top(top),
+        }
+
+
+def _jsonable(value: Any) -> Any:
+    """Keep JSON values as they are and describe others with repr()."""
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return repr(value)
+
+
+class DatasetProfile:
+    """
+    Single-pass profile of a stream of records.
+
+    Keeps a FieldProfile per field and a reservoir sample of the records,
+    so memory stays bounded however many records are added. Profiles of
+    disjoint parts of a dataset can be merged, which is how files are
+    profiled in parallel.
+    """
+
+    def __init__(
+        self,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+        seed: int | None = None,
+        top_capacity: int = 64,
+    ):
+        """
+        Initialize an empty profile.
+
+        Args:
+            sample_size: Number of records kept for validator inference
+            seed: Seed of the sampling random generator (default: random)
+            top_capacity: Number of values tracked per field for the top
+                values
+        """
+        self.records = 0
+        self.fields: dict[str, FieldProfile] = {}
+        self.sample = Reservoir(sample_size, seed)
+        self.top_capacity = top_capacity
+        self._pending: list[Mapping[str, Any]] = []
+
+    def _field(self, name: str, missing: int) -> FieldProfile:
+        """Start profiling a field missing from the first records."""
+        profile = FieldProfile(self.top_capacity)
+        profile.nulls = missing
+        self.fields[name] = profile
+        return profile
+
+    def add(self, record: Mapping[str, Any]) -> None:
+        """
+        Add one record.
+
+        Records are buffered and added to the field profiles in batches,
+        one column at a time; flush() adds the buffered records.
+
+        Args:
+            record: Mapping of field names to values
+        """
+        self.records += 1
+        self.sample.add(record)
+        self._pending.append(record)
+        if len(self._pending) >= _BATCH:
+            self.flush()
+
+    def update(self, records: Iterable[Mapping[str, Any]]) -> None:
+        """
+        Add many records and flush them.
+
+        Args:
+            records: Mappings of field names to values
+        """
+        for record in records:
+            self.add(record)
+        self.flush()
+
+    def flush(self) -> None:
+        """Add the buffered records to the field profiles."""
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        earlier = self.records - len(batch)
+        for name in dict.fromkeys(name for record in batch for name in record):
+            if name not in self.fields:
+                self._field(name, earlier)
+        for name, profile in self.fields.items():
+            profile.update([record.get(name) for record in batch])
+
+    def merge(self, other: "DatasetProfile") -> "DatasetProfile":
+        """
+        Merge the profile of a disjoint part of the same dataset.
+
+        Args:
+            other: Profile to merge
+
+        Returns:
+            This object, for chaining
+        """
+        self.flush()
+        other.flush()
+        for name, profile in other.fields.items():
+            if name not in self.fields:
+                self._field(name, self.records)
+            self.fields[name].merge(profile)
+        for name, profile in self.fields.items():
+            if name not in other.fields:
+                profile.nulls += other.records
+        self.records += other.records
+        self.sample.merge(other.sample)
+        return self
+
+    def field_specs(
+        self,
+        validators: Iterable[str] = INFERRED_VALIDATORS,
+        registry: ValidatorRegistry | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Infer a description of each field.
+
+        A field is required if no record misses it. A validator is kept
+        for a string field if every sampled value of the field passes it.
+
+        Args:
+            validators: Names of the registered validators to try
+            registry: Registry of the validators (default: built-in)
+
+        Returns:
+            Per field: type name, required flag and validator names, in
+            the format accepted by the HTTP service's /schema/validate
+        """
+        self.flush()
+        registry = registry or REGISTRY
+        checks = [(name, registry.get(name)) for name in validators]
+        specs = {}
+        for name, profile in self.fields.items():
+            field_type = profile.field_type()
+            matched = []
+            if field_type is str:
+                values = [
+                    value
+                    for record in self.sample.items
+                    if isinstance(value := record.get(name), str)
+                ]
+                if values:
+                    matched = [
+                        check_name
+                        for check_name, check in checks
+                        if all(map(check, values))
+                    ]
+            specs[name] = {
+                "type": field_type.__name__,
+                "required": self.records > 0 and profile.nulls == 0,
+                "validators": matched,
+            }
+        return specs
+
+    def infer_schema(
+        self,
+        validators: Iterable[str] = INFERRED_VALIDATORS,
+        registry: ValidatorRegistry | None = None,
+    ) -> Schema:
+        """
+        Build a Schema from the inferred field descriptions.
+
+        Args:
+            validators: Names of the registered validators to try
+            registry: Registry of the validators (default: built-in)
+
+        Returns:
+            Schema with one Field per field seen
+        """
+        registry = registry or REGISTRY
+        return Schema(
+            {
+                name: Field(
+                    _TYPES.get(spec["type"], object),
+                    required=spec["required"],
+                    validators=spec["validators"],
+                    registry=registry,
+                )
+                for name, spec in self.field_specs(
+                    validators, registry
+                ).items()
+            }
+        )
+
+    def to_dict(self, top: int = 10) -> dict[str, Any]:
+        """
+        Describe the profile and inferred schema as JSON-serializable data.
+
+        Args:
+            top: Number of top values per field
+
+        Returns:
+            Record count, per-field profiles and field descriptions
+        """
+        self.flush()
+        return {
+            "records": self.records,
+            "fields": {
+                name: profile.to_dict(top)
+                for name, profile in self.fields.items()
+            },
+            "schema": self.field_specs(),
+        }
+
+
+def convert_cell(text: str) -> Any:
+    """
+    Convert a CSV cell to the Python value it most likely holds.
+
+    Digit strings with a leading zero or more than 15 digits, such as
+    ZIP codes and card numbers, are kept as text.
+
+    Args:
+        text: Cell text
+
+    Returns:
+        None for an empty cell, an int, float or bool when the text is
+        one, otherwise the text itself
+    """
+    if not text:
+        return None
+    if _INTEGER.fullmatch(text):
+        return int(text)
+    if _DIGITS.fullmatch(text):
+        return text
+    if _FLOAT.fullmatch(text):
+        return float(text)
+    lowered = text.lower()
+    if lowered in ("true", "false"):
+        return lowered == "true"
+    return text
+
+
+def _text_cell(text: str) -> str | None:
+    return text or None
+
+
+def _float_cell(text: str) -> Any:
+    value = convert_cell(text)
+    return float(value) if type(value) is int else value
+
+
+def _column_converter(cells: Iterable[str]) -> Callable[[str], Any]:
+    """Choose how to convert a CSV column from its first cells."""
+    kinds = {type(convert_cell(text)) for text in cells if text}
+    if float in kinds and kinds <= {int, float}:
+        return _float_cell
+    if len(kinds) <= 1 and str not in kinds:
+        return convert_cell
+    return _text_cell
+
+
+def read_csv(path: str | Path) -> Iterator[dict[str, Any]]:
+    """
+    Read the records of a CSV file with a header row.
+
+    The type of each column is chosen from its first cells: a column
+    holding any text, such as ZIP codes with and without a leading
+    zero, is read as text throughout, and a column mixing ints and
+    floats as floats. Cells past the end of the header are ignored and
+    missing cells are read as nulls.
+
+    Args:
+        path: Path of the file
+
+    Yields:
+        Records with cells converted to the type of their column
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        head = list(islice(reader, _CSV_LOOKAHEAD))
+        converters = {
+            name: _column_converter(row[name] for row in head)
+            for name in reader.fieldnames or ()
+        }
+        for row in chain(head, reader):
+            yield {
+                name: converters.get(name, convert_cell)(text)
+                for name, text in row.items()
+                if name is not None
+            }
+
+
+def _parse_line(line: str | bytes, where: str) -> dict[str, Any]:
+    """Parse an NDJSON line; where locates it in error messages."""
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        raise ValueError(f"{where}: {e}") from e
+    if not isinstance(record, dict):
+        raise ValueError(f"{where}: expected a JSON object")
+    return record
+
+
+def read_ndjson(path: str | Path) -> Iterator[dict[str, Any]]:
+    """
+    Read the records of an NDJSON file, skipping blank lines.
+
+    Args:
+        path: Path of the file
+
+    Yields:
+        Records
+
+    Raises:
+        ValueError: If a line does not hold a JSON object.
+    """
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            if line.strip():
+                yield _parse_line(line, f"Line {number}")
+
+
+def read_records(path: str | Path) -> Iterator[dict[str, Any]]:
+    """
+    Read the records of a CSV or NDJSON file, chosen by file suffix.
+
+    Args:
+        path: Path of a .csv, .ndjson, .jsonl or .json file
+
+    Returns:
+        Iterator over the records
+
+    Raises:
+        ValueError: If the suffix is not supported.
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix == ".csv":
+        return read_csv(path)
+    if suffix in NDJSON_SUFFIXES:
+        return read_ndjson(path)
+    raise ValueError(f"Unsupported file type: {path}")
+
+
+def profile_ndjson_range(
+    path: str | Path,
+    start: int,
+    end: int,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    seed: int | None = None,
+    top_capacity: int = 64,
+) -> DatasetProfile:
+    """
+    Profile the NDJSON lines starting within a byte range of a file.
+
+    Args:
+        path: Path of the file
+        start: First byte of the range
+        end: Byte just past the range
+        sample_size: Number of records kept for validator inference
+        seed: Seed of the sampling random generator (default: random)
+        top_capacity: Number of values tracked per field for top values
+
+    Returns:
+        Profile of the range
+
+    Raises:
+        ValueError: If a line does not hold a JSON object.
+    """
+    profile = DatasetProfile(sample_size, seed, top_capacity)
+    with open(path, "rb") as f:
+        if start:
+            # Skip to the first line starting at or after start
+            f.seek(start - 1)
+            f.readline()
+        position = f.tell()
+        while position < end:
+            line = f.readline()
+            if not line:
+                break
+            if line.strip():
+                profile.add(_parse_line(line, f"Byte {position}"))
+            position += len(line)
+    profile.flush()
+    return profile
+
+
+@timed
+def profile_file(
+    path: str | Path,
+    jobs: int | None = 1,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    seed: int | None = None,
+    top_capacity: int = 64,
+) -> DatasetProfile:
+    """
+    Profile a CSV or NDJSON file in a single pass.
+
+    NDJSON files can be split into byte ranges profiled by a process
+    pool, whose partial profiles are merged. CSV files are always read
+    by one process, since quoted cells may span lines.
+
+    Args:
+        path: Path of the file
+        jobs: Number of worker processes for NDJSON files (default: 1,
+            None for the CPU count)
+        sample_size: Number of records kept for validator inference
+        seed: Seed of the sampling random generator (default: random)
+        top_capacity: Number of values tracked per field for top values
+
+    Returns:
+        Profile of the file
+
+    Raises:
+        ValueError: If the file type is not supported or a record is
+            malformed.
+    """
+    # Also rejects unsupported file types before any work is done
+    records = read_records(path)
+    size = os.path.getsize(path)
+    workers = min(jobs or os.cpu_count() or 1, max(1, size // _MIN_SPLIT))
+    if Path(path).suffix.lower() == ".csv" or workers <= 1:
+        profile = DatasetProfile(sample_size, seed, top_capacity)
+        profile.update(records)
+        return profile
+
+    bounds = [size * i // workers for i in range(workers + 1)]
+    seeds = [None if seed is None else seed + i for i in range(workers)]
+    profile = DatasetProfile(sample_size, seed, top_capacity)
+    # Accessing futures.ProcessPoolExecutor imports multiprocessing, so
+    # the cost is only paid when a pool is actually needed
+    with futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        for part in executor.map(
+            profile_ndjson_range,
+            [path] * workers,
+            bounds[:-1],
+            bounds[1:],
+            [sample_size] * workers,
+            seeds,
+            [top_capacity] * workers,
+        ):
+            profile.merge(part)
+    return profile
+
+
+def infer_schema(
+    source: str | Path | Iterable[Mapping[str, Any]],
+    jobs: int | None = 1,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    validators: Iterable[str] = INFERRED_VALIDATORS,
+    seed: int | None = None,
+) -> Schema:
+    """
+    Infer a Schema from a CSV/NDJSON file or an iterable of records.
+
+    Args:
+        source: File path, or records as mappings
+        jobs: Number of worker processes for NDJSON files (default: 1)
+        sample_size: Number of records kept for validator inference
+        validators: Names of the registered validators to try
+        seed: Seed of the sampling random generator (default: random)
+
+    Returns:
+        The inferred schema
+
+    Raises:
+        ValueError: If the file type is not supported or a record is
+            malformed.
+    """
+    profile: DatasetProfile
+    if isinstance(source, (str, Path)):
+        profile = profile_file(source, jobs, sample_size, seed)
+    else:
+        profile = DatasetProfile(sample_size, seed)
+        profile.update(source)
+    return profile.infer_schema(validators)
@@ -3,6 +3,9 @@
 from collections.abc import Callable
 from typing import Any
 
+from dataval.instrument import timed
+from dataval.registry import REGISTRY, ValidatorRegistry
+
 
 class Field:
     """Field definition for schema validation."""
@@ -11,8 +14,9 @@ class Field:
         self,
         field_type: type,
         required: bool = True,
-        validators: list[Callable[[Any], bool]] | None = None,
+        validators: list[Callable[[Any], bool] | str] | None = None,
         default: Any = None,
+        registry: ValidatorRegistry | None = None,
     ):
         """
         Initialize a field validator.
@@ -20,12 +24,18 @@ class Field:
         Args:
             field_type: Expected Python type for the field
             required: Whether the field is required (default: True)
-            validators: List of validator functions (default: None)
+            validators: List of validator functions or names of
+                registered validators (default: None)
             default: Default value if field is missing (default: None)
+            registry: Registry resolving validator names (default: the
+                built-in registry)
+
+        Raises:
+            ValueError: If a validator name is not registered.
         """
         self.field_type = field_type
         self.required = required
-        self.validators = validators or []
+        self.validators = (registry or REGISTRY).resolve(validators or [])
         self.default = default
 
     def validate(self, value: Any) -> list[str]:
@@ -46,8 +56,10 @@ class Field:
                 errors.append("Field is required")
             return errors
 
-        # Type check
-        if not isinstance(value, self.field_type):
+        # Type check; an int is accepted where a float is expected
+        if not isinstance(value, self.field_type) and not (
+            self.field_type is float and type(value) is int
+        ):
             errors.append(
                 f"Expected type {self.field_type.__name__}\
                     , got {type(value).__name__}"
@@ -80,6 +92,7 @@ class Schema:
         """
         self.fields = fields
 
+    @timed
     def validate(self, data: dict[str, Any]) -> dict[str, list[str]]:
         """
         Validate data against schema.
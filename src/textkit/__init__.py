@@ -1,3 +1,88 @@
 """Text utilities CLI package."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
+
+# Public names and the submodules defining them. Submodules are only
+# imported on first access (PEP 562), so "import textkit" stays cheap.
+_EXPORTS = {
+    "Document": "textkit.document",
+    "as_document": "textkit.document",
+    "word_frequency": "textkit.validators",
+    "get_top_words": "textkit.validators",
+    "average_word_length": "textkit.validators",
+    "sentence_count": "textkit.validators",
+    "slugify": "textkit.transformers",
+    "truncate": "textkit.transformers",
+    "replace_all": "textkit.transformers",
+    "extract_emails": "textkit.transformers",
+    "Replacer": "textkit.transformers",
+    "sentence_spans": "textkit.segment",
+    "TextStats": "textkit.streaming",
+    "analyze_stream": "textkit.streaming",
+    "analyze_corpus": "textkit.corpus",
+    "EntityScanner": "textkit.entities",
+    "Redactor": "textkit.redact",
+    "AnalysisCache": "textkit.cache",
+}
+
+__all__ = [
+    "__version__",
+    "Document",
+    "as_document",
+    "word_frequency",
+    "get_top_words",
+    "average_word_length",
+    "sentence_count",
+    "slugify",
+    "truncate",
+    "replace_all",
+    "extract_emails",
+    "Replacer",
+    "sentence_spans",
+    "TextStats",
+    "analyze_stream",
+    "analyze_corpus",
+    "EntityScanner",
+    "Redactor",
+    "AnalysisCache",
+]
+
+if TYPE_CHECKING:
+    from textkit.cache import AnalysisCache
+    from textkit.corpus import analyze_corpus
+    from textkit.document import Document, as_document
+    from textkit.entities import EntityScanner
+    from textkit.redact import Redactor
+    from textkit.segment import sentence_spans
+    from textkit.streaming import TextStats, analyze_stream
+    from textkit.transformers import (
+        Replacer,
+        extract_emails,
+        replace_all,
+        slugify,
+        truncate,
+    )
+    from textkit.validators import (
+        average_word_length,
+        get_top_words,
+        sentence_count,
+        word_frequency,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names from their submodule on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes, including lazy exports."""
+    return sorted({*globals(), *_EXPORTS})
@@ -0,0 +1,265 @@
+"""Extractive summarization with vectorized TF-IDF sentence scoring."""
+
+from collections import Counter
+from typing import TYPE_CHECKING, Any
+
+from dataval.optional import require_numpy
+from textkit.document import Document, as_document
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+METHODS = ("tfidf", "textrank")
+
+
+def _numpy() -> Any:
+    return require_numpy("Extractive summarization")
+
+
+class SentenceMatrix:
+    """
+    Sparse, L2-normalized TF-IDF matrix of sentences by terms (CSR).
+
+    Row i holds the terms of sentence i: its column ids are
+    ``indices[indptr[i]:indptr[i + 1]]`` with weights taken from the same
+    slice of ``data``.
+    """
+
+    def __init__(self, sentences: list[str]):
+        """
+        Build the matrix for a list of sentences.
+
+        Args:
+            sentences: Sentences to vectorize
+        """
+        np = _numpy()
+        vocabulary: dict[str, int] = {}
+        indptr = [0]
+        indices: list[int] = []
+        counts: list[int] = []
+        for sentence in sentences:
+            for term, count in Counter(Document(sentence).terms).items():
+                indices.append(vocabulary.setdefault(term, len(vocabulary)))
+                counts.append(count)
+            indptr.append(len(indices))
+
+        self.shape = (len(sentences), len(vocabulary))
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.rows = np.repeat(
+            np.arange(len(sentences)), np.diff(self.indptr)
+        )
+
+        n, v = self.shape
+        df = np.bincount(self.indices, minlength=v)
+        idf = np.log((1 + n) / (1 + df)) + 1.0
+        data = np.asarray(counts, dtype=np.float64) * idf[self.indices]
+        norms = np.sqrt(np.bincount(self.rows, weights=data**2, minlength=n))
+        norms[norms == 0] = 1.0
+        self.data = data / norms[self.rows]
+
+    def project(self, dims: int, seed: int = 0) -> "np.ndarray":
+        """
+        Randomly project the rows to a dense, L2-normalized sketch.
+
+        Cosine similarities between sketch rows approximate the cosine
+        similarities of the sparse rows (Johnson-Lindenstrauss).
+
+        Args:
+            dims: Number of dimensions of the sketch
+            seed: Random seed for the projection
+
+        Returns:
+            Array of shape (sentences, dims)
+        """
+        np = _numpy()
+        n, v = self.shape
+        rng = np.random.default_rng(seed)
+        projection = rng.standard_normal((v, dims))
+        sketch = np.zeros((n, dims))
+        # Accumulate in slices to bound the (nnz, dims) temporary
+        step = 1 << 16
+        for start in range(0, len(self.data), step):
+            stop = start + step
+            np.add.at(
+                sketch,
+                self.rows[start:stop],
+                self.data[start:stop, None]
+                * projection[self.indices[start:stop]],
+            )
+        norms = np.linalg.norm(sketch, axis=1)
+        norms[norms == 0] = 1.0
+        normalized: NDArray[Any] = sketch / norms[:, None]
+        return normalized
+
+
+def centroid_scores(matrix: SentenceMatrix) -> "np.ndarray":
+    """
+    Score sentences by cosine similarity to the document centroid.
+
+    Runs in time linear in the number of matrix entries.
+
+    Args:
+        matrix: Sentence-term matrix
+
+    Returns:
+        Score per sentence
+    """
+    np = _numpy()
+    n, v = matrix.shape
+    centroid = np.bincount(matrix.indices, weights=matrix.data, minlength=v)
+    scores: NDArray[Any] = np.bincount(
+        matrix.rows,
+        weights=matrix.data * centroid[matrix.indices],
+        minlength=n,
+    )
+    return scores
+
+
+def textrank_scores(
+    matrix: SentenceMatrix,
+    dims: int = 64,
+    neighbors: int = 8,
+    rounds: int = 4,
+    damping: float = 0.85,
+    iterations: int = 50,
+    seed: int = 0,
+) -> "np.ndarray":
+    """
+    Score sentences with TextRank over an approximate neighbor graph.
+
+    Instead of comparing every pair of sentences, the rows are projected
+    to a dense sketch, sorted along a few random directions, and each
+    sentence is only compared to its ``neighbors`` closest sentences in
+    each ordering. This keeps the graph at O(n * neighbors * rounds)
+    edges, and the cost near O(n log n).
+
+    Args:
+        matrix: Sentence-term matrix
+        dims: Dimensions of the random projection
+        neighbors: Sentences compared on each side per ordering
+        rounds: Number of random orderings
+        damping: PageRank damping factor
+        iterations: Maximum number of PageRank iterations
+        seed: Random seed
+
+    Returns:
+        Score per sentence
+    """
+    np = _numpy()
+    n = matrix.shape[0]
+    scores: NDArray[Any] = np.ones(n)
+    if n <= 1:
+        return scores
+
+    sketch = matrix.project(dims, seed)
+    rng = np.random.default_rng(seed + 1)
+    pairs = []
+    for _ in range(rounds):
+        order = np.argsort(sketch @ rng.standard_normal(dims))
+        for offset in range(1, min(neighbors, n - 1) + 1):
+            pairs.append(np.stack([order[:-offset], order[offset:]], axis=1))
+    edges = np.unique(np.sort(np.concatenate(pairs), axis=1), axis=0)
+    src, dst = edges[:, 0], edges[:, 1]
+    weights = np.einsum("ij,ij->i", sketch[src], sketch[dst])
+    keep = weights > 0
+    src, dst, weights = src[keep], dst[keep], weights[keep]
+
+    # Undirected graph: use every edge in both directions
+    src, dst = np.concatenate([src, dst]), np.concatenate([dst, src])
+    weights = np.concatenate([weights, weights])
+    out_weight = np.bincount(src, weights=weights, minlength=n)
+    dangling = out_weight == 0
+    out_weight[dangling] = 1.0
+
+    scores /= n
+    for _ in range(iterations):
+        spread = np.bincount(
+            dst, weights=weights * (scores / out_weight)[src], minlength=n
+        )
+        spread += scores[dangling].sum() / n
+        updated = (1 - damping) / n + damping * spread
+        converged = np.abs(updated - scores).sum() < 1e-9
+        scores = updated
+        if converged:
+            break
+    return scores
+
+
+def select_sentences(
+    sentences: list[str], count: int, method: str = "textrank"
+) -> list[int]:
+    """
+    Pick the indices of the best sentences, in document order.
+
+    Args:
+        sentences: Candidate sentences
+        count: Number of sentences to pick
+        method: Scoring method, one of METHODS
+
+    Returns:
+        Sorted indices of the selected sentences
+
+    Raises:
+        ValueError: If the method is unknown.
+    """
+    np = _numpy()
+    if method not in METHODS:
+        raise ValueError(f"Unknown summarization method: {method}")
+    if len(sentences) <= count:
+        return list(range(len(sentences)))
+
+    matrix = SentenceMatrix(sentences)
+    if method == "tfidf":
+        scores = centroid_scores(matrix)
+    else:
+        scores = textrank_scores(matrix)
+    best = np.argpartition(-scores, count - 1)[:count]
+    return sorted(best.tolist())
+
+
+def summarize_extractive(
+    text: str | Document,
+    sentence_count: int = 3,
+    method: str = "textrank",
+    chunk_sentences: int = 2000,
+) -> str:
+    """
+    Summarize a text by extracting its highest scoring sentences.
+
+    Long documents are handled map-reduce style: each block of
+    ``chunk_sentences`` sentences nominates its best candidates, and the
+    candidates are scored again until a single block remains.
+
+    Args:
+        text: The input text or Document
+        sentence_count: Number of sentences to include in summary
+        method: Scoring method, one of METHODS (default: "textrank")
+        chunk_sentences: Maximum sentences scored together
+
+    Returns:
+        Summarized text
+    """
+    doc = as_document(text)
+    sentences = doc.sentences
+    if len(sentences) <= sentence_count:
+        return doc.text
+
+    candidates = list(range(len(sentences)))
+    per_chunk = max(sentence_count, 1)
+    chunk_sentences = max(chunk_sentences, 2 * per_chunk)
+    while len(candidates) > chunk_sentences:
+        nominated: list[int] = []
+        for start in range(0, len(candidates), chunk_sentences):
+            block = candidates[start : start + chunk_sentences]
+            picked = select_sentences(
+                [sentences[i] for i in block], per_chunk, method
+            )
+            nominated.extend(block[i] for i in picked)
+        candidates = nominated
+
+    picked = select_sentences(
+        [sentences[i] for i in candidates], sentence_count, method
+    )
+    return " ".join(sentences[candidates[i]] for i in picked)
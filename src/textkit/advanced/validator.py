@@ -2,34 +2,42 @@
 
 import re
 
+from dataval.instrument import timed
+from textkit.document import Document, as_document
 
-def extract_hashtags(text: str) -> list[str]:
+
+@timed
+def extract_hashtags(text: str | Document) -> list[str]:
     """
     Extract hashtags from text.
 
     Args:
-        text: The input text
+        text: The input text or Document
 
     Returns:
         List of hashtags without the # symbol
     """
     pattern = r"#(\w+)"
-    return re.findall(pattern, text)
+    return re.findall(pattern, as_document(text).text)
 
 
-def calculate_readability(text: str) -> dict[str, float] | dict[str, str]:
+@timed
+def calculate_readability(
+    text: str | Document,
+) -> dict[str, float] | dict[str, str]:
     """
     Calculate basic readability metrics.
 
     Args:
-        text: The input text
+        text: The input text or Document
 
     Returns:
         Dictionary with various readability scores
     """
-    word_count = len(text.split())
-    sentence_count = len(re.split(r"[.!?]+", text)) - 1
-    char_count = len(text)
+    doc = as_document(text)
+    word_count = len(doc.tokens)
+    sentence_count = len(doc.sentence_ends)
+    char_count = len(doc)
 
     if word_count == 0 or sentence_count == 0:
         return {"error": "Text too short for analysis"}
@@ -47,21 +55,36 @@ def calculate_readability(text: str) -> dict[str, float] | dict[str, str]:
     }
 
 
-def summarize(text: str, sentence_count: int = 3) -> str:
+@timed
+def summarize(
+    text: str | Document, sentence_count: int = 3, method: str = "lead"
+) -> str:
     """
     Create a simple extractive summary by selecting top sentences.
 
     Args:
-        text: The input text
+        text: The input text or Document
         sentence_count: Number of sentences to include in summary
+        method: "lead" for the first sentences, or "tfidf" / "textrank"
+            for scored sentences (requires NumPy) (default: "lead")
 
     Returns:
         Summarized text
+
+    Raises:
+        ValueError: If the method is unknown.
     """
-    sentences = re.split(r"(?<=[.!?])\s+", text)
-    if len(sentences) <= sentence_count:
-        return text
+    if method != "lead":
+        from textkit.advanced import extractive  # pylint: disable=C0415
+
+        return extractive.summarize_extractive(text, sentence_count, method)
+
+    doc = as_document(text)
+    spans = doc.sentence_spans
+    if len(spans) <= sentence_count:
+        return doc.text
 
     # Very simple algorithm - just take first few sentences
     # In a real implementation, you'd use more sophisticated methods
-    return " ".join(sentences[:sentence_count])
+    lead = spans[:sentence_count]
+    return " ".join(doc.text[start:end] for start, end in lead)
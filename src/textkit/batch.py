@@ -0,0 +1,208 @@
+"""Micro-batched processing of NDJSON document streams."""
+
+import json
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent import futures
+from functools import partial
+from typing import Any, TextIO
+
+from textkit import transformers
+from textkit.advanced.validator import calculate_readability, summarize
+from textkit.document import Document
+from textkit.streaming import TextStats
+
+OPERATIONS = ("analyze", "transform", "summarize")
+DEFAULT_BATCH_SIZE = 256
+
+
+def process_document(
+    op: str, text: str, options: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    Apply one operation to a document.
+
+    Args:
+        op: Operation name, one of OPERATIONS
+        text: Document text
+        options: Operation options: ``top`` for analyze, ``slugify`` and
+            ``truncate`` for transform, ``sentences`` and ``method`` for
+            summarize
+
+    Returns:
+        JSON-serializable result
+
+    Raises:
+        ValueError: If the operation is unknown.
+    """
+    if op == "analyze":
+        stats = TextStats.from_text(text)
+        return {
+            "word_count": stats.word_count,
+            "char_count": stats.char_count,
+            "sentence_count": stats.sentence_count,
+            "average_word_length": round(stats.average_word_length, 2),
+            "top_words": stats.top_words(options.get("top", 10)),
+        }
+    if op == "transform":
+        if options.get("slugify"):
+            text = transformers.slugify(text)
+        if options.get("truncate"):
+            text = transformers.truncate(text, length=options["truncate"])
+        return {"text": text}
+    if op == "summarize":
+        doc = Document(text)
+        return {
+            "summary": summarize(
+                doc,
+                options.get("sentences", 3),
+                options.get("method", "lead"),
+            ),
+            "readability": calculate_readability(doc),
+        }
+    raise ValueError(f"Unknown operation: {op}")
+
+
+def process_lines(
+    op: str, options: dict[str, Any], start: int, lines: list[str]
+) -> str:
+    """
+    Process a micro-batch of NDJSON input lines.
+
+    Each line holds either a JSON string or an object with a ``text``
+    field; an ``id`` field is copied to the result. Malformed lines, and
+    documents needing a missing optional dependency (tfidf and textrank
+    summaries without NumPy), produce an ``error`` result instead of
+    aborting the batch.
+
+    Args:
+        op: Operation name, one of OPERATIONS
+        options: Operation options for process_document()
+        start: Index of the first document of the batch in the stream
+        lines: Input lines
+
+    Returns:
+        NDJSON output for the batch, one line per input line
+    """
+    output = []
+    for index, line in enumerate(lines, start):
+        result: dict[str, Any] = {"index": index}
+        try:
+            record = json.loads(line)
+            if isinstance(record, dict):
+                if "id" in record:
+                    result["id"] = record["id"]
+                record = record.get("text")
+            if not isinstance(record, str):
+                raise ValueError("Expected a string or a 'text' field")
+            result["result"] = process_document(op, record, options)
+        except (ValueError, ImportError) as e:
+            result["error"] = str(e)
+        output.append(json.dumps(result) + "\n")
+    return "".join(output)
+
+
+def iter_batches(
+    lines: Iterable[str], batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[tuple[int, list[str]]]:
+    """
+    Group non-blank lines into micro-batches.
+
+    Args:
+        lines: Input lines
+        batch_size: Maximum number of lines per batch
+
+    Yields:
+        (index of the first line, lines) tuples
+
+    Raises:
+        ValueError: If batch_size is not positive.
+    """
+    if batch_size <= 0:
+        raise ValueError("Batch size must be positive")
+    start = 0
+    batch: list[str] = []
+    for line in lines:
+        if not line.strip():
+            continue
+        batch.append(line)
+        if len(batch) == batch_size:
+            yield start, batch
+            start += len(batch)
+            batch = []
+    if batch:
+        yield start, batch
+
+
+def run_batch(
+    lines: Iterable[str],
+    output: TextIO,
+    op: str,
+    options: dict[str, Any] | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    jobs: int | None = None,
+    ordered: bool = True,
+) -> int:
+    """
+    Process an NDJSON document stream, writing one result per document.
+
+    Micro-batches are processed on a pool of worker processes, which
+    serialize their own output. Only a few batches per worker are in
+    flight at once, so memory stays bounded for unbounded input.
+
+    Args:
+        lines: Input lines, one JSON document each
+        output: Stream to write NDJSON results to
+        op: Operation name, one of OPERATIONS
+        options: Operation options for process_document()
+        batch_size: Maximum number of documents per batch
+        jobs: Number of worker processes (default: CPU count, 1 disables
+            the pool)
+        ordered: Write results in input order (default: True); otherwise
+            batches are written as soon as they finish
+
+    Returns:
+        Number of documents processed
+
+    Raises:
+        ValueError: If the operation is unknown.
+    """
+    if op not in OPERATIONS:
+        raise ValueError(f"Unknown operation: {op}")
+    worker = partial(process_lines, op, options or {})
+    batches = iter_batches(lines, batch_size)
+    workers = jobs or os.cpu_count() or 1
+    count = 0
+    if workers <= 1:
+        for start, batch in batches:
+            output.write(worker(start, batch))
+            count += len(batch)
+        return count
+
+    pending: deque[futures.Future[str]] = deque()
+    with futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        for start, batch in batches:
+            pending.append(executor.submit(worker, start, batch))
+            count += len(batch)
+            if len(pending) >= workers * 2:
+                _drain(pending, output, ordered, workers)
+        _drain(pending, output, ordered, 0)
+    return count
+
+
+def _drain(
+    pending: deque[futures.Future[str]],
+    output: TextIO,
+    ordered: bool,
+    keep: int,
+) -> None:
+    """Write finished batches until at most ``keep`` are in flight."""
+    while len(pending) > keep:
+        if ordered:
+            output.write(pending.popleft().result())
+            continue
+        done, _ = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+        for future in done:
+            pending.remove(future)
+            output.write(future.result())
@@ -0,0 +1,236 @@
+"""Persistent, content-addressed cache for analysis results."""
+
+import hashlib
+import json
+import os
+import tempfile
+import zlib
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from textkit import __version__
+from textkit.document import Document
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def default_cache_dir() -> Path:
+    """
+    Get the default cache directory.
+
+    Uses $TEXTKIT_CACHE_DIR if set, else $XDG_CACHE_HOME/textkit, else
+    ~/.cache/textkit.
+
+    Returns:
+        Path of the cache directory
+    """
+    if env_dir := os.environ.get("TEXTKIT_CACHE_DIR"):
+        return Path(env_dir)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "textkit"
+
+
+def content_hash(content: str | bytes | Document) -> str:
+    """
+    Hash text content for use in a cache key.
+
+    Args:
+        content: Text, raw bytes or a Document
+
+    Returns:
+        Hex digest of the content
+    """
+    if isinstance(content, Document):
+        content = content.text
+    if isinstance(content, str):
+        content = content.encode("utf-8", "surrogatepass")
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def file_hash(path: str | Path) -> str:
+    """
+    Hash the contents of a file without loading it whole.
+
+    Args:
+        path: Path of the file
+
+    Returns:
+        Hex digest of the file contents
+    """
+    with open(path, "rb") as f:
+        digest = hashlib.file_digest(
+            f, lambda: hashlib.blake2b(digest_size=16)
+        )
+    return digest.hexdigest()
+
+
+class AnalysisCache:
+    """
+    On-disk cache of analysis results keyed by content and parameters.
+
+    Entries are zlib-compressed JSON files named by a hash of the content
+    hash and a parameter signature. When the total size exceeds
+    ``max_bytes`` the least recently used entries are removed.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        enabled: bool = True,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Cache directory (default: default_cache_dir())
+            max_bytes: Maximum total size of the entries in bytes
+            enabled: Whether to read and write entries (default: True)
+        """
+        self.directory = Path(directory) if directory else default_cache_dir()
+        self.max_bytes = max_bytes
+        self.enabled = enabled and not os.environ.get("TEXTKIT_NO_CACHE")
+        self.hits = 0
+        self.misses = 0
+        self._size: int | None = None
+
+    def key(self, digest: str, signature: str) -> str:
+        """
+        Build the cache key for a content hash and parameter signature.
+
+        Args:
+            digest: Content hash from content_hash() or file_hash()
+            signature: Description of the computation and its parameters
+
+        Returns:
+            Cache key
+        """
+        material = f"{__version__}\0{signature}\0{digest}".encode()
+        return hashlib.blake2b(material, digest_size=16).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / key[2:]
+
+    def get(self, key: str) -> Any:
+        """
+        Look up an entry, marking it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None if missing
+        """
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+            value = json.loads(zlib.decompress(data))
+        except (OSError, ValueError, zlib.error):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Store an entry, evicting old entries if the cache is too large.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+        """
+        if not self.enabled:
+            return
+        data = zlib.compress(json.dumps(value, separators=(",", ":")).encode())
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            replaced = path.stat().st_size
+        except FileNotFoundError:
+            replaced = 0
+        # Write to a temporary file first so readers never see partial data
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+        if self._size is None:
+            self._size = self._scan_size()
+        else:
+            self._size += len(data) - replaced
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def cached(
+        self,
+        func: Callable[..., Any],
+        text: str | Document,
+        **params: Any,
+    ) -> Any:
+        """
+        Call func(text, **params), reusing a cached result when possible.
+
+        Args:
+            func: Analysis function taking the text as first argument
+            text: The input text or Document
+            **params: Keyword arguments for func
+
+        Returns:
+            The (possibly cached) result of the call
+        """
+        if not self.enabled:
+            return func(text, **params)
+        signature = f"{func.__module__}.{func.__qualname__}:" + json.dumps(
+            params, sort_keys=True
+        )
+        key = self.key(content_hash(text), signature)
+        value = self.get(key)
+        if value is None:
+            value = func(text, **params)
+            self.put(key, value)
+        return value
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        for path in self.directory.glob("*/*"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self, target_bytes: int | None = None) -> int:
+        """
+        Remove least recently used entries until under a size target.
+
+        Args:
+            target_bytes: Size to shrink to (default: 90% of max_bytes)
+
+        Returns:
+            Number of entries removed
+        """
+        if target_bytes is None:
+            target_bytes = self.max_bytes * 9 // 10
+        entries = sorted(self._entries())
+        size = sum(entry_size for _, entry_size, _ in entries)
+        removed = 0
+        for _, entry_size, path in entries:
+            if size <= target_bytes:
+                break
+            path.unlink(missing_ok=True)
+            size -= entry_size
+            removed += 1
+        self._size = size
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self.evict(target_bytes=0)
@@ -1,67 +1,409 @@
 """Command-line interface for text utilities."""
 
+import functools
+import io
+import json
 import sys
+import time
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, TextIO
 
 import click  # type: ignore[import-not-found]
-from rich.console import Console  # type: ignore[import-not-found]
-from rich.table import Table  # type: ignore[import-not-found]
 
-from textkit import analyzer, transformer
-from textkit.advanced import summarizer
+from dataval import instrument
+from dataval.registry import REGISTRY
 
-console = Console()
+# Only light modules whose constants are needed to declare the options
+# are imported here; commands import the rest when they run
+from textkit import __version__, entities, streaming, transformers
+from textkit import batch as batching
+from textkit.document import Document
+
+if TYPE_CHECKING:
+    from rich.console import Console  # type: ignore[import-not-found]
+    from rich.table import Table  # type: ignore[import-not-found]
+
+    from textkit.window import SlidingWindowCounter
+
+FORMATS = ("table", "json", "tsv")
+
+
+def format_option(default: str = "table") -> Any:
+    """Build the --format option shared by the commands."""
+    return click.option(
+        "--format",
+        "-F",
+        "output_format",
+        type=click.Choice(FORMATS),
+        default=default,
+        show_default=True,
+        help="Output format (json and tsv skip rich rendering)",
+    )
+
+
+@functools.cache
+def _console() -> "Console":
+    """Create the rich console on first use."""
+    from rich.console import Console  # pylint: disable=C0415
+
+    return Console()
+
+
+def _table(title: str) -> "Table":
+    """Create a rich table (only imported for table output)."""
+    from rich.table import Table  # pylint: disable=C0415
+
+    return Table(title=title)
+
+
+def _error(message: str, output_format: str) -> None:
+    """Report an error in the style of the output format."""
+    if output_format == "table":
+        _console().print(f"[bold red]Error:[/] {message}")
+    else:
+        click.echo(f"Error: {message}", err=True)
+
+
+def _write_json(value: Any) -> None:
+    """Write a value as one line of JSON."""
+    sys.stdout.write(json.dumps(value) + "\n")
+
+
+def _tsv_field(value: Any) -> str:
+    """Escape a value for a TSV field."""
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _write_tsv(header: Iterable[str], rows: Iterable[Iterable[Any]]) -> None:
+    """Write a header line and rows as tab-separated values."""
+    lines = ["\t".join(header)]
+    lines.extend("\t".join(map(_tsv_field, row)) for row in rows)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 @click.group()
-@click.version_option()
-def cli() -> None:
+@click.version_option(__version__)
+@click.option(
+    "--timings",
+    is_flag=True,
+    help="Print a per-stage wall/CPU time breakdown to stderr",
+)
+@click.option(
+    "--profile",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Profile the command with cProfile and save the stats here",
+)
+@click.pass_context
+def cli(ctx: click.Context, timings: bool, profile: str | None) -> None:
     """Text Utilities - A collection of text processing tools."""
+    if timings:
+        instrument.enable()
+        ctx.call_on_close(
+            lambda: click.echo(instrument.format_report(), err=True)
+        )
+    if profile:
+        import cProfile  # pylint: disable=C0415
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+        def save_profile() -> None:
+            profiler.disable()
+            profiler.dump_stats(profile)
+
+        ctx.call_on_close(save_profile)
 
 
 @cli.command()
 @click.argument("text", required=False)
 @click.option("--file", "-f", type=click.File("r"), help="Input file")
 @click.option("--top", "-n", default=10, help="Number of top words to show")
-def analyze(text: str | None, file: click.File | None, top: int) -> None:
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Read the input in chunks instead of loading it whole",
+)
+@click.option(
+    "--chunk-size",
+    default=streaming.DEFAULT_CHUNK_SIZE,
+    show_default=True,
+    help="Characters per chunk in streaming mode",
+)
+@click.option(
+    "--path",
+    "-p",
+    "paths",
+    multiple=True,
+    help="File, directory or glob pattern to analyze (repeatable)",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=int,
+    help="Worker processes for multi-file analysis (default: CPU count)",
+)
+@click.option(
+    "--approx",
+    is_flag=True,
+    help="Count words with fixed-memory sketches (approximate top words)",
+)
+@click.option(
+    "--capacity",
+    type=click.IntRange(min=1),
+    default=1000,
+    show_default=True,
+    help="Words tracked by the top-words sketch in --approx mode",
+)
+@click.option(
+    "--follow",
+    is_flag=True,
+    help="Follow the input and show rolling top words (like tail -f)",
+)
+@click.option(
+    "--from-start",
+    is_flag=True,
+    help="Read a followed file from the beginning instead of its end",
+)
+@click.option(
+    "--window-lines",
+    type=int,
+    help="Keep only the last N lines in --follow mode",
+)
+@click.option(
+    "--window-seconds",
+    type=float,
+    help="Keep only lines from the last N seconds in --follow mode",
+)
+@click.option(
+    "--refresh",
+    default=2.0,
+    show_default=True,
+    help="Seconds between updates in --follow mode",
+)
+@click.option(
+    "--cache/--no-cache",
+    default=False,
+    show_default=True,
+    help="Reuse results for unchanged inputs from the on-disk cache",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    help="Cache directory (default: ~/.cache/textkit)",
+)
+@format_option()
+def analyze(
+    text: str | None,
+    file: TextIO | None,
+    top: int,
+    stream: bool,
+    chunk_size: int,
+    paths: tuple[str, ...],
+    jobs: int | None,
+    approx: bool,
+    capacity: int,
+    follow: bool,
+    from_start: bool,
+    window_lines: int | None,
+    window_seconds: float | None,
+    refresh: float,
+    cache: bool,
+    cache_dir: str | None,
+    output_format: str,
+) -> None:
     """Analyze text and show statistics."""
-    if file:
-        content = file.read()
-    elif text:
-        content = text
-    else:
-        content = sys.stdin.read()
+    # pylint: disable=import-outside-toplevel
+    from textkit import corpus
+    from textkit.cache import AnalysisCache
+
+    results_cache = AnalysisCache(cache_dir, enabled=cache)
+    if follow:
+        _follow(
+            file or sys.stdin,
+            top,
+            window_lines,
+            window_seconds,
+            refresh,
+            output_format,
+            from_start,
+        )
+        return
 
-    if not content.strip():
-        console.print("[bold red]Error:[/] No text provided")
+    approx_capacity = capacity if approx else None
+    file_count = None
+    if paths:
+        stats, file_count = corpus.analyze_corpus(
+            corpus.iter_paths(paths),
+            jobs=jobs,
+            chunk_size=chunk_size,
+            approx_capacity=approx_capacity,
+            cache=results_cache,
+        )
+        if not file_count:
+            _error("No files matched", output_format)
+            return
+    elif stream and not text:
+        stats = streaming.analyze_stream(
+            file or sys.stdin, chunk_size, approx_capacity
+        )
+        if not stats.word_count:
+            _error("No text provided", output_format)
+            return
+    else:
+        with instrument.stage("cli.read"):
+            if file:
+                content = file.read()
+            elif text:
+                content = text
+            else:
+                content = sys.stdin.read()
+
+        if not content.strip():
+            _error("No text provided", output_format)
+            return
+
+        with instrument.stage("cli.analyze"):
+            # Tokenize once and share the document across all metrics
+            doc = Document(content)
+            if approx_capacity is None:
+                stats = streaming.TextStats.from_dict(
+                    results_cache.cached(_text_stats, doc)
+                )
+            else:
+                stats = streaming.new_stats(approx_capacity)
+                stats.add(doc)
+
+    with instrument.stage("cli.top_words"):
+        top_words = stats.top_words(n=top)
+    with instrument.stage("cli.render"):
+        _print_stats(stats, top_words, top, file_count, approx, output_format)
+
+
+def _print_stats(
+    stats: streaming.TextStats,
+    top_words: list[tuple[str, int]],
+    top: int,
+    file_count: int | None,
+    approx: bool,
+    output_format: str,
+) -> None:
+    """Print analysis results in the requested format."""
+    if output_format != "table":
+        metrics: dict[str, Any] = {}
+        if file_count is not None:
+            metrics["file_count"] = file_count
+        metrics["word_count"] = stats.word_count
+        metrics["char_count"] = stats.char_count
+        metrics["sentence_count"] = stats.sentence_count
+        metrics["average_word_length"] = round(stats.average_word_length, 2)
+        metrics["distinct_words"] = stats.distinct_words
+        metrics["approximate"] = approx
+        if output_format == "json":
+            _write_json({**metrics, "top_words": top_words})
+        else:
+            _write_tsv(("metric", "value"), metrics.items())
+            sys.stdout.write("\n")
+            _write_tsv(("word", "frequency"), top_words)
         return
 
     # Create rich table for results
-    table = Table(title="Text Analysis Results")
+    table = _table("Text Analysis Results")
     table.add_column("Metric", style="cyan")
     table.add_column("Value", style="green")
 
     # Add basic metrics
-    word_count = len(content.split())
-    table.add_row("Word Count", str(word_count))
-    table.add_row("Character Count", str(len(content)))
-    table.add_row("Sentence Count", str(analyzer.sentence_count(content)))
+    if file_count is not None:
+        table.add_row("File Count", str(file_count))
+    table.add_row("Word Count", str(stats.word_count))
+    table.add_row("Character Count", str(stats.char_count))
+    table.add_row("Sentence Count", str(stats.sentence_count))
+    table.add_row("Average Word Length", f"{stats.average_word_length:.2f}")
     table.add_row(
-        "Average Word Length", f"{analyzer.average_word_length(content):.2f}"
+        "Distinct Words" + (" (approx.)" if approx else ""),
+        str(stats.distinct_words),
     )
 
     # Show top words
-    console.print(table)
+    _console().print(table)
 
-    top_words = analyzer.get_top_words(content, n=top)
     if top_words:
-        word_table = Table(title=f"Top {top} Words")
+        word_table = _table(f"Top {top} Words")
         word_table.add_column("Word", style="blue")
         word_table.add_column("Frequency", style="magenta")
 
         for word, freq in top_words:
             word_table.add_row(word, str(freq))
 
-        console.print(word_table)
+        _console().print(word_table)
+
+
+def _text_stats(text: Document) -> dict[str, Any]:
+    """Compute exact statistics for a document as a cacheable dict."""
+    return streaming.TextStats.from_text(text).to_dict()
+
+
+def _follow(
+    stream: TextIO,
+    top: int,
+    window_lines: int | None,
+    window_seconds: float | None,
+    refresh: float,
+    output_format: str,
+    from_start: bool = False,
+) -> None:
+    """Print rolling top words for a followed stream until interrupted."""
+    from textkit import window  # pylint: disable=C0415
+
+    counter = window.SlidingWindowCounter(window_lines, window_seconds)
+    last_refresh = time.monotonic()
+    try:
+        for line in window.follow_lines(
+            stream, min(refresh, 0.5), from_start
+        ):
+            if line:
+                counter.add(line)
+            now = time.monotonic()
+            if now - last_refresh >= refresh:
+                last_refresh = now
+                counter.evict(now)
+                _print_window(counter, top, output_format)
+    except KeyboardInterrupt:
+        pass
+    _print_window(counter, top, output_format)
+
+
+def _print_window(
+    counter: "SlidingWindowCounter", top: int, output_format: str
+) -> None:
+    """Print the current top words of a sliding window."""
+    now = time.strftime("%H:%M:%S")
+    if output_format != "table":
+        if output_format == "json":
+            _write_json(
+                {
+                    "time": now,
+                    "lines": len(counter),
+                    "top_words": counter.top_words(top),
+                }
+            )
+        else:
+            _write_tsv(("word", "frequency"), counter.top_words(top))
+            sys.stdout.write("\n")
+        sys.stdout.flush()
+        return
+
+    word_table = _table(f"Top {top} Words ({len(counter)} lines, {now})")
+    word_table.add_column("Word", style="blue")
+    word_table.add_column("Frequency", style="magenta")
+    for word, freq in counter.top_words(top):
+        word_table.add_row(word, str(freq))
+    _console().print(word_table)
 
 
 @cli.command()
@@ -69,13 +411,38 @@ def analyze(text: str | None, file: click.File | None, top: int) -> None:
 @click.option("--file", "-f", type=click.File("r"), help="Input file")
 @click.option("--slugify", "-s", is_flag=True, help="Convert to slug format")
 @click.option("--truncate", "-t", type=int, help="Truncate to length")
+@click.option(
+    "--pipeline",
+    "-p",
+    help='Steps applied line by line, e.g. "lower|replace:map.json|slugify|'
+    'truncate:80" (streams plain text lines)',
+)
+@format_option()
 def transform(
     text: str | None,
-    file: click.File | None,
+    file: TextIO | None,
     slugify: bool,
     truncate: int | None,
+    pipeline: str | None,
+    output_format: str,
 ) -> None:
     """Transform text with various operations."""
+    if pipeline:
+        if slugify or truncate:
+            raise click.UsageError(
+                "--pipeline cannot be combined with --slugify/--truncate"
+            )
+        from textkit.pipeline import Pipeline  # pylint: disable=C0415
+
+        try:
+            compiled = Pipeline.parse(pipeline)
+        except (OSError, ValueError) as e:
+            raise click.BadParameter(str(e), param_hint="--pipeline") from e
+        lines = io.StringIO(text) if text else file or sys.stdin
+        with instrument.stage("cli.pipeline"):
+            compiled.run(lines, sys.stdout)
+        return
+
     if file:
         content = file.read()
     elif text:
@@ -84,26 +451,57 @@ def transform(
         content = sys.stdin.read()
 
     if not content.strip():
-        console.print("[bold red]Error:[/] No text provided")
+        _error("No text provided", output_format)
         return
 
     result = content
 
     if slugify:
-        result = transformer.slugify(result)
+        result = transformers.slugify(result)
 
     if truncate:
-        result = transformer.truncate(result, length=truncate)
+        result = transformers.truncate(result, length=truncate)
 
-    console.print(result)
+    if output_format == "json":
+        _write_json({"text": result})
+    elif output_format == "tsv":
+        _write_tsv(("text",), [(result,)])
+    else:
+        _console().print(result)
 
 
 @cli.command()
 @click.argument("text", required=False)
 @click.option("--file", "-f", type=click.File("r"), help="Input file")
 @click.option("--sentences", "-s", default=3, help="Number of sentences")
+@click.option(
+    "--method",
+    "-m",
+    type=click.Choice(["lead", "tfidf", "textrank"]),
+    default="lead",
+    show_default=True,
+    help="Sentence selection method (tfidf/textrank require NumPy)",
+)
+@click.option(
+    "--cache/--no-cache",
+    default=False,
+    show_default=True,
+    help="Reuse results for unchanged inputs from the on-disk cache",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    help="Cache directory (default: ~/.cache/textkit)",
+)
+@format_option()
 def summarize(
-    text: str | None, file: click.File | None, sentences: int
+    text: str | None,
+    file: click.File | None,
+    sentences: int,
+    method: str,
+    cache: bool,
+    cache_dir: str | None,
+    output_format: str,
 ) -> None:
     """Create a summary of the text."""
     if file:
@@ -114,12 +512,34 @@ def summarize(
         content = sys.stdin.read()
 
     if not content.strip():
-        console.print("[bold red]Error:[/] No text provided")
+        _error("No text provided", output_format)
         return
 
-    summary = summarizer.summarize(content, sentence_count=sentences)
-    readability = summarizer.calculate_readability(content)
+    # pylint: disable=import-outside-toplevel
+    from textkit.advanced import validator as summarizer
+    from textkit.cache import AnalysisCache
+
+    doc = Document(content)
+    results_cache = AnalysisCache(cache_dir, enabled=cache)
+    with instrument.stage("cli.summarize"):
+        summary = results_cache.cached(
+            summarizer.summarize, doc, sentence_count=sentences, method=method
+        )
+        readability = results_cache.cached(
+            summarizer.calculate_readability, doc
+        )
+
+    if output_format == "json":
+        _write_json({"summary": summary, "readability": readability})
+        return
+    if output_format == "tsv":
+        _write_tsv(
+            ("metric", "value"),
+            [("summary", summary), *readability.items()],
+        )
+        return
 
+    console = _console()
     console.print("[bold green]Summary:[/]")
     console.print(summary)
     console.print("\n[bold green]Readability Metrics:[/]")
@@ -128,6 +548,386 @@ def summarize(
         console.print(f"{metric}: {value}")
 
 
+@cli.command()
+@click.argument("text", required=False)
+@click.option("--file", "-f", type=click.File("r"), help="Input file")
+@click.option(
+    "--kind",
+    "-k",
+    "kinds",
+    multiple=True,
+    type=click.Choice(entities.ENTITY_KINDS),
+    help="Entity kind to extract (repeatable, default: all)",
+)
+@click.option(
+    "--chunk-size",
+    default=streaming.DEFAULT_CHUNK_SIZE,
+    show_default=True,
+    help="Characters read at a time",
+)
+@format_option(default="json")
+def extract(
+    text: str | None,
+    file: TextIO | None,
+    kinds: tuple[str, ...],
+    chunk_size: int,
+    output_format: str,
+) -> None:
+    """Extract entities, followed by per-kind counts (NDJSON default)."""
+    stream = io.StringIO(text) if text else file or sys.stdin
+    scanner = entities.EntityScanner(kinds or entities.ENTITY_KINDS)
+    counts = dict.fromkeys(scanner.kinds, 0)
+    found = scanner.scan_stream(stream, chunk_size)
+    if output_format == "table":
+        table = _table("Entities")
+        for column in ("Kind", "Start", "End", "Text"):
+            table.add_column(column)
+        for entity, value in found:
+            counts[entity.kind] += 1
+            table.add_row(
+                entity.kind, str(entity.start), str(entity.end), value
+            )
+        console = _console()
+        console.print(table)
+        console.print(
+            ", ".join(f"{kind}: {count}" for kind, count in counts.items())
+        )
+        return
+
+    write = sys.stdout.write
+    if output_format == "tsv":
+        write("kind\tstart\tend\ttext\n")
+    for entity, value in found:
+        counts[entity.kind] += 1
+        if output_format == "tsv":
+            write(f"{entity.kind}\t{entity.start}\t{entity.end}\t")
+            write(_tsv_field(value) + "\n")
+        else:
+            write(json.dumps({**entity._asdict(), "text": value}) + "\n")
+    if output_format == "tsv":
+        write("\n")
+        _write_tsv(("kind", "count"), counts.items())
+    else:
+        write(json.dumps({"counts": counts}) + "\n")
+
+
+@cli.command()
+@click.argument(
+    "validator", type=click.Choice(sorted(REGISTRY)), metavar="VALIDATOR"
+)
+@click.argument("values", nargs=-1)
+@click.option(
+    "--file", "-f", type=click.File("r"), help="Input file, one value per line"
+)
+@click.option("--show-invalid", is_flag=True, help="List the invalid values")
+@format_option()
+def validate(
+    validator: str,
+    values: tuple[str, ...],
+    file: TextIO | None,
+    show_invalid: bool,
+    output_format: str,
+) -> None:
+    """Validate values (arguments, or one per input line) by name."""
+    check = REGISTRY.get(validator)
+    lines: Iterable[str] = values or (
+        line.strip() for line in file or sys.stdin
+    )
+    total = valid = 0
+    invalid = []
+    with instrument.stage("cli.validate"):
+        for value in lines:
+            if not value:
+                continue
+            total += 1
+            if check(value):
+                valid += 1
+            elif show_invalid:
+                invalid.append(value)
+
+    cache = REGISTRY.stats().get(validator, {})
+    metrics = {
+        "validator": validator,
+        "total": total,
+        "valid": valid,
+        "invalid": total - valid,
+        "cache_hit_rate": cache.get("hit_rate"),
+    }
+    if output_format == "json":
+        _write_json({**metrics, "invalid_values": invalid})
+        return
+    if output_format == "tsv":
+        _write_tsv(("metric", "value"), metrics.items())
+        if invalid:
+            sys.stdout.write("\n")
+            _write_tsv(("invalid_value",), ((value,) for value in invalid))
+        return
+
+    table = _table(f"Validation: {validator}")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="green")
+    for metric, result in metrics.items():
+        if metric != "validator":
+            table.add_row(metric.replace("_", " ").capitalize(), str(result))
+    console = _console()
+    console.print(table)
+    for value in invalid:
+        console.print(f"[red]invalid:[/] {value}")
+
+
+@cli.command()
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--jobs",
+    "-j",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Worker processes for NDJSON files (0 for the CPU count)",
+)
+@click.option(
+    "--sample-size",
+    default=1000,
+    show_default=True,
+    help="Records sampled to infer validators",
+)
+@click.option("--top", "-n", default=5, help="Top values per field")
+@click.option("--seed", type=int, help="Sampling seed, for repeatable runs")
+@format_option()
+def profile(
+    path: str,
+    jobs: int,
+    sample_size: int,
+    top: int,
+    seed: int | None,
+    output_format: str,
+) -> None:
+    """Profile a CSV/NDJSON file and infer its schema."""
+    # pylint: disable=import-outside-toplevel
+    from dataval.validation.inference import profile_file
+
+    try:
+        with instrument.stage("cli.profile"):
+            dataset = profile_file(path, jobs or None, sample_size, seed)
+    except ValueError as e:
+        raise click.ClickException(str(e)) from e
+    report = dataset.to_dict(top)
+
+    if output_format == "json":
+        _write_json(report)
+        return
+    header = (
+        "field",
+        "type",
+        "required",
+        "null_rate",
+        "distinct",
+        "min",
+        "max",
+        "validators",
+        "top",
+    )
+    rows = [
+        (
+            name,
+            report["schema"][name]["type"],
+            report["schema"][name]["required"],
+            stats["null_rate"],
+            stats["distinct"],
+            stats["min"],
+            stats["max"],
+            ",".join(report["schema"][name]["validators"]),
+            ", ".join(f"{value} ({count})" for value, count in stats["top"]),
+        )
+        for name, stats in report["fields"].items()
+    ]
+    if output_format == "tsv":
+        _write_tsv(header, rows)
+        return
+
+    table = _table(f"Profile of {report['records']} records")
+    for column in header:
+        table.add_column(column.replace("_", " ").capitalize())
+    for row in rows:
+        table.add_row(*("" if value is None else str(value) for value in row))
+    _console().print(table)
+
+
+@cli.command()
+@click.argument("text", required=False)
+@click.option("--file", "-f", type=click.File("r"), help="Input file")
+@click.option(
+    "--output",
+    "-o",
+    type=click.File("w"),
+    default="-",
+    help="Output file (default: stdout)",
+)
+@click.option("--email-mask", default="[EMAIL]", help="Replacement for emails")
+@click.option("--card-mask", default="[CARD]", help="Replacement for cards")
+@click.option(
+    "--chunk-size",
+    default=streaming.DEFAULT_CHUNK_SIZE,
+    show_default=True,
+    help="Characters read at a time",
+)
+def redact(
+    text: str | None,
+    file: TextIO | None,
+    output: TextIO,
+    email_mask: str,
+    card_mask: str,
+    chunk_size: int,
+) -> None:
+    """Mask email addresses and Luhn-valid card numbers."""
+    stream = io.StringIO(text) if text else file or sys.stdin
+    from textkit.redact import Redactor  # pylint: disable=C0415
+
+    redactor = Redactor(email_mask, card_mask)
+    for piece in redactor.redact_stream(stream, chunk_size):
+        output.write(piece)
+    click.echo(
+        f"Redacted {redactor.emails} emails, {redactor.cards} cards",
+        err=True,
+    )
+
+
+@cli.command()
+@click.option(
+    "--op",
+    type=click.Choice(batching.OPERATIONS),
+    required=True,
+    help="Operation applied to every document",
+)
+@click.option(
+    "--input",
+    "-i",
+    "input_file",
+    type=click.File("r"),
+    default="-",
+    help="NDJSON input file (default: stdin)",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.File("w"),
+    default="-",
+    help="Output file (default: stdout)",
+)
+@click.option(
+    "--batch-size",
+    default=batching.DEFAULT_BATCH_SIZE,
+    show_default=True,
+    help="Documents per micro-batch",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=int,
+    help="Worker processes (default: CPU count, 1 disables the pool)",
+)
+@click.option(
+    "--ordered/--unordered",
+    default=True,
+    help="Keep results in input order",
+)
+@click.option("--top", "-n", default=10, help="Top words (analyze)")
+@click.option("--slugify", is_flag=True, help="Slugify (transform)")
+@click.option("--truncate", type=int, help="Truncate to length (transform)")
+@click.option("--sentences", default=3, help="Sentences (summarize)")
+@click.option(
+    "--method",
+    type=click.Choice(["lead", "tfidf", "textrank"]),
+    default="lead",
+    help="Sentence selection method (summarize)",
+)
+def batch(
+    op: str,
+    input_file: TextIO,
+    output: TextIO,
+    batch_size: int,
+    jobs: int | None,
+    ordered: bool,
+    top: int,
+    slugify: bool,
+    truncate: int | None,
+    sentences: int,
+    method: str,
+) -> None:
+    """Process NDJSON documents ({"text": ...} per line) in batches."""
+    options = {
+        "top": top,
+        "slugify": slugify,
+        "truncate": truncate,
+        "sentences": sentences,
+        "method": method,
+    }
+    start = time.perf_counter()
+    count = batching.run_batch(
+        input_file,
+        output,
+        op,
+        options,
+        batch_size=batch_size,
+        jobs=jobs,
+        ordered=ordered,
+    )
+    elapsed = time.perf_counter() - start
+    click.echo(
+        f"Processed {count} documents in {elapsed:.2f}s "
+        f"({count / elapsed if elapsed else 0:.0f} docs/sec)",
+        err=True,
+    )
+
+
+@cli.command()
+@click.option(
+    "--host", default="127.0.0.1", show_default=True, help="Bind host"
+)
+@click.option("--port", default=8000, show_default=True, help="Bind port")
+@click.option(
+    "--workers",
+    "-j",
+    type=int,
+    help="Processes for text operations (default: CPU count)",
+)
+@click.option(
+    "--max-batch",
+    default=64,
+    show_default=True,
+    help="Maximum requests merged into one batched call",
+)
+@click.option(
+    "--max-delay-ms",
+    default=2.0,
+    show_default=True,
+    help="Milliseconds to wait for more requests to merge",
+)
+def serve(
+    host: str,
+    port: int,
+    workers: int | None,
+    max_batch: int,
+    max_delay_ms: float,
+) -> None:
+    """Serve the text and validation utilities over HTTP."""
+    try:
+        # pylint: disable=import-outside-toplevel
+        import uvicorn  # type: ignore[import-not-found]
+
+        from textkit.service import create_app
+    except ImportError as e:
+        raise click.ClickException(
+            "serve requires the serve extra: "
+            f"pip install demo-project[serve] ({e})"
+        ) from e
+
+    app = create_app(
+        workers=workers, max_batch=max_batch, max_delay=max_delay_ms / 1000
+    )
+    uvicorn.run(app, host=host, port=port)
+
+
 def main() -> None:
     """Main entry point for the CLI."""
     cli()
@@ -0,0 +1,188 @@
+"""Parallel analysis of multi-file corpora."""
+
+import glob
+import os
+from collections.abc import Iterable, Iterator
+from concurrent import futures
+from pathlib import Path
+
+from dataval.instrument import timed
+from textkit.cache import AnalysisCache, file_hash
+from textkit.streaming import (
+    DEFAULT_CHUNK_SIZE,
+    TextStats,
+    analyze_stream,
+    new_stats,
+)
+
+# Cache of the current pool worker, opened once by _init_worker() so that
+# batches do not each carry, and re-scan, their own copy
+_worker_cache: AnalysisCache | None = None
+
+
+def iter_paths(patterns: Iterable[str]) -> Iterator[Path]:
+    """
+    Expand files, directories and glob patterns into file paths.
+
+    Directories are searched recursively. Each file is yielded once, in
+    sorted order per pattern.
+
+    Args:
+        patterns: File paths, directory paths or glob patterns
+
+    Yields:
+        Paths of the matching files
+    """
+    seen: set[Path] = set()
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            matches = sorted(p for p in path.rglob("*") if p.is_file())
+        elif path.is_file():
+            matches = [path]
+        else:
+            matches = sorted(
+                Path(p)
+                for p in glob.glob(pattern, recursive=True)
+                if os.path.isfile(p)
+            )
+        for match in matches:
+            if match not in seen:
+                seen.add(match)
+                yield match
+
+
+def analyze_file(
+    path: str | Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    approx_capacity: int | None = None,
+    cache: AnalysisCache | None = None,
+) -> TextStats:
+    """
+    Analyze a single file in streaming mode.
+
+    Args:
+        path: Path of the file to analyze
+        chunk_size: Number of characters to read at a time
+        approx_capacity: Count words with sketches tracking at most this
+            many words (default: exact counts)
+        cache: Cache of exact results keyed by file contents (default:
+            no caching)
+
+    Returns:
+        Statistics for the file
+    """
+    key = None
+    if cache is not None and cache.enabled and approx_capacity is None:
+        # Only exact counts are cached, so chunk_size is the one parameter
+        signature = f"textkit.corpus.analyze_file:chunk_size={chunk_size}"
+        key = cache.key(file_hash(path), signature)
+        cached = cache.get(key)
+        if cached is not None:
+            return TextStats.from_dict(cached)
+
+    with open(path, encoding="utf-8", errors="replace") as f:
+        stats = analyze_stream(f, chunk_size, approx_capacity)
+
+    if key is not None and cache is not None:
+        cache.put(key, stats.to_dict())
+    return stats
+
+
+def analyze_files(
+    paths: list[Path],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    approx_capacity: int | None = None,
+    cache: AnalysisCache | None = None,
+) -> TextStats:
+    """
+    Analyze a batch of files and merge their statistics.
+
+    Args:
+        paths: Paths of the files to analyze
+        chunk_size: Number of characters to read at a time
+        approx_capacity: Count words with sketches tracking at most this
+            many words (default: exact counts)
+        cache: Cache of exact results keyed by file contents (default:
+            no caching)
+
+    Returns:
+        Merged statistics for the batch
+    """
+    total = new_stats(approx_capacity)
+    for path in paths:
+        total.merge(analyze_file(path, chunk_size, approx_capacity, cache))
+    return total
+
+
+def _init_worker(directory: Path | None, max_bytes: int) -> None:
+    """Open the result cache of a pool worker (None for no cache)."""
+    global _worker_cache  # pylint: disable=global-statement
+    if directory is not None:
+        _worker_cache = AnalysisCache(directory, max_bytes)
+
+
+def _analyze_batch(
+    paths: list[Path], chunk_size: int, approx_capacity: int | None
+) -> TextStats:
+    """Analyze a batch of files in a pool worker, using its cache."""
+    return analyze_files(paths, chunk_size, approx_capacity, _worker_cache)
+
+
+@timed
+def analyze_corpus(
+    paths: Iterable[str | Path],
+    jobs: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    approx_capacity: int | None = None,
+    cache: AnalysisCache | None = None,
+) -> tuple[TextStats, int]:
+    """
+    Analyze many files, spreading them across a process pool.
+
+    Each worker returns a TextStats partial result, which the parent
+    merges into one corpus-wide result.
+
+    Args:
+        paths: Paths of the files to analyze
+        jobs: Number of worker processes (default: CPU count, 1 disables
+            the pool)
+        chunk_size: Number of characters to read at a time
+        approx_capacity: Count words with sketches tracking at most this
+            many words (default: exact counts)
+        cache: Cache of exact results keyed by file contents (default:
+            no caching)
+
+    Returns:
+        Tuple of (merged statistics, number of files analyzed)
+    """
+    files = [Path(p) for p in paths]
+    workers = min(jobs or os.cpu_count() or 1, len(files))
+    if workers <= 1:
+        stats = analyze_files(files, chunk_size, approx_capacity, cache)
+        return stats, len(files)
+
+    # Workers merge their own batch so the parent only merges a few
+    # results instead of one per file
+    size = max(1, -(-len(files) // (workers * 4)))
+    batches = [files[i : i + size] for i in range(0, len(files), size)]
+    total = new_stats(approx_capacity)
+    # Workers open the cache once instead of receiving it with each batch
+    directory, max_bytes = None, 0
+    if cache is not None and cache.enabled and approx_capacity is None:
+        directory, max_bytes = cache.directory, cache.max_bytes
+    # Accessing futures.ProcessPoolExecutor imports multiprocessing, so
+    # the cost is only paid when a pool is actually needed
+    with futures.ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(directory, max_bytes),
+    ) as executor:
+        for stats in executor.map(
+            _analyze_batch,
+            batches,
+            [chunk_size] * len(batches),
+            [approx_capacity] * len(batches),
+        ):
+            total.merge(stats)
+    return total, len(files)
@@ -0,0 +1,107 @@
+"""Shared, lazily analyzed text document."""
+
+import re
+from collections import Counter
+from functools import cached_property
+
+from textkit.segment import sentence_ends, sentence_spans
+
+_NON_TERM = re.compile(r"[^a-zA-Z0-9]")
+# Documents with more tokens clean each distinct token only once
+_DISTINCT_MIN = 256
+
+
+def _term(token: str) -> str:
+    """Lowercase a token after removing all but ASCII letters and digits."""
+    if token.isascii() and token.isalnum():
+        return token.lower()
+    return _NON_TERM.sub("", token).lower()
+
+
+class Document:
+    """
+    Text container that tokenizes once and caches derived views.
+
+    Every analysis function in textkit accepts either a plain string or a
+    Document. Passing the same Document to several functions means the
+    tokens, frequencies and sentence boundaries are only computed once.
+    """
+
+    def __init__(self, text: str):
+        """
+        Initialize a document.
+
+        Args:
+            text: The raw document text
+        """
+        self.text = text
+
+    def __len__(self) -> int:
+        """Return the number of characters in the document."""
+        return len(self.text)
+
+    def __repr__(self) -> str:
+        """Return a short representation of the document."""
+        return f"Document({len(self.text)} chars)"
+
+    @cached_property
+    def tokens(self) -> list[str]:
+        """Whitespace-separated tokens of the original text."""
+        return self.text.split()
+
+    @cached_property
+    def lower_tokens(self) -> list[str]:
+        """Whitespace-separated tokens of the lowercased text."""
+        return list(map(str.lower, self.tokens))
+
+    @cached_property
+    def terms(self) -> list[str]:
+        """Lowercased tokens with punctuation removed."""
+        tokens = self.tokens
+        if len(tokens) >= _DISTINCT_MIN:
+            # Text repeats most of its words, so clean each one once
+            cleaned = {token: _term(token) for token in set(tokens)}
+            return list(filter(None, map(cleaned.__getitem__, tokens)))
+        terms = []
+        for token in tokens:
+            if not (token.isascii() and token.isalnum()):
+                token = _NON_TERM.sub("", token)
+                if not token:
+                    continue
+            terms.append(token.lower())
+        return terms
+
+    @cached_property
+    def frequencies(self) -> Counter[str]:
+        """Frequency count of the document terms."""
+        return Counter(self.terms)
+
+    @cached_property
+    def sentence_ends(self) -> list[int]:
+        """End offsets of the terminated sentences."""
+        return list(sentence_ends(self.text))
+
+    @cached_property
+    def sentence_spans(self) -> list[tuple[int, int]]:
+        """(start, end) offsets of the sentences, including an open tail."""
+        return list(sentence_spans(self.text))
+
+    @cached_property
+    def sentences(self) -> list[str]:
+        """Sentence texts, copied from the text on first access."""
+        return [self.text[start:end] for start, end in self.sentence_spans]
+
+
+def as_document(text: str | Document) -> Document:
+    """
+    Wrap a string in a Document, passing existing documents through.
+
+    Args:
+        text: A string or an existing Document
+
+    Returns:
+        A Document for the given text
+    """
+    if isinstance(text, Document):
+        return text
+    return Document(text)
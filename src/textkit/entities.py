@@ -0,0 +1,124 @@
+"""Single-pass extraction of emails, URLs, hashtags and mentions."""
+
+import re
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple, TextIO
+
+from dataval.analyzer import EMAIL_PATTERN, URL_PATTERN
+from textkit.document import Document, as_document
+from textkit.streaming import DEFAULT_CHUNK_SIZE, iter_word_chunks
+
+ENTITY_KINDS = ("email", "url", "hashtag", "mention")
+
+# Alternatives are tried in order at each position: emails before
+# mentions (both contain "@") and URLs before hashtags (fragments)
+_ENTITY_PATTERNS = {
+    "email": EMAIL_PATTERN,
+    "url": URL_PATTERN,
+    "hashtag": r"#\w+",
+    "mention": r"(?<!\w)@\w+",
+}
+
+
+class Entity(NamedTuple):
+    """Typed span of an entity found in a text."""
+
+    kind: str
+    start: int
+    end: int
+
+    def text(self, source: str | Document) -> str:
+        """
+        Get the entity text from the scanned source.
+
+        Args:
+            source: The text or Document the entity was found in
+
+        Returns:
+            The matched substring
+        """
+        return as_document(source).text[self.start : self.end]
+
+
+class EntityScanner:
+    """
+    Finds several kinds of entities with one scan over the text.
+
+    All patterns are combined into a single compiled regular expression,
+    so the text is traversed once regardless of how many kinds are
+    requested. Matches are returned as offsets, not copied strings.
+    """
+
+    def __init__(self, kinds: Iterable[str] = ENTITY_KINDS):
+        """
+        Compile a scanner for the requested entity kinds.
+
+        Args:
+            kinds: Entity kinds to find (default: all of ENTITY_KINDS)
+
+        Raises:
+            ValueError: If an unknown kind is requested.
+        """
+        self.kinds = tuple(kinds)
+        unknown = set(self.kinds) - set(_ENTITY_PATTERNS)
+        if unknown:
+            raise ValueError(f"Unknown entity kinds: {sorted(unknown)}")
+        self._pattern = re.compile(
+            "|".join(
+                f"(?P<{kind}>{pattern})"
+                for kind, pattern in _ENTITY_PATTERNS.items()
+                if kind in self.kinds
+            )
+        )
+
+    def scan(self, text: str | Document, offset: int = 0) -> Iterator[Entity]:
+        """
+        Lazily find entities in a text.
+
+        Args:
+            text: The input text or Document
+            offset: Value added to every reported position (default: 0)
+
+        Yields:
+            Entities in order of appearance
+        """
+        for match in self._pattern.finditer(as_document(text).text):
+            start, end = match.span()
+            yield Entity(match.lastgroup or "", start + offset, end + offset)
+
+    def scan_stream(
+        self, stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[tuple[Entity, str]]:
+        """
+        Find entities in a text stream chunk by chunk.
+
+        None of the entity kinds contain whitespace, so chunks cut on
+        whitespace never split an entity. Since the source text is not
+        kept, each entity is yielded together with its text.
+
+        Args:
+            stream: Text stream to read
+            chunk_size: Number of characters to read at a time
+
+        Yields:
+            (entity, matched text) tuples with positions in the stream
+        """
+        offset = 0
+        for chunk in iter_word_chunks(stream, chunk_size):
+            for entity in self.scan(chunk, offset):
+                yield entity, chunk[entity.start - offset : entity.end - offset]
+            offset += len(chunk)
+
+    def count(self, text: str | Document) -> dict[str, int]:
+        """
+        Count entities of each kind.
+
+        Args:
+            text: The input text or Document
+
+        Returns:
+            Dictionary mapping every scanned kind to its number of matches
+        """
+        counts = Counter(entity.kind for entity in self.scan(text))
+        return {kind: counts[kind] for kind in self.kinds}
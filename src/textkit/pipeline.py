@@ -0,0 +1,142 @@
+"""Compiled, line-oriented text transform pipelines."""
+
+import json
+from collections.abc import Callable, Iterable
+from typing import TextIO
+
+from textkit.transformers import Replacer, slugify, truncate
+
+Step = Callable[[str], str]
+
+
+def _no_argument(name: str, func: Step) -> Callable[[str | None], Step]:
+    def build(arg: str | None) -> Step:
+        if arg is not None:
+            raise ValueError(f"Step '{name}' takes no argument")
+        return func
+
+    return build
+
+
+def _truncate_step(arg: str | None) -> Step:
+    if arg is None or not arg.isdigit():
+        raise ValueError("Step 'truncate' needs a length, e.g. truncate:80")
+    length = int(arg)
+    if length < 5:
+        raise ValueError("Length must be at least 5")
+    return lambda text: truncate(text, length)
+
+
+def _replace_step(arg: str | None) -> Step:
+    if not arg:
+        raise ValueError(
+            "Step 'replace' needs a JSON file, e.g. replace:map.json"
+        )
+    with open(arg, encoding="utf-8") as f:
+        replacements = json.load(f)
+    if not isinstance(replacements, dict) or not all(
+        isinstance(v, str) for v in replacements.values()
+    ):
+        raise ValueError(f"{arg} must hold a JSON object of strings")
+    return Replacer(replacements).replace
+
+
+# Step name -> factory compiling the step from its optional argument
+STEPS: dict[str, Callable[[str | None], Step]] = {
+    "lower": _no_argument("lower", str.lower),
+    "upper": _no_argument("upper", str.upper),
+    "strip": _no_argument("strip", str.strip),
+    "slugify": _no_argument("slugify", slugify),
+    "truncate": _truncate_step,
+    "replace": _replace_step,
+}
+
+
+class Pipeline:
+    """
+    Chain of transform steps compiled once and applied line by line.
+
+    Pipelines are written as ``"lower|replace:map.json|slugify|truncate:80"``:
+    steps separated by "|", each optionally followed by ":" and an
+    argument. Replacement tables are loaded and compiled when the
+    pipeline is parsed, not per line.
+    """
+
+    def __init__(self, steps: Iterable[Step]):
+        """
+        Initialize a pipeline from compiled steps.
+
+        Args:
+            steps: Functions applied in order to each line
+        """
+        self.steps = tuple(steps)
+
+    @classmethod
+    def parse(cls, spec: str) -> "Pipeline":
+        """
+        Compile a pipeline specification.
+
+        Args:
+            spec: Steps separated by "|", such as "lower|truncate:80"
+
+        Returns:
+            The compiled pipeline
+
+        Raises:
+            ValueError: If a step is unknown or has an invalid argument.
+        """
+        steps = []
+        for part in spec.split("|"):
+            name, sep, arg = part.strip().partition(":")
+            factory = STEPS.get(name)
+            if factory is None:
+                raise ValueError(
+                    f"Unknown step '{name}', expected one of {sorted(STEPS)}"
+                )
+            steps.append(factory(arg if sep else None))
+        return cls(steps)
+
+    def __call__(self, text: str) -> str:
+        """
+        Apply the pipeline to one piece of text.
+
+        Args:
+            text: The input text
+
+        Returns:
+            Transformed text
+        """
+        for step in self.steps:
+            text = step(text)
+        return text
+
+    def run(
+        self, lines: Iterable[str], output: TextIO, buffer_lines: int = 4096
+    ) -> int:
+        """
+        Transform a stream line by line.
+
+        Line endings are removed before the steps run and written back
+        afterwards. Output lines are collected and written in blocks to
+        keep the number of write calls low.
+
+        Args:
+            lines: Input lines, such as an open file
+            output: Stream to write the transformed lines to
+            buffer_lines: Number of lines per write
+
+        Returns:
+            Number of lines processed
+        """
+        apply = self.__call__
+        buffer: list[str] = []
+        count = 0
+        for line in lines:
+            body = line.rstrip("\r\n")
+            buffer.append(apply(body) + line[len(body) :])
+            if len(buffer) >= buffer_lines:
+                output.write("".join(buffer))
+                count += len(buffer)
+                buffer.clear()
+        output.write("".join(buffer))
+        return count + len(buffer)
@@ -0,0 +1,221 @@
+"""Streaming redaction of email addresses and credit card numbers."""
+
+import re
+from collections.abc import Iterator
+from typing import TextIO
+
+from dataval.analyzer import is_credit_card
+from textkit.streaming import DEFAULT_CHUNK_SIZE
+
+# Bounded variant of the email pattern, so that a match never reaches
+# more than _LOCAL_MAX characters before or _DOMAIN_MAX after its "@"
+_LOCAL_MAX = 64
+_DOMAIN_MAX = 252 + 1 + 24
+_EMAIL_RE = re.compile(
+    rf"[a-zA-Z0-9._%+-]{{1,{_LOCAL_MAX}}}@"
+    r"[a-zA-Z0-9.-]{1,252}\.[a-zA-Z]{2,24}"
+)
+# 13-19 digits, optionally grouped with single spaces or hyphens. The
+# pattern starts with \d (lookbehind second) so the regex engine can skip
+# quickly to the next digit
+_CARD_RE = re.compile(r"\d(?<![\d-].)(?:[ -]?\d){12,18}(?!\d)")
+_MAX_MATCH = _LOCAL_MAX + 1 + _DOMAIN_MAX
+# Card numbers only contain digits and separators, so they lie within a
+# run of at least 13 such characters. Marking those characters lets
+# str.find skip text without any such run, which is most of a log line
+_CARD_CHARS = str.maketrans(dict.fromkeys("0123456789 -", "#"))
+_CARD_RUN = "#" * 13
+_CARD_RUN_END = re.compile("[^#]")
+
+
+def _card_marks(text: str) -> str:
+    """Translate text with _CARD_CHARS, keeping offsets."""
+    if not text.isascii():
+        # str.translate is much faster on ASCII; "?" keeps one offset per
+        # replaced character
+        text = text.encode("ascii", "replace").decode("ascii")
+    return text.translate(_CARD_CHARS)
+
+
+class Redactor:
+    """
+    Masks email addresses and Luhn-valid card numbers in text.
+
+    Digit runs are only masked when they pass the same Luhn check as
+    dataval's is_credit_card, so order numbers and timestamps survive.
+    """
+
+    def __init__(
+        self,
+        email_mask: str | None = "[EMAIL]",
+        card_mask: str | None = "[CARD]",
+    ):
+        """
+        Initialize a redactor.
+
+        Args:
+            email_mask: Replacement for emails, or None to keep them
+            card_mask: Replacement for card numbers, or None to keep them
+
+        Raises:
+            ValueError: If both masks are None.
+        """
+        if email_mask is None and card_mask is None:
+            raise ValueError("Nothing to redact")
+        self.email_mask = email_mask
+        self.card_mask = card_mask
+        self.emails = 0
+        self.cards = 0
+
+    def redact(self, text: str) -> str:
+        """
+        Redact a complete text.
+
+        Args:
+            text: The input text
+
+        Returns:
+            Text with the sensitive values masked
+        """
+        return "".join(self._redact(text, 0, len(text), len(text))[0])
+
+    def _next_email(self, buffer: str, pos: int, end: int) -> re.Match | None:
+        """
+        Find the leftmost email in buffer[pos:end].
+
+        Instead of trying the pattern at every position, jump from one
+        "@" to the next and only search the few characters around it.
+        """
+        at = buffer.find("@", pos, end)
+        while at != -1:
+            match = _EMAIL_RE.search(
+                buffer,
+                max(pos, at - _LOCAL_MAX),
+                min(end, at + _DOMAIN_MAX + 1),
+            )
+            # A match starting after this "@" belongs to a later one and
+            # may have been cut short by the search window
+            if match is not None and match.start() <= at:
+                return match
+            at = buffer.find("@", at + 1, end)
+        return None
+
+    @staticmethod
+    def _next_card(
+        buffer: str, marks: str, pos: int, end: int
+    ) -> re.Match | None:
+        """
+        Find the leftmost card-like digit run in buffer[pos:end].
+
+        marks is buffer translated with _CARD_CHARS; the pattern is only
+        tried within runs of marked characters long enough for a card.
+        """
+        run = marks.find(_CARD_RUN, pos, end)
+        while run != -1:
+            stop = _CARD_RUN_END.search(marks, run, end)
+            run_end = end if stop is None else stop.start()
+            match = _CARD_RE.search(buffer, run, run_end)
+            if match is not None:
+                return match
+            run = marks.find(_CARD_RUN, run_end, end)
+        return None
+
+    def _matches(
+        self, buffer: str, pos: int, end: int
+    ) -> Iterator[tuple[str, re.Match]]:
+        """
+        Yield non-overlapping (kind, match) pairs from left to right.
+
+        At equal positions emails take precedence over card numbers.
+        """
+        email = card = None
+        emails_left = self.email_mask is not None
+        cards_left = self.card_mask is not None
+        marks = _card_marks(buffer) if cards_left else ""
+        while True:
+            if emails_left and (email is None or email.start() < pos):
+                email = self._next_email(buffer, pos, end)
+                emails_left = email is not None
+            if cards_left and (card is None or card.start() < pos):
+                card = self._next_card(buffer, marks, pos, end)
+                cards_left = card is not None
+            if emails_left and email is not None and (
+                not cards_left or card is None or email.start() <= card.start()
+            ):
+                yield "email", email
+                pos = email.end()
+            elif cards_left and card is not None:
+                yield "card", card
+                pos = card.end()
+            else:
+                return
+
+    def _redact(
+        self, buffer: str, pos: int, safe: int, end: int
+    ) -> tuple[list[str], int]:
+        """
+        Redact buffer[pos:end] up to a safe cut point.
+
+        Matches starting at or after ``safe`` are left for the next call,
+        since more input could still extend them.
+
+        Returns:
+            Output pieces and the offset up to which buffer was consumed
+        """
+        pieces = []
+        last = pos
+        for kind, match in self._matches(buffer, pos, end):
+            start = match.start()
+            if start >= safe:
+                break
+            if kind == "email":
+                self.emails += 1
+                replacement = self.email_mask
+            elif is_credit_card(match.group()):
+                self.cards += 1
+                replacement = self.card_mask
+            elif match.end() > safe:
+                # Unmasked digits crossing the cut: rescan them next time
+                safe = start
+                break
+            else:
+                continue
+            pieces.append(buffer[last:start])
+            pieces.append(replacement or "")
+            last = match.end()
+        cut = max(last, safe)
+        pieces.append(buffer[last:cut])
+        return pieces, cut
+
+    def redact_stream(
+        self, stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[str]:
+        """
+        Redact a text stream chunk by chunk.
+
+        The last few hundred characters of each chunk are held back and
+        rescanned with the next chunk, so values crossing a chunk boundary
+        are still found. One character of already emitted text is kept
+        as context for the boundary checks of the patterns.
+
+        Args:
+            stream: Text stream to read
+            chunk_size: Number of characters to read at a time
+
+        Yields:
+            Redacted text pieces; their concatenation is the full output
+        """
+        buffer = ""
+        pos = 0
+        while chunk := stream.read(chunk_size):
+            buffer += chunk
+            safe = len(buffer) - _MAX_MATCH - 1
+            if safe <= pos:
+                continue
+            pieces, cut = self._redact(buffer, pos, safe, len(buffer))
+            yield "".join(pieces)
+            keep = max(cut - 1, 0)
+            buffer = buffer[keep:]
+            pos = cut - keep
+        pieces, _ = self._redact(buffer, pos, len(buffer), len(buffer))
+        yield "".join(pieces)
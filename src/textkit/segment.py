@@ -0,0 +1,120 @@
+"""Offset-based sentence segmentation."""
+
+import re
+from collections.abc import Iterator
+
+# Lowercased abbreviations (without their final period) that do not end
+# a sentence when followed by more text
+# fmt: off
+ABBREVIATIONS = frozenset(
+    {
+        "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "mt", "vs",
+        "etc", "inc", "ltd", "co", "corp", "dept", "vol", "fig",
+        "approx", "est", "jan", "feb", "mar", "apr", "jun", "jul", "aug",
+        "sep", "sept", "oct", "nov", "dec", "e.g", "i.e", "cf", "al",
+    }
+)
+# fmt: on
+# Abbreviations that only precede a number, as in "No. 5"
+NUMBER_ABBREVIATIONS = frozenset({"no"})
+
+# A run of terminators plus closing quotes or brackets, followed by
+# whitespace or the end of the text. "3.14" never matches, since the
+# period is followed by a digit.
+_TERMINATOR = re.compile(r"[.!?]+[\"')\]”’]*(?=\s|\Z)")
+# Initials and dotted acronyms such as "J", "U.S" or "p.m"
+_INITIALISM = re.compile(r"[A-Z]|[A-Za-z](?:\.[A-Za-z])+")
+_NON_SPACE = re.compile(r"\S")
+# Longest word inspected before a period
+_WORD_MAX = 16
+
+
+def _is_abbreviation(text: str, period: int, following: int) -> bool:
+    """
+    Check whether the period at text[period] ends an abbreviation.
+
+    following is the offset of the next non-space character.
+    """
+    before = text[max(0, period - _WORD_MAX) : period]
+    if not before or before[-1].isspace():
+        return False
+    word = before.split()[-1].lstrip("\"'([“‘")
+    lowered = word.lower()
+    if lowered in NUMBER_ABBREVIATIONS:
+        return text[following].isdigit()
+    return (
+        lowered in ABBREVIATIONS
+        or _INITIALISM.fullmatch(word) is not None
+    )
+
+
+def sentence_ends(text: str) -> Iterator[int]:
+    """
+    Lazily find the end offsets of the terminated sentences of a text.
+
+    A sentence ends after a run of ".", "!" or "?" (and any closing
+    quotes or brackets) that is followed by whitespace or the end of the
+    text. A single period after an abbreviation or initial only ends a
+    sentence when no more text follows it.
+
+    Args:
+        text: The input text
+
+    Yields:
+        Offset just past each sentence terminator
+    """
+    for match in _TERMINATOR.finditer(text):
+        start, end = match.span()
+        if (
+            text[start] == "."
+            and text[start + 1 : start + 2] != "."
+            and (following := _NON_SPACE.search(text, end)) is not None
+            and _is_abbreviation(text, start, following.start())
+        ):
+            continue
+        yield end
+
+
+def open_tail(text: str, pos: int = 0) -> tuple[int, int] | None:
+    """
+    Find the text after the last terminated sentence.
+
+    Args:
+        text: The input text
+        pos: Offset just past the last sentence end (default: 0)
+
+    Returns:
+        (start, end) offsets of the unterminated tail without surrounding
+        whitespace, or None if only whitespace follows pos
+    """
+    match = _NON_SPACE.search(text, pos)
+    if match is None:
+        return None
+    end = len(text)
+    while text[end - 1].isspace():
+        end -= 1
+    return match.start(), end
+
+
+def sentence_spans(text: str, tail: bool = True) -> Iterator[tuple[int, int]]:
+    """
+    Lazily segment a text into sentences.
+
+    Spans exclude surrounding whitespace.
+
+    Args:
+        text: The input text
+        tail: Whether to report trailing text without a terminator as a
+            final sentence (default: True)
+
+    Yields:
+        (start, end) offsets of each sentence
+    """
+    pos = 0
+    for end in sentence_ends(text):
+        match = _NON_SPACE.search(text, pos, end)
+        if match is not None:
+            yield match.start(), end
+        pos = end
+    if tail and (span := open_tail(text, pos)) is not None:
+        yield span
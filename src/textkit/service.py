@@ -0,0 +1,408 @@
+"""HTTP service exposing the text and validation utilities."""
+
+import asyncio
+import time
+from collections import defaultdict, deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache, partial
+from typing import Any, Literal
+
+from fastapi import FastAPI, HTTPException, Request, Response
+from pydantic import BaseModel
+from pydantic import Field as ModelField
+
+from dataval.registry import REGISTRY
+from dataval.validation.summarizer import Field, Schema
+from textkit.batch import process_document
+from textkit.entities import ENTITY_KINDS, EntityScanner
+
+FIELD_TYPES: dict[str, type] = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "list": list,
+    "dict": dict,
+    "object": object,
+}
+
+
+class AnalyzeRequest(BaseModel):
+    """Body of /analyze."""
+
+    text: str
+    top: int = ModelField(10, ge=0)
+
+
+class TransformRequest(BaseModel):
+    """Body of /transform."""
+
+    text: str
+    slugify: bool = False
+    truncate: int | None = ModelField(None, gt=0)
+
+
+class SummarizeRequest(BaseModel):
+    """Body of /summarize."""
+
+    text: str
+    sentences: int = ModelField(3, gt=0)
+    method: Literal["lead", "tfidf", "textrank"] = "lead"
+
+
+class ExtractRequest(BaseModel):
+    """Body of /extract."""
+
+    text: str
+    kinds: list[Literal[ENTITY_KINDS]] | None = None  # type: ignore[valid-type]
+
+
+class ValidateRequest(BaseModel):
+    """Body of /validate."""
+
+    value: str
+    validator: str
+
+
+class FieldSpec(BaseModel):
+    """JSON description of a schema Field."""
+
+    type: Literal["str", "int", "float", "bool", "list", "dict", "object"]
+    required: bool = True
+    validators: list[str] = []
+
+
+class SchemaValidateRequest(BaseModel):
+    """Body of /schema/validate."""
+
+    fields: dict[str, FieldSpec]
+    data: dict[str, Any]
+
+
+@lru_cache(maxsize=64)
+def _scanner(kinds: tuple[str, ...]) -> EntityScanner:
+    return EntityScanner(kinds)
+
+
+def run_requests(
+    items: list[tuple[str, str, dict[str, Any]]],
+) -> list[dict[str, Any]]:
+    """
+    Process a batch of (operation, text, options) requests.
+
+    Runs in a worker process, so it must stay importable at module level.
+
+    Args:
+        items: Requests; operations are those of textkit.batch plus
+            "extract" (option ``kinds``)
+
+    Returns:
+        One ``{"result": ...}`` or ``{"error": message, "status": code}``
+        per request; a missing optional dependency is reported with
+        status 501 for that request only
+    """
+    results = []
+    for op, text, options in items:
+        try:
+            if op == "extract":
+                scanner = _scanner(tuple(options.get("kinds") or ENTITY_KINDS))
+                found = [
+                    {**entity._asdict(), "text": entity.text(text)}
+                    for entity in scanner.scan(text)
+                ]
+                counts = dict.fromkeys(scanner.kinds, 0)
+                for entity in found:
+                    counts[entity["kind"]] += 1
+                result: Any = {"entities": found, "counts": counts}
+            else:
+                result = process_document(op, text, options)
+        except ValueError as e:
+            results.append({"error": str(e), "status": 422})
+        except ImportError as e:
+            results.append({"error": str(e), "status": 501})
+        else:
+            results.append({"result": result})
+    return results
+
+
+class MicroBatcher:
+    """
+    Merges concurrent small requests into one batched call.
+
+    Requests arriving within ``max_delay`` seconds of each other, up to
+    ``max_batch`` of them, are handed to ``func`` as a single list, which
+    runs on an executor so the event loop stays responsive.
+    """
+
+    def __init__(
+        self,
+        func: Callable[[list[Any]], list[Any]],
+        max_batch: int = 64,
+        max_delay: float = 0.002,
+        executor: Executor | None = None,
+    ):
+        """
+        Initialize a batcher.
+
+        Args:
+            func: Function mapping a list of items to a list of results
+            max_batch: Maximum number of items per call
+            max_delay: Seconds to wait for more items before a call
+            executor: Executor running func (default: the loop's default
+                thread pool)
+
+        Raises:
+            ValueError: If max_batch is not positive.
+        """
+        if max_batch <= 0:
+            raise ValueError("max_batch must be positive")
+        self.func = func
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.executor = executor
+        self.batches = 0
+        self.items = 0
+        self._pending: list[tuple[Any, asyncio.Future[Any]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Queue an item and wait for its result.
+
+        Args:
+            item: Item to process
+
+        Returns:
+            The result of func for this item
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        self.batches += 1
+        self.items += len(batch)
+        done = asyncio.get_running_loop().run_in_executor(
+            self.executor, self.func, [item for item, _ in batch]
+        )
+        done.add_done_callback(partial(self._resolve, batch))
+
+    @staticmethod
+    def _resolve(
+        batch: list[tuple[Any, asyncio.Future[Any]]],
+        done: asyncio.Future[Any],
+    ) -> None:
+        """Pass the outcome of a batch call on to each of its callers."""
+        waiting = [future for _, future in batch if not future.done()]
+        if done.cancelled():
+            for future in waiting:
+                future.cancel()
+            return
+        error = done.exception()
+        if error is None:
+            results = list(done.result())
+            if len(results) != len(batch):
+                error = ValueError(
+                    f"Batch of {len(batch)} items returned "
+                    f"{len(results)} results"
+                )
+        if error is not None:
+            for future in waiting:
+                future.set_exception(error)
+            return
+        for (_, future), result in zip(batch, results, strict=True):
+            if not future.done():
+                future.set_result(result)
+
+
+class LatencyRecorder:
+    """Keeps recent request latencies per route and reports percentiles."""
+
+    def __init__(self, window: int = 10_000):
+        """
+        Initialize the recorder.
+
+        Args:
+            window: Number of recent samples kept per route
+        """
+        self.window = window
+        self.counts: dict[str, int] = defaultdict(int)
+        self._samples: dict[str, deque[float]] = defaultdict(
+            lambda: deque(maxlen=self.window)
+        )
+
+    def record(self, route: str, seconds: float) -> None:
+        """
+        Record one request.
+
+        Args:
+            route: Request path
+            seconds: Latency of the request
+        """
+        self.counts[route] += 1
+        self._samples[route].append(seconds)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """
+        Summarize the recorded latencies.
+
+        Returns:
+            Per route: request count and p50/p99 latency in milliseconds
+        """
+        summary = {}
+        for route, samples in self._samples.items():
+            ordered = sorted(samples)
+            summary[route] = {
+                "count": self.counts[route],
+                "p50_ms": round(_percentile(ordered, 0.50) * 1000, 3),
+                "p99_ms": round(_percentile(ordered, 0.99) * 1000, 3),
+            }
+        return summary
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """Nearest-rank percentile of sorted samples."""
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def build_schema(fields: dict[str, FieldSpec]) -> Schema:
+    """
+    Build a dataval Schema from its JSON description.
+
+    Args:
+        fields: Field specifications keyed by field name
+
+    Returns:
+        The schema
+
+    Raises:
+        ValueError: If a validator name is unknown.
+    """
+    schema_fields = {}
+    for name, spec in fields.items():
+        unknown = [v for v in spec.validators if v not in REGISTRY]
+        if unknown:
+            raise ValueError(f"Unknown validators for {name}: {unknown}")
+        schema_fields[name] = Field(
+            FIELD_TYPES[spec.type],
+            required=spec.required,
+            validators=list(spec.validators),
+        )
+    return Schema(schema_fields)
+
+
+def create_app(
+    executor: Executor | None = None,
+    workers: int | None = None,
+    max_batch: int = 64,
+    max_delay: float = 0.002,
+) -> FastAPI:
+    """
+    Create the HTTP application.
+
+    Text operations are micro-batched and run on a process pool; the
+    cheap validation endpoints run inline.
+
+    Args:
+        executor: Executor for the text operations (default: a process
+            pool created at startup and shut down with the app)
+        workers: Size of the default process pool (default: CPU count)
+        max_batch: Maximum number of requests merged into one call
+        max_delay: Seconds to wait for more requests to merge
+
+    Returns:
+        The FastAPI application
+    """
+    batcher = MicroBatcher(run_requests, max_batch, max_delay, executor)
+    latencies = LatencyRecorder()
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        if executor is not None:
+            yield
+            return
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            batcher.executor = pool
+            yield
+
+    app = FastAPI(title="textkit", lifespan=lifespan)
+
+    @app.middleware("http")
+    async def record_latency(
+        request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        start = time.perf_counter()
+        response = await call_next(request)
+        latencies.record(request.url.path, time.perf_counter() - start)
+        return response
+
+    async def run(op: str, text: str, **options: Any) -> Any:
+        outcome = await batcher.submit((op, text, options))
+        if "error" in outcome:
+            raise HTTPException(
+                status_code=outcome["status"], detail=outcome["error"]
+            )
+        return outcome["result"]
+
+    @app.post("/analyze")
+    async def analyze(body: AnalyzeRequest) -> Any:
+        return await run("analyze", body.text, top=body.top)
+
+    @app.post("/transform")
+    async def transform(body: TransformRequest) -> Any:
+        return await run(
+            "transform", body.text, slugify=body.slugify, truncate=body.truncate
+        )
+
+    @app.post("/summarize")
+    async def summarize(body: SummarizeRequest) -> Any:
+        return await run(
+            "summarize", body.text, sentences=body.sentences, method=body.method
+        )
+
+    @app.post("/extract")
+    async def extract(body: ExtractRequest) -> Any:
+        return await run("extract", body.text, kinds=body.kinds)
+
+    @app.post("/validate")
+    async def validate(body: ValidateRequest) -> dict[str, bool]:
+        try:
+            validator = REGISTRY.get(body.validator)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e)) from e
+        return {"valid": validator(body.value)}
+
+    @app.post("/schema/validate")
+    async def schema_validate(body: SchemaValidateRequest) -> dict[str, Any]:
+        try:
+            schema = build_schema(body.fields)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e)) from e
+        errors = schema.validate(body.data)
+        return {"valid": not errors, "errors": errors}
+
+    @app.get("/metrics")
+    async def metrics() -> dict[str, Any]:
+        return {
+            "latency": latencies.summary(),
+            "batching": {
+                "batches": batcher.batches,
+                "requests": batcher.items,
+            },
+            "validators": REGISTRY.stats(),
+        }
+
+    return app
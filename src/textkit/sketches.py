@@ -0,0 +1,36 @@
+"""Bounded-memory frequency and cardinality sketches for text."""
+
+from collections.abc import Iterable
+from itertools import islice
+
+# The sketches are generic and live in dataval; they are re-exported
+# here for text code
+from dataval.sketches import HyperLogLog, SpaceSaving, stable_hash64
+
+__all__ = ["HyperLogLog", "SpaceSaving", "approx_top_words", "stable_hash64"]
+
+BATCH_SIZE = 1 << 16
+
+
+def approx_top_words(
+    words: Iterable[str], n: int = 10, capacity: int = 1000
+) -> list[tuple[str, int]]:
+    """
+    Get approximate top N words using a fixed-size Space-Saving summary.
+
+    Words are consumed in batches, so memory stays bounded by the batch
+    size plus the summary capacity.
+
+    Args:
+        words: Words to count
+        n: Number of top words to return (default: 10)
+        capacity: Maximum number of tracked words (default: 1000)
+
+    Returns:
+        List of (word, estimated frequency) tuples for the top N words
+    """
+    summary = SpaceSaving(capacity)
+    iterator = iter(words)
+    while batch := list(islice(iterator, BATCH_SIZE)):
+        summary.update(batch)
+    return summary.top(n)
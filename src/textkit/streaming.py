@@ -0,0 +1,317 @@
+"""Chunked text analysis for inputs larger than memory."""
+
+import re
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any, TextIO
+
+from dataval.instrument import timed
+from textkit.document import Document, as_document
+from textkit.segment import open_tail, sentence_spans
+from textkit.sketches import HyperLogLog, SpaceSaving
+from textkit.validators import sentence_count
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+MAX_WORD_LENGTH = 1 << 16
+# Greedily finds the last whitespace run before more text that does not
+# follow a sentence terminator, closing quote or bracket
+_CHUNK_END = re.compile(r".*[^\s.!?\"')\]”’]\s+(?=\S)", re.DOTALL)
+
+
+@dataclass
+class TextStats:
+    """Mergeable partial result of a text analysis."""
+
+    word_count: int = 0
+    char_count: int = 0
+    sentence_count: int = 0
+    word_length_total: int = 0
+    frequencies: Counter[str] = field(default_factory=Counter)
+
+    @classmethod
+    def from_text(cls, text: str | Document) -> "TextStats":
+        """
+        Build statistics for a complete piece of text.
+
+        Args:
+            text: The input text or Document
+
+        Returns:
+            Statistics for the text
+        """
+        stats = cls()
+        stats.add(text)
+        return stats
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TextStats":
+        """
+        Rebuild statistics from the output of to_dict().
+
+        Args:
+            data: Dictionary produced by to_dict()
+
+        Returns:
+            The rebuilt statistics
+        """
+        return cls(
+            word_count=data["word_count"],
+            char_count=data["char_count"],
+            sentence_count=data["sentence_count"],
+            word_length_total=data["word_length_total"],
+            frequencies=Counter(data["frequencies"]),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the statistics to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary of the counters and word frequencies
+        """
+        return {
+            "word_count": self.word_count,
+            "char_count": self.char_count,
+            "sentence_count": self.sentence_count,
+            "word_length_total": self.word_length_total,
+            "frequencies": dict(self.frequencies),
+        }
+
+    @timed
+    def add(self, text: str | Document) -> None:
+        """
+        Add a piece of text that does not split any word.
+
+        Args:
+            text: The input text or Document
+        """
+        doc = as_document(text)
+        self.word_count += len(doc.tokens)
+        self.char_count += len(doc)
+        self.sentence_count += sentence_count(doc)
+        self.word_length_total += sum(len(word) for word in doc.lower_tokens)
+        self._add_frequencies(doc)
+
+    def _add_frequencies(self, doc: Document) -> None:
+        self.frequencies.update(doc.frequencies)
+
+    def merge(self, other: "TextStats") -> "TextStats":
+        """
+        Merge another partial result into this one.
+
+        Args:
+            other: Statistics to merge
+
+        Returns:
+            This object, for chaining
+        """
+        self.word_count += other.word_count
+        self.char_count += other.char_count
+        self.sentence_count += other.sentence_count
+        self.word_length_total += other.word_length_total
+        self._merge_frequencies(other)
+        return self
+
+    def _merge_frequencies(self, other: "TextStats") -> None:
+        self.frequencies.update(other.frequencies)
+
+    @property
+    def average_word_length(self) -> float:
+        """Average length of the lowercased words."""
+        if not self.word_count:
+            return 0.0
+        return self.word_length_total / self.word_count
+
+    @timed
+    def top_words(self, n: int = 10) -> list[tuple[str, int]]:
+        """
+        Get the top N most frequent words.
+
+        Args:
+            n: Number of top words to return (default: 10)
+
+        Returns:
+            List of (word, frequency) tuples for the top N words
+        """
+        return self.frequencies.most_common(n)
+
+    @property
+    def distinct_words(self) -> int:
+        """Number of distinct words."""
+        return len(self.frequencies)
+
+
+@dataclass
+class ApproxTextStats(TextStats):
+    """
+    Mergeable partial result that counts words with fixed-size sketches.
+
+    Top words come from a Space-Saving summary and the distinct word count
+    from a HyperLogLog estimate, so memory does not grow with the
+    vocabulary. See textkit.sketches for the error bounds.
+    """
+
+    capacity: int = 1000
+    top: SpaceSaving = field(init=False)
+    distinct: HyperLogLog = field(default_factory=HyperLogLog)
+
+    def __post_init__(self) -> None:
+        """Create the top-k summary with the configured capacity."""
+        self.top = SpaceSaving(self.capacity)
+
+    def _add_frequencies(self, doc: Document) -> None:
+        self.top.update_counts(doc.frequencies)
+        self.distinct.update(doc.frequencies)
+
+    def _merge_frequencies(self, other: TextStats) -> None:
+        if not isinstance(other, ApproxTextStats):
+            raise TypeError("Can only merge ApproxTextStats together")
+        self.top.merge(other.top)
+        self.distinct.merge(other.distinct)
+
+    def top_words(self, n: int = 10) -> list[tuple[str, int]]:
+        """
+        Get the approximate top N most frequent words.
+
+        Args:
+            n: Number of top words to return (default: 10)
+
+        Returns:
+            List of (word, estimated frequency) tuples for the top N words
+        """
+        return self.top.top(n)
+
+    @property
+    def distinct_words(self) -> int:
+        """Estimated number of distinct words."""
+        return self.distinct.count()
+
+
+def iter_word_chunks(
+    stream: TextIO,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_word: int = MAX_WORD_LENGTH,
+) -> Iterator[str]:
+    """
+    Read a stream in chunks that never split a word or a sentence end.
+
+    Each chunk ends on whitespace that is followed by more text and does
+    not follow a possible sentence terminator, so whether a period ends
+    a sentence never depends on text in the next chunk. The rest of the
+    text read so far is carried over into the next chunk. Carried text
+    that grows to max_word characters is flushed as its own chunk, so
+    input without such a boundary cannot grow the carry without bound.
+
+    Args:
+        stream: Text stream to read
+        chunk_size: Number of characters to read at a time
+        max_word: Length at which carried text is flushed anyway
+
+    Yields:
+        Chunks of text ending on a word boundary (except the last one and
+        flushed overlong text)
+
+    Raises:
+        ValueError: If chunk_size or max_word is not positive.
+    """
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+    if max_word <= 0:
+        raise ValueError("Maximum word length must be positive")
+
+    carry = ""
+    while chunk := stream.read(chunk_size):
+        buffer = carry + chunk
+        # The carry holds no boundary, except one running into the chunk
+        cut = _CHUNK_END.match(buffer, max(0, len(carry.rstrip()) - 1))
+        if cut is None:
+            carry = buffer
+        else:
+            yield buffer[: cut.end()]
+            carry = buffer[cut.end() :]
+        if len(carry) >= max_word:
+            yield carry
+            carry = ""
+    if carry:
+        yield carry
+
+
+def iter_sentence_spans(
+    stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[tuple[int, int]]:
+    """
+    Segment a text stream into sentences without holding it in memory.
+
+    Chunks never end right after a terminator, so every terminator is
+    seen with the words around it; the spans match sentence_spans() on
+    the full text.
+
+    Args:
+        stream: Text stream to read
+        chunk_size: Number of characters to read at a time
+
+    Yields:
+        (start, end) offsets of each sentence in the stream
+    """
+    offset = 0
+    # Start of a sentence continued from an earlier chunk
+    start: int | None = None
+    end = 0
+    for chunk in iter_word_chunks(stream, chunk_size):
+        pos = 0
+        for span_start, pos in sentence_spans(chunk, tail=False):
+            if start is None:
+                start = offset + span_start
+            yield start, offset + pos
+            start = None
+        if (span := open_tail(chunk, pos)) is not None:
+            if start is None:
+                start = offset + span[0]
+            end = offset + span[1]
+        offset += len(chunk)
+    if start is not None:
+        yield start, end
+
+
+def new_stats(approx_capacity: int | None = None) -> TextStats:
+    """
+    Create an empty statistics accumulator.
+
+    Args:
+        approx_capacity: Count words with sketches tracking at most this
+            many words (default: exact counts)
+
+    Returns:
+        An exact TextStats or a sketch-based ApproxTextStats
+    """
+    if approx_capacity is None:
+        return TextStats()
+    return ApproxTextStats(capacity=approx_capacity)
+
+
+@timed
+def analyze_stream(
+    stream: TextIO,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    approx_capacity: int | None = None,
+) -> TextStats:
+    """
+    Analyze a text stream chunk by chunk.
+
+    Peak memory is bounded by the chunk size plus the vocabulary size, or
+    by the chunk size plus a fixed sketch size with approx_capacity.
+
+    Args:
+        stream: Text stream to read
+        chunk_size: Number of characters to read at a time
+        approx_capacity: Count words with sketches tracking at most this
+            many words (default: exact counts)
+
+    Returns:
+        Statistics for the whole stream
+    """
+    stats = new_stats(approx_capacity)
+    for chunk in iter_word_chunks(stream, chunk_size):
+        stats.add(chunk)
+    return stats
@@ -1,6 +1,14 @@
 """Text transformation utilities."""
 
 import re
+from collections import deque
+
+from dataval.analyzer import EMAIL_PATTERN
+from dataval.instrument import timed
+
+# Runs of characters that are not allowed in a slug
+_SLUG_SEPARATORS = re.compile(r"[^a-z0-9]+")
+_EMAILS = re.compile(EMAIL_PATTERN)
 
 
 def slugify(text: str) -> str:
@@ -13,12 +21,8 @@ def slugify(text: str) -> str:
     Returns:
         Slugified text
     """
-    text = text.lower()
-    # Replace all non-alphanumeric characters with spaces
-    text = re.sub(r"[^a-z0-9]", " ", text)
-    # Replace consecutive spaces with a single hyphen
-    text = re.sub(r"\s+", "-", text)
-    return text.strip("-")
+    # Replace each run of non-alphanumeric characters with a single hyphen
+    return _SLUG_SEPARATORS.sub("-", text.lower()).strip("-")
 
 
 def truncate(text: str, length: int = 100, suffix: str = "...") -> str:
@@ -44,10 +48,132 @@ def truncate(text: str, length: int = 100, suffix: str = "...") -> str:
     return text[: length - len(suffix)] + suffix
 
 
+class Replacer:
+    """
+    Compiled multi-pattern replacer built on an Aho-Corasick automaton.
+
+    The automaton is built once and can be reused for any number of
+    texts. Each text is scanned in a single pass: at every position the
+    longest matching key starting there is replaced (leftmost-longest),
+    and replaced text is never scanned again.
+    """
+
+    def __init__(self, replacements: dict[str, str]):
+        """
+        Build the automaton for a replacement table.
+
+        Args:
+            replacements: Dictionary mapping substrings to their
+                replacements (empty keys are ignored)
+        """
+        self.replacements = {k: v for k, v in replacements.items() if k}
+
+        # Trie of the keys: transitions, depth and longest key ending here
+        goto: list[dict[str, int]] = [{}]
+        depth = [0]
+        out = [0]
+        for key in self.replacements:
+            state = 0
+            for char in key:
+                nxt = goto[state].get(char)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][char] = nxt
+                    goto.append({})
+                    depth.append(depth[state] + 1)
+                    out.append(0)
+                state = nxt
+            out[state] = len(key)
+
+        # Breadth-first pass for failure links; a state without its own
+        # key inherits the longest key of its failure state
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in goto[state].items():
+                link = fail[state]
+                while link and char not in goto[link]:
+                    link = fail[link]
+                if state:
+                    fail[nxt] = goto[link].get(char, 0)
+                if not out[nxt]:
+                    out[nxt] = out[fail[nxt]]
+                queue.append(nxt)
+
+        self._goto = goto
+        self._fail = fail
+        self._depth = depth
+        self._out = out
+        # Skip ahead over characters that cannot start any key
+        self._first = (
+            re.compile("[" + "".join(map(re.escape, goto[0])) + "]")
+            if goto[0]
+            else None
+        )
+
+    def replace(self, text: str) -> str:
+        """
+        Apply the replacements to a text.
+
+        Args:
+            text: The input text
+
+        Returns:
+            Text with all replacements applied
+        """
+        if self._first is None:
+            return text
+
+        goto, fail, depth, out = self._goto, self._fail, self._depth, self._out
+        replacements = self.replacements
+        pieces: list[str] = []
+        last = 0
+        i = 0
+        n = len(text)
+        state = 0
+        best_start = best_end = -1
+        while True:
+            if i < n:
+                if not state:
+                    match = self._first.search(text, i)
+                    if match is None:
+                        break
+                    i = match.start()
+                char = text[i]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(char, 0)
+                i += 1
+                length = out[state]
+                if length and (best_start < 0 or i - length <= best_start):
+                    best_start, best_end = i - length, i
+                if best_start < 0 or i - depth[state] <= best_start:
+                    continue
+            elif best_start < 0:
+                break
+
+            # No later match can start at or before best_start: emit it and
+            # restart the scan right after the replaced text
+            pieces.append(text[last:best_start])
+            pieces.append(replacements[text[best_start:best_end]])
+            last = i = best_end
+            state = 0
+            best_start = best_end = -1
+
+        pieces.append(text[last:])
+        return "".join(pieces)
+
+
+@timed
 def replace_all(text: str, replacements: dict[str, str]) -> str:
     """
     Replace multiple substrings in text based on a dictionary.
 
+    All keys are matched in a single pass with leftmost-longest
+    semantics, so the output of one replacement is never replaced again.
+    Use Replacer directly to reuse the compiled table across calls.
+
     Args:
         text: The input text
         replacements: Dictionary mapping substrings to their replacements
@@ -55,11 +181,10 @@ def replace_all(text: str, replacements: dict[str, str]) -> str:
     Returns:
         Text with all replacements applied
     """
-    for old, new in replacements.items():
-        text = text.replace(old, new)
-    return text
+    return Replacer(replacements).replace(text)
 
 
+@timed
 def extract_emails(text: str) -> list[str]:
     """
     Extract email addresses from text.
@@ -70,5 +195,4 @@ def extract_emails(text: str) -> list[str]:
     Returns:
         List of email addresses found
     """
-    pattern = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
-    return re.findall(pattern, text)
+    return _EMAILS.findall(text)
@@ -1,65 +1,72 @@
 """Text analysis utilities."""
 
-import re
-from collections import Counter
+from dataval.instrument import timed
+from textkit.document import Document, as_document
+from textkit.segment import sentence_ends
 
 
-def word_frequency(text: str) -> dict[str, int]:
+@timed
+def word_frequency(text: str | Document) -> dict[str, int]:
     """
     Calculate word frequency in a given text, ignoring punctuation.
 
     Args:
-        text: The input text to analyze
+        text: The input text or Document to analyze
 
     Returns:
         Dictionary with words as keys and their frequency as values
     """
-    # Remove punctuation and convert to lowercase
-    text = re.sub(r"[^a-zA-Z0-9\s]", "", text).lower()
-    words = text.split()
-    return dict(Counter(words))
+    return dict(as_document(text).frequencies)
 
 
-def get_top_words(text: str, n: int = 10) -> list[tuple[str, int]]:
+@timed
+def get_top_words(
+    text: str | Document, n: int = 10
+) -> list[tuple[str, int]]:
     """
     Get the top N most frequent words.
 
     Args:
-        text: The input text to analyze
+        text: The input text or Document to analyze
         n: Number of top words to return (default: 10)
 
     Returns:
         List of (word, frequency) tuples for the top N words
     """
-    frequencies = word_frequency(text)
-    return sorted(frequencies.items(), key=lambda x: x[1], reverse=True)[:n]
+    # A bounded heap selection instead of sorting the whole vocabulary
+    return as_document(text).frequencies.most_common(n)
 
 
-def average_word_length(text: str) -> float:
+@timed
+def average_word_length(text: str | Document) -> float:
     """
     Calculate the average word length in a text.
 
     Args:
-        text: The input text to analyze
+        text: The input text or Document to analyze
 
     Returns:
         Average word length as a float
     """
-    words = text.lower().split()
+    words = as_document(text).lower_tokens
     if not words:
         return 0.0
     return sum(len(word) for word in words) / len(words)
 
 
-def sentence_count(text: str) -> int:
+@timed
+def sentence_count(text: str | Document) -> int:
     """
-    Count the number of sentences in a text.
+    Count the number of terminated sentences in a text.
+
+    Abbreviations, initials and decimal numbers do not end a sentence.
 
     Args:
-        text: The input text to analyze
+        text: The input text or Document to analyze
 
     Returns:
         Number of sentences
     """
-    # Simple heuristic: Count periods, exclamation marks, and question marks
-    return sum(1 for char in text if char in (".", "!", "?"))
+    if isinstance(text, Document):
+        return len(text.sentence_ends)
+    return sum(1 for _ in sentence_ends(text))
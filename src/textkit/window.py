@@ -0,0 +1,143 @@
+"""Sliding-window word frequencies for live text streams."""
+
+import io
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Iterator
+from typing import TextIO
+
+from textkit.document import Document
+
+
+class SlidingWindowCounter:
+    """
+    Word frequencies over the most recent lines of a stream.
+
+    The window can be bounded by a number of lines, an age in seconds, or
+    both. Adding or evicting a line only touches that line's words, so the
+    cost per line is constant regardless of the window size.
+    """
+
+    def __init__(
+        self,
+        max_lines: int | None = None,
+        max_age: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize an empty window.
+
+        Args:
+            max_lines: Maximum number of lines kept (default: unbounded)
+            max_age: Maximum age of kept lines in seconds (default:
+                unbounded)
+            clock: Function returning the current time in seconds
+
+        Raises:
+            ValueError: If a bound is not positive.
+        """
+        if max_lines is not None and max_lines <= 0:
+            raise ValueError("max_lines must be positive")
+        if max_age is not None and max_age <= 0:
+            raise ValueError("max_age must be positive")
+        self.max_lines = max_lines
+        self.max_age = max_age
+        self.clock = clock
+        self.counts: Counter[str] = Counter()
+        self._lines: deque[tuple[float, list[str]]] = deque()
+
+    def __len__(self) -> int:
+        """Return the number of lines in the window."""
+        return len(self._lines)
+
+    def add(self, line: str, now: float | None = None) -> None:
+        """
+        Add a line to the window, evicting lines that fall out of it.
+
+        Args:
+            line: Line of text to add
+            now: Timestamp of the line (default: the current clock time)
+        """
+        if now is None:
+            now = self.clock()
+        terms = Document(line).terms
+        self._lines.append((now, terms))
+        self.counts.update(terms)
+        self.evict(now)
+
+    def evict(self, now: float | None = None) -> None:
+        """
+        Remove lines that are outside the window.
+
+        Args:
+            now: Current timestamp (default: the current clock time)
+        """
+        if self.max_lines is not None:
+            while len(self._lines) > self.max_lines:
+                self._remove_oldest()
+        if self.max_age is not None:
+            cutoff = (self.clock() if now is None else now) - self.max_age
+            while self._lines and self._lines[0][0] < cutoff:
+                self._remove_oldest()
+
+    def _remove_oldest(self) -> None:
+        _, terms = self._lines.popleft()
+        counts = self.counts
+        for term in terms:
+            remaining = counts[term] - 1
+            if remaining:
+                counts[term] = remaining
+            else:
+                del counts[term]
+
+    def top_words(self, n: int = 10) -> list[tuple[str, int]]:
+        """
+        Get the top N most frequent words in the window.
+
+        Args:
+            n: Number of top words to return (default: 10)
+
+        Returns:
+            List of (word, frequency) tuples for the top N words
+        """
+        return self.counts.most_common(n)
+
+
+def follow_lines(
+    stream: TextIO, poll_interval: float = 0.5, from_start: bool = False
+) -> Iterator[str]:
+    """
+    Yield lines from a stream as they are written, like ``tail -f``.
+
+    Regular files start at their end unless from_start is set, and are
+    polled for new data once the end is reached; an empty string is
+    yielded on every idle poll so callers can refresh their output. Pipes
+    and terminals are read from the start and stop at end of input.
+
+    Args:
+        stream: Text stream to follow
+        poll_interval: Seconds to wait between polls at end of file
+        from_start: Read regular files from the beginning (default: False)
+
+    Yields:
+        Lines of text, or "" when no new data is available
+    """
+    seekable = stream.seekable()
+    if seekable and not from_start:
+        stream.seek(0, io.SEEK_END)
+    pending = ""
+    while True:
+        line = stream.readline()
+        if line.endswith("\n"):
+            yield pending + line
+            pending = ""
+        elif line:
+            # Partial line: wait for the writer to finish it
+            pending += line
+        elif seekable:
+            yield ""
+            time.sleep(poll_interval)
+        else:
+            if pending:
+                yield pending
+            return
@@ -0,0 +1,86 @@
+"""Tests for NDJSON batch processing."""
+
+import io
+import json
+import sys
+
+import pytest
+
+from textkit.batch import iter_batches, run_batch
+
+LINES = [
+    json.dumps({"id": "a", "text": "Hello World. Second sentence!"}),
+    "",
+    json.dumps("Just a string"),
+    "not json",
+    json.dumps({"id": 7}),
+]
+
+
+def _results(output: io.StringIO) -> list[dict]:
+    return [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+class TestBatch:
+    """Test suite for micro-batched document processing."""
+
+    def test_iter_batches(self):
+        """Test grouping lines and skipping blank ones."""
+        batches = list(iter_batches(["a", " ", "b", "c"], batch_size=2))
+        assert batches == [(0, ["a", "b"]), (2, ["c"])]
+        with pytest.raises(ValueError):
+            list(iter_batches([], batch_size=0))
+
+    def test_results_and_errors(self):
+        """Test per-document results, ids and error lines."""
+        output = io.StringIO()
+        count = run_batch(LINES, output, "analyze", jobs=1, batch_size=2)
+        results = _results(output)
+        assert count == 4
+        assert [r["index"] for r in results] == [0, 1, 2, 3]
+        assert results[0]["id"] == "a"
+        assert results[0]["result"]["sentence_count"] == 2
+        assert results[1]["result"]["word_count"] == 3
+        assert "error" in results[2]
+        assert results[3]["id"] == 7 and "error" in results[3]
+
+    def test_transform_options(self):
+        """Test passing operation options."""
+        output = io.StringIO()
+        run_batch(LINES[:1], output, "transform", {"slugify": True}, jobs=1)
+        assert _results(output)[0]["result"] == {
+            "text": "hello-world-second-sentence"
+        }
+
+    def test_missing_numpy(self, monkeypatch):
+        """Test that NumPy-only methods fail per document, not per run."""
+        # A None entry makes "import numpy" raise ImportError
+        monkeypatch.setitem(sys.modules, "numpy", None)
+        line = json.dumps("One point. Two points. Three. Four. Five.")
+        output = io.StringIO()
+        count = run_batch(
+            [line] * 2,
+            output,
+            "summarize",
+            {"method": "tfidf", "sentences": 1},
+            jobs=1,
+        )
+        results = _results(output)
+        assert count == 2
+        assert all("requires NumPy" in r["error"] for r in results)
+
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_pool_matches_sequential(self, ordered):
+        """Test that pooled results match in-process results."""
+        lines = [json.dumps(f"Doc {i}. Words here!") for i in range(50)]
+        sequential = io.StringIO()
+        run_batch(lines, sequential, "summarize", jobs=1)
+        pooled = io.StringIO()
+        run_batch(
+            lines, pooled, "summarize", jobs=2, batch_size=4, ordered=ordered
+        )
+        expected = _results(sequential)
+        got = _results(pooled)
+        if not ordered:
+            got.sort(key=lambda r: r["index"])
+        assert got == expected
@@ -0,0 +1,55 @@
+"""Tests for the vectorized column validators."""
+
+import pytest
+
+from dataval.analyzer import is_credit_card, is_number_in_range
+
+np = pytest.importorskip("numpy")
+
+from dataval.analyzer import (  # noqa: E402
+    is_credit_card_batch,
+    is_number_in_range_batch,
+)
+
+CARDS = [
+    "4111 1111 1111 1111",
+    "4012888888881881",
+    "1234-5678-9012-3456",
+    "4111-1111-1111-1112",
+    "378282246310005",
+    "4111111111111111111111",
+    "4111x11111111111",
+    "",
+    "  ",
+    "6011 0009 9013 9424 " + " " * 40,
+]
+
+
+class TestBatchValidators:
+    """Test suite for column validators returning boolean masks."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 1 << 16])
+    def test_credit_cards_match_scalar(self, chunk_size):
+        """Test that the mask agrees with is_credit_card()."""
+        mask = is_credit_card_batch(CARDS, chunk_size=chunk_size)
+        assert mask.dtype == bool
+        assert mask.tolist() == [is_credit_card(card) for card in CARDS]
+
+    def test_credit_card_inputs(self):
+        """Test arrays, numbers, empty columns and a bad chunk size."""
+        numbers = np.array([4111111111111111, 4111111111111112])
+        assert is_credit_card_batch(numbers).tolist() == [True, False]
+        assert is_credit_card_batch(np.array(CARDS[:2])).all()
+        assert is_credit_card_batch([]).shape == (0,)
+        with pytest.raises(ValueError):
+            is_credit_card_batch(CARDS, chunk_size=0)
+
+    def test_number_ranges_match_scalar(self):
+        """Test range masks, including NaN and open bounds."""
+        values = [-5, 0, 2.5, 10, 11, float("nan")]
+        for bounds in [(0, 10), (None, 10), (0, None), (None, None)]:
+            mask = is_number_in_range_batch(values, *bounds)
+            expected = [is_number_in_range(v, *bounds) for v in values]
+            assert mask.tolist() == expected
+        column = np.arange(10)
+        assert is_number_in_range_batch(column, 3, 5).sum() == 3
@@ -0,0 +1,64 @@
+"""Tests for the benchmark suite."""
+
+import json
+
+import pytest
+
+from benchmarks.run import (
+    BENCHMARKS,
+    benchmark,
+    compare,
+    main,
+    parse_size,
+    run_suite,
+)
+
+
+def _report(**throughputs):
+    return {
+        "results": {
+            key: {"mb_per_s": value} for key, value in throughputs.items()
+        }
+    }
+
+
+class TestBenchmarks:
+    """Test suite for running and comparing benchmarks."""
+
+    def test_parse_size(self):
+        """Test human-readable sizes."""
+        assert parse_size("1KB") == 1024
+        assert parse_size("16 mb") == 16 << 20
+        assert parse_size("1GB") == 1 << 30
+        with pytest.raises(ValueError):
+            parse_size("lots")
+
+    def test_optional_dependency(self):
+        """Test that benchmarks needing a missing module are skipped."""
+        run = benchmark("needs_missing", len, requires="no_such_module")(len)
+        assert run is len
+        assert "needs_missing" not in BENCHMARKS
+        benchmark("needs_json", len, requires="json")(len)
+        assert BENCHMARKS.pop("needs_json").run is len
+
+    def test_compare(self):
+        """Test the regression threshold."""
+        baseline = _report(a=100.0, b=100.0, c=100.0)
+        current = _report(a=95.0, b=80.0, d=1.0)
+        regressions = compare(baseline, current, threshold=10)
+        assert len(regressions) == 1
+        assert regressions[0].startswith("b:")
+        assert not compare(baseline, current, threshold=25)
+
+    def test_run_and_compare_cli(self, tmp_path):
+        """Test a tiny run end to end, including the exit status."""
+        report = run_suite([256], repeat=1, memory=True)
+        assert set(report["results"]) == {f"{n}@256" for n in BENCHMARKS}
+        assert all(r["peak_bytes"] >= 0 for r in report["results"].values())
+
+        baseline = tmp_path / "baseline.json"
+        current = tmp_path / "current.json"
+        baseline.write_text(json.dumps(_report(x=100.0)))
+        current.write_text(json.dumps(_report(x=50.0)))
+        assert main(["compare", str(baseline), str(current)]) == 1
+        assert main(["compare", str(baseline), str(baseline)]) == 0
@@ -0,0 +1,65 @@
+"""Tests for the on-disk analysis cache."""
+
+import os
+
+from textkit.advanced.validator import calculate_readability
+from textkit.cache import AnalysisCache
+from textkit.corpus import analyze_file
+from textkit.validators import word_frequency
+
+
+class TestAnalysisCache:
+    """Test suite for the analysis cache."""
+
+    def test_cached_call(self, tmp_path):
+        """Test that repeated calls are served from the cache."""
+        cache = AnalysisCache(tmp_path)
+        text = "Hello hello world. Again!"
+        first = cache.cached(word_frequency, text)
+        second = cache.cached(word_frequency, text)
+        assert first == second == word_frequency(text)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        readability = cache.cached(calculate_readability, text)
+        assert readability == calculate_readability(text)
+        assert cache.misses == 2
+
+    def test_disabled(self, tmp_path):
+        """Test that a disabled cache never touches the disk."""
+        cache = AnalysisCache(tmp_path / "cache", enabled=False)
+        assert cache.cached(word_frequency, "a a") == {"a": 2}
+        assert not (tmp_path / "cache").exists()
+
+    def test_lru_eviction(self, tmp_path):
+        """Test that the least recently used entries are evicted."""
+        cache = AnalysisCache(tmp_path, max_bytes=10_000)
+        keys = [cache.key(str(i), "test") for i in range(3)]
+        for age, key in enumerate(keys):
+            cache.put(key, "x" * 2_000 + os.urandom(2_000).hex())
+            path = tmp_path / key[:2] / key[2:]
+            os.utime(path, (age, age))
+        cache.get(keys[0])
+
+        cache.put(cache.key("new", "test"), os.urandom(3_000).hex())
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[1]) is None
+
+    def test_file_results(self, tmp_path):
+        """Test caching per-file corpus results."""
+        path = tmp_path / "doc.txt"
+        path.write_text("one two two. three")
+        cache = AnalysisCache(tmp_path / "cache")
+        assert analyze_file(path, cache=cache) == analyze_file(path)
+        assert analyze_file(path, cache=cache) == analyze_file(path)
+        assert cache.hits == 1
+        analyze_file(path, chunk_size=4, cache=cache)
+        assert cache.hits == 1
+
+    def test_overwrite_keeps_size(self, tmp_path):
+        """Test that replacing an entry does not count its old size."""
+        cache = AnalysisCache(tmp_path)
+        key = cache.key("digest", "test")
+        cache.put(cache.key("other", "test"), "x")
+        for _ in range(5):
+            cache.put(key, os.urandom(1_000).hex())
+        assert cache._size == cache._scan_size()
@@ -0,0 +1,135 @@
+"""Tests for the textutils command-line interface."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from textkit import __version__
+from textkit.cli import cli
+
+TEXT = "Cats chase mice. Cats sleep. Dogs bark at cats."
+
+
+def invoke(*args: str) -> str:
+    """Run the CLI and return its output, failing on a non-zero exit."""
+    result = CliRunner().invoke(cli, list(args))
+    assert result.exit_code == 0, result.output
+    return result.output
+
+
+class TestCli:
+    """Test suite for the CLI commands."""
+
+    def test_version(self):
+        """Test that the CLI imports and reports its version."""
+        result = CliRunner().invoke(cli, ["--version"])
+        assert result.exit_code == 0
+        assert __version__ in result.output
+
+    def test_transform(self):
+        """Test a command end to end."""
+        result = CliRunner().invoke(
+            cli, ["transform", "Hello World", "--slugify"]
+        )
+        assert result.exit_code == 0
+        assert result.output == "hello-world\n"
+
+    def test_summarize(self):
+        """Test summarizing inline text."""
+        text = "First point here. Second point there. Third one."
+        result = CliRunner().invoke(
+            cli, ["summarize", text, "--sentences", "1", "-F", "json"]
+        )
+        assert result.exit_code == 0
+        assert json.loads(result.output)["summary"] == "First point here."
+
+    def test_approx_capacity(self):
+        """Test that the sketch capacity must be positive."""
+        output = invoke("analyze", TEXT, "--approx", "--capacity", "2")
+        assert "cats" in output
+        result = CliRunner().invoke(
+            cli, ["analyze", TEXT, "--approx", "--capacity", "0"]
+        )
+        assert result.exit_code == 2
+        assert "--capacity" in result.output
+
+    def test_cache_is_opt_in(self, tmp_path, monkeypatch):
+        """Test that results are only cached when asked to."""
+        monkeypatch.delenv("TEXTKIT_NO_CACHE", raising=False)
+        cache_dir = tmp_path / "cache"
+        args = ["summarize", "Some text.", "--cache-dir", str(cache_dir)]
+        assert CliRunner().invoke(cli, args).exit_code == 0
+        assert not cache_dir.exists()
+        assert CliRunner().invoke(cli, [*args, "--cache"]).exit_code == 0
+        assert any(cache_dir.iterdir())
+
+
+class TestMachineFormats:
+    """Test suite for the json and tsv output of the commands."""
+
+    @pytest.fixture
+    def csv_path(self, tmp_path):
+        path = tmp_path / "people.csv"
+        path.write_text("name,email\nann,a@b.co\nbob,b@c.io\n")
+        return str(path)
+
+    def test_analyze(self):
+        """Test analyze as JSON and TSV."""
+        report = json.loads(invoke("analyze", TEXT, "-n", "1", "-F", "json"))
+        assert report["word_count"] == 9
+        assert report["top_words"] == [["cats", 3]]
+
+        lines = invoke("analyze", TEXT, "-n", "1", "-F", "tsv").splitlines()
+        assert lines[:2] == ["metric\tvalue", "word_count\t9"]
+        assert lines[-2:] == ["word\tfrequency", "cats\t3"]
+
+    def test_transform(self):
+        """Test transform as JSON and TSV."""
+        args = ("transform", "Hello World", "--slugify")
+        assert json.loads(invoke(*args, "-F", "json")) == {
+            "text": "hello-world"
+        }
+        assert invoke(*args, "-F", "tsv") == "text\nhello-world\n"
+
+    def test_summarize(self):
+        """Test summarize as JSON and TSV."""
+        report = json.loads(invoke("summarize", TEXT, "-s", "1", "-F", "json"))
+        assert report["summary"] == "Cats chase mice."
+        assert set(report["readability"]) == {
+            "words_per_sentence",
+            "chars_per_word",
+            "fk_grade_level",
+        }
+        lines = invoke("summarize", TEXT, "-s", "1", "-F", "tsv").splitlines()
+        assert lines[:2] == ["metric\tvalue", "summary\tCats chase mice."]
+
+    def test_validate(self):
+        """Test validate as JSON and TSV, with the invalid values."""
+        args = ("validate", "email", "a@b.co", "nope", "--show-invalid")
+        report = json.loads(invoke(*args, "-F", "json"))
+        assert (report["total"], report["valid"], report["invalid"]) == (
+            2,
+            1,
+            1,
+        )
+        assert report["invalid_values"] == ["nope"]
+
+        metrics, invalid = invoke(*args, "-F", "tsv").split("\n\n")
+        assert "total\t2" in metrics.splitlines()
+        assert invalid.splitlines() == ["invalid_value", "nope"]
+
+    def test_profile(self, csv_path):
+        """Test profile as JSON and TSV."""
+        report = json.loads(invoke("profile", csv_path, "-F", "json"))
+        assert report["records"] == 2
+        assert report["schema"]["email"]["validators"] == ["email"]
+
+        lines = invoke("profile", csv_path, "-F", "tsv").splitlines()
+        assert lines[0].split("\t")[:3] == ["field", "type", "required"]
+        assert lines[2].split("\t")[:3] == ["email", "str", "True"]
+
+    def test_escaping(self):
+        """Test that TSV fields escape tabs and newlines."""
+        output = invoke("transform", "a\tb\nc", "-F", "tsv")
+        assert output == "text\na\\tb\\nc\n"
@@ -0,0 +1,43 @@
+"""Tests for the interactive shell example."""
+
+from cmd_example import Delta313Shell
+
+
+class TestDelta313Shell:
+    """Test suite for the shell's script mode and document cache."""
+
+    def test_run_script(self, tmp_path, capsys):
+        """Test loading a document, analyzing it and timing a command."""
+        path = tmp_path / "notes.txt"
+        path.write_text("Cats chase mice. Cats sleep a lot.", encoding="utf-8")
+        shell = Delta313Shell()
+
+        stopped = shell.run_script(
+            [
+                "# comments and blank lines are skipped",
+                "",
+                f"load {path} notes",
+                "analyze @notes",
+                "timeit -n 3 analyze @notes",
+                "analyze @missing",
+            ]
+        )
+
+        output = capsys.readouterr().out
+        assert not stopped
+        assert "notes" in shell.documents
+        assert "delta313> load" in output
+        assert "Loaded @notes: 34 chars, 7 words, 2 sentences" in output
+        assert "Text Analysis for: @notes" in output
+        assert "Word Count: 7" in output
+        assert "  cats: 2" in output
+        assert "3 runs: best" in output
+        # timeit discards the output of the timed command
+        assert output.count("Text Analysis for") == 1
+        assert "No document named 'missing'" in output
+
+    def test_quit_stops_script(self, capsys):
+        """Test that quit ends a script early."""
+        shell = Delta313Shell()
+        assert shell.run_script(["quit", "load never.txt"])
+        assert "never.txt" not in capsys.readouterr().out
@@ -0,0 +1,57 @@
+"""Tests for multi-file corpus analysis."""
+
+from textkit.cache import AnalysisCache, file_hash
+from textkit.corpus import analyze_corpus, iter_paths
+from textkit.streaming import DEFAULT_CHUNK_SIZE, TextStats
+
+
+class TestCorpus:
+    """Test suite for corpus analysis."""
+
+    def test_iter_paths(self, tmp_path):
+        """Test expanding directories and globs without duplicates."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "sub" / "b.txt").write_text("b")
+        (tmp_path / "c.log").write_text("c")
+
+        found = list(iter_paths([str(tmp_path), str(tmp_path / "*.txt")]))
+        assert sorted(p.name for p in found) == ["a.txt", "b.txt", "c.log"]
+
+        txt = list(iter_paths([str(tmp_path / "**" / "*.txt")]))
+        assert sorted(p.name for p in txt) == ["a.txt", "b.txt"]
+
+    def test_parallel_matches_sequential(self, tmp_path):
+        """Test that pooled results match a sequential merge."""
+        texts = [f"doc {i}. word{i % 3} shared words!" for i in range(12)]
+        paths = []
+        for i, text in enumerate(texts):
+            path = tmp_path / f"{i}.txt"
+            path.write_text(text)
+            paths.append(path)
+
+        expected = TextStats()
+        for text in texts:
+            expected.merge(TextStats.from_text(text))
+
+        stats, count = analyze_corpus(paths, jobs=3)
+        assert count == 12
+        assert stats == expected
+
+    def test_parallel_cache(self, tmp_path):
+        """Test that pool workers fill the cache for every file."""
+        paths = []
+        for i in range(6):
+            path = tmp_path / f"{i}.txt"
+            path.write_text(f"file {i} words")
+            paths.append(path)
+        cache = AnalysisCache(tmp_path / "cache")
+
+        first, _ = analyze_corpus(paths, jobs=2, cache=cache)
+        signature = (
+            f"textkit.corpus.analyze_file:chunk_size={DEFAULT_CHUNK_SIZE}"
+        )
+        keys = [cache.key(file_hash(path), signature) for path in paths]
+        assert all(cache.get(key) is not None for key in keys)
+        second, _ = analyze_corpus(paths, jobs=2, cache=cache)
+        assert second == first
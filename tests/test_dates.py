@@ -0,0 +1,87 @@
+"""Tests for compiled date formats."""
+
+from datetime import datetime
+
+import pytest
+
+from dataval.analyzer import is_date
+from dataval.dates import DateFormat, compile_format
+from dataval.transformer import format_date
+
+VALUES = [
+    "2024-02-29",
+    "2023-02-29",
+    "2024-2-9",
+    "2024-13-01",
+    "0000-01-01",
+    "2024-01-01x",
+    "２０２４-01-01",
+    "",
+]
+
+
+class TestDateFormat:
+    """Test suite for fast-path date parsing."""
+
+    @pytest.mark.parametrize(
+        "fmt",
+        ["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S.%f", "%b %Y"],
+    )
+    def test_matches_strptime(self, fmt):
+        """Test that results agree with datetime.strptime()."""
+        values = VALUES + [
+            "2024-05-06T07:08:09",
+            "2024-05-06t07:08:09",
+            "2024-05-06 07:08:60.5",
+            "2024-05-06 07:08:09.123",
+            "May 2024",
+        ]
+        compiled = DateFormat(fmt, cache_size=0)
+        for value in values:
+            try:
+                expected = datetime.strptime(value, fmt)
+            except ValueError:
+                expected = None
+            assert compiled.parse_many([value]) == [expected], value
+
+    def test_parse_errors_match_strptime(self):
+        """Test that parse() raises the strptime error."""
+        compiled = DateFormat("%Y-%m-%d")
+        with pytest.raises(ValueError, match="does not match format"):
+            compiled.parse("2024/01/01")
+        with pytest.raises(ValueError, match="day is out of range"):
+            compiled.parse("2023-02-29")
+
+    def test_batches_and_memoization(self):
+        """Test column APIs and cache statistics."""
+        compiled = DateFormat("%Y-%m-%d", cache_size=8)
+        column = ["2024-01-31", "bad", "2024-01-31", "2024-01-31"]
+        assert compiled.validate_many(column) == [True, False, True, True]
+        assert compiled.reformat_many(column, "%d.%m.%Y") == [
+            "31.01.2024",
+            None,
+            "31.01.2024",
+            "31.01.2024",
+        ]
+        hits, misses = compiled.cache_info()
+        assert misses == 2
+        assert hits >= 2
+        assert DateFormat("%Y", cache_size=0).cache_info() is None
+
+    def test_iso_format(self):
+        """Test the ISO 8601 format name."""
+        compiled = compile_format("iso")
+        assert compiled.parse("2024-01-02T03:04:05") == datetime(
+            2024, 1, 2, 3, 4, 5
+        )
+        assert not compiled.is_valid("02/01/2024")
+
+    def test_validators_use_compiled_formats(self):
+        """Test is_date() and format_date()."""
+        assert compile_format("%Y-%m-%d") is compile_format("%Y-%m-%d")
+        assert is_date("2024-02-29")
+        assert not is_date("2023-02-29")
+        assert is_date("05/15/2023", format_str="%m/%d/%Y")
+        assert format_date("2023-05-15") == "May 15, 2023"
+        with pytest.raises(ValueError):
+            format_date("invalid-date")
@@ -0,0 +1,55 @@
+"""Tests for the shared Document type."""
+
+import pytest
+
+from textkit.advanced.validator import calculate_readability, summarize
+from textkit.document import Document, as_document
+from textkit.validators import (
+    average_word_length,
+    get_top_words,
+    sentence_count,
+    word_frequency,
+)
+
+
+class TestDocument:
+    """Test suite for lazily analyzed documents."""
+
+    def test_as_document(self):
+        """Test wrapping strings and passing documents through."""
+        doc = Document("hello")
+        assert as_document(doc) is doc
+        assert as_document("hello").text == "hello"
+
+    def test_functions_accept_document(self):
+        """Test that analysis results match for strings and documents."""
+        text = "Hello world. This is a test! Is it, hello?"
+        doc = Document(text)
+        assert word_frequency(doc) == word_frequency(text)
+        assert get_top_words(doc, n=2) == get_top_words(text, n=2)
+        assert average_word_length(doc) == average_word_length(text)
+        assert sentence_count(doc) == sentence_count(text) == 3
+        assert calculate_readability(doc) == calculate_readability(text)
+        assert summarize(doc, 1) == summarize(text, 1) == "Hello world."
+
+    def test_tokens_are_cached(self):
+        """Test that derived views are computed once."""
+        doc = Document("a b a")
+        assert doc.frequencies is doc.frequencies
+        assert doc.tokens is doc.tokens
+        word_frequency(doc)["a"] = 100
+        assert doc.frequencies["a"] == 2
+
+    @pytest.mark.parametrize("repeat", [1, 100])
+    def test_views_derive_from_tokens(self, repeat):
+        """Test the lowercase tokens and terms derived from the tokens."""
+        doc = Document("Hello, WORLD! -- e-mail İstanbul café 42. " * repeat)
+        lower = ["hello,", "world!", "--", "e-mail"]
+        lower += ["i̇stanbul", "café", "42."]
+        terms = ["hello", "world", "email", "stanbul", "caf", "42"]
+        assert doc.lower_tokens == lower * repeat
+        assert doc.terms == terms * repeat
+
+        doc = Document("one two")
+        doc.tokens[0] = "Changed"
+        assert doc.lower_tokens == doc.terms == ["changed", "two"]
@@ -0,0 +1,41 @@
+"""Tests for the single-pass entity scanner."""
+
+import io
+
+import pytest
+
+from textkit.entities import Entity, EntityScanner
+
+TEXT = (
+    "Mail john@example.com or see https://example.com/a#top, "
+    "ping @mary about #release and #qa."
+)
+
+
+class TestEntityScanner:
+    """Test suite for entity scanning."""
+
+    def test_scan(self):
+        """Test typed spans for every entity kind."""
+        found = list(EntityScanner().scan(TEXT))
+        assert [(e.kind, e.text(TEXT)) for e in found] == [
+            ("email", "john@example.com"),
+            ("url", "https://example.com/a#top,"),
+            ("mention", "@mary"),
+            ("hashtag", "#release"),
+            ("hashtag", "#qa"),
+        ]
+        assert found[0] == Entity("email", 5, 21)
+
+    def test_kinds_and_counts(self):
+        """Test restricting the scanned kinds."""
+        scanner = EntityScanner(["hashtag", "mention"])
+        assert scanner.count(TEXT) == {"hashtag": 3, "mention": 1}
+        with pytest.raises(ValueError):
+            EntityScanner(["phone"])
+
+    def test_scan_stream(self):
+        """Test that streamed offsets match a whole-text scan."""
+        scanner = EntityScanner()
+        expected = [(e, e.text(TEXT)) for e in scanner.scan(TEXT)]
+        assert list(scanner.scan_stream(io.StringIO(TEXT), 8)) == expected
@@ -0,0 +1,55 @@
+"""Tests for the extractive summarizer."""
+
+import pytest
+
+from textkit.advanced.validator import summarize
+
+np = pytest.importorskip("numpy")
+
+from textkit.advanced.extractive import (  # noqa: E402
+    SentenceMatrix,
+    select_sentences,
+    summarize_extractive,
+)
+
+SENTENCES = [
+    "Python is a programming language.",
+    "The weather was sunny yesterday.",
+    "Python code is readable and Python is popular.",
+    "Many programmers write Python code every day.",
+    "Cats sleep most of the day.",
+]
+
+
+class TestExtractive:
+    """Test suite for TF-IDF and TextRank summarization."""
+
+    def test_matrix_rows_are_normalized(self):
+        """Test the sparse TF-IDF matrix."""
+        matrix = SentenceMatrix(SENTENCES)
+        norms = np.bincount(matrix.rows, weights=matrix.data**2)
+        assert matrix.shape[0] == len(SENTENCES)
+        assert np.allclose(norms, 1.0)
+
+    @pytest.mark.parametrize("method", ["tfidf", "textrank"])
+    def test_selects_central_sentences(self, method):
+        """Test that on-topic sentences outrank off-topic ones."""
+        picked = select_sentences(SENTENCES, 2, method)
+        assert picked == sorted(picked)
+        assert set(picked) <= {0, 2, 3}
+
+    def test_map_reduce_matches_direct(self):
+        """Test chunked summarization of a long document."""
+        text = " ".join(SENTENCES * 40)
+        summary = summarize_extractive(text, 2, "tfidf", chunk_sentences=25)
+        assert summary == summarize_extractive(text, 2, "tfidf")
+        assert summary.count(".") == 2
+        assert "Python" in summary
+
+    def test_summarize_method(self):
+        """Test method selection through summarize."""
+        text = " ".join(SENTENCES)
+        assert summarize(text, 1) == SENTENCES[0]
+        assert summarize(text, 1, method="tfidf") in SENTENCES
+        with pytest.raises(ValueError):
+            summarize(text, 1, method="magic")
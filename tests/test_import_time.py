@@ -0,0 +1,116 @@
+"""Import-time budget for the textkit and dataval packages."""
+
+import importlib
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+# Cumulative import time allowed per module, in microseconds. The
+# budgets are generous so that slow CI machines pass; importing the
+# packages should stay far below them.
+BUDGET_US = {
+    "textkit": 50_000,
+    "dataval": 50_000,
+    "textkit.streaming": 100_000,
+}
+# Modules that must only be imported by the commands that need them
+HEAVY = ("click", "rich", "numpy", "multiprocessing")
+# The CLI needs click to declare its commands, but nothing heavier
+CLI_BUDGET_US = 300_000
+
+
+def _run(*args: str) -> str:
+    """Run Python in a fresh interpreter and return its stderr."""
+    path = os.pathsep.join(
+        p for p in (str(SRC), os.environ.get("PYTHONPATH")) if p
+    )
+    result = subprocess.run(
+        [sys.executable, *args],
+        env={**os.environ, "PYTHONPATH": path},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stderr
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    """Run a statement under -X importtime and parse the report."""
+    times = {}
+    for line in _run("-X", "importtime", "-c", statement).splitlines():
+        _, _, report = line.partition("import time:")
+        _, cumulative, name = report.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def _loaded_modules(statement: str) -> set[str]:
+    """Run a statement and list the modules loaded afterwards."""
+    report = "import sys; print(*sys.modules, file=sys.stderr)"
+    return set(_run("-c", f"{statement}; {report}").split())
+
+
+class TestImportTime:
+    """Test suite for lazy imports."""
+
+    @pytest.mark.parametrize("module", sorted(BUDGET_US))
+    def test_budget(self, module):
+        """Test that importing a module stays within its budget."""
+        times = _import_times(f"import {module}")
+        assert times[module] <= BUDGET_US[module]
+        assert not [name for name in HEAVY if name in times]
+
+    def test_cli_budget(self):
+        """Test that the CLI imports quickly and defers rendering."""
+        times = _import_times("import textkit.cli")
+        assert times["textkit.cli"] <= CLI_BUDGET_US
+        assert not [name for name in HEAVY[1:] if name in times]
+
+    def test_cli_machine_formats_skip_rich(self):
+        """Test that json and tsv output never import rich."""
+        modules = _loaded_modules(
+            "from click.testing import CliRunner; "
+            "from textkit.cli import cli; "
+            "[CliRunner().invoke(cli, [*args, '-F', output_format]) "
+            "for args in (['analyze', 'a b a'], ['transform', 'A b'], "
+            "['summarize', 'A. B.'], ['validate', 'email', 'a@b.co']) "
+            "for output_format in ('json', 'tsv')]"
+        )
+        assert "textkit.cli" in modules
+        assert "rich" not in modules
+
+    def test_lazy_exports(self):
+        """Test that public names load their submodule on first use."""
+        modules = _loaded_modules(
+            "import textkit, dataval; "
+            "textkit.slugify; dataval.is_email; textkit.TextStats"
+        )
+        assert "textkit.transformers" in modules
+        assert "dataval.analyzer" in modules
+        assert "textkit.corpus" not in modules
+        assert "dataval.validation.summarizer" not in modules
+
+    @pytest.mark.parametrize("package", ["textkit", "dataval"])
+    def test_all_matches_exports(self, package):
+        """Test that __all__ lists exactly the lazily exported names."""
+        module = importlib.import_module(package)
+        assert module.__all__ == ["__version__", *module._EXPORTS]
+
+    def test_parallel_modules_defer_multiprocessing(self):
+        """Test that process pools are only loaded when used."""
+        modules = _loaded_modules("import textkit.batch, textkit.corpus")
+        assert "multiprocessing" not in modules
+
+    def test_unknown_attribute(self):
+        """Test that unknown names still raise AttributeError."""
+        import textkit  # pylint: disable=C0415
+
+        with pytest.raises(AttributeError):
+            textkit.does_not_exist  # noqa: B018
+        assert "slugify" in dir(textkit)
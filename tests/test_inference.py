@@ -0,0 +1,240 @@
+"""Tests for dataset profiling and schema inference."""
+
+import json
+from itertools import pairwise
+
+import pytest
+
+from dataval.validation.inference import (
+    DatasetProfile,
+    Reservoir,
+    convert_cell,
+    infer_schema,
+    profile_file,
+    profile_ndjson_range,
+)
+
+RECORDS = [
+    {
+        "id": i,
+        "email": f"user{i % 7}@example.com",
+        "joined": f"2024-01-{i % 28 + 1:02d}",
+        "score": None if i % 3 == 0 else i / 10,
+        **({"note": "hello"} if i % 2 else {}),
+    }
+    for i in range(500)
+]
+
+
+def exact_stats(profile):
+    """Profile fields without the top values, approximate past capacity."""
+    return {
+        name: {key: value for key, value in stats.items() if key != "top"}
+        for name, stats in profile.to_dict()["fields"].items()
+    }
+
+
+def write_ndjson(path, records):
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+    return path
+
+
+class TestReservoir:
+    """Test suite for reservoir sampling."""
+
+    def test_keeps_everything_below_size(self):
+        """Test that short streams are kept whole."""
+        sample = Reservoir(10, seed=1)
+        for i in range(5):
+            sample.add(i)
+        assert sample.items == [0, 1, 2, 3, 4]
+        assert sample.seen == 5
+
+    def test_bounded(self):
+        """Test that the sample never exceeds its size."""
+        sample = Reservoir(10, seed=1)
+        for i in range(1000):
+            sample.add(i)
+        assert len(sample.items) == 10
+        assert set(sample.items) <= set(range(1000))
+
+    def test_merge(self):
+        """Test merging samples of disjoint streams."""
+        first, second = Reservoir(10, seed=1), Reservoir(10, seed=2)
+        for i in range(100):
+            first.add(i)
+            second.add(-i - 1)
+        first.merge(second)
+        assert first.seen == 200
+        assert len(first.items) == 10
+
+    def test_invalid_size(self):
+        """Test that the size must be positive."""
+        with pytest.raises(ValueError):
+            Reservoir(0)
+
+
+class TestDatasetProfile:
+    """Test suite for DatasetProfile."""
+
+    def test_field_statistics(self):
+        """Test counts, nulls, bounds and types of each field."""
+        profile = DatasetProfile(seed=0)
+        profile.update(RECORDS)
+        report = profile.to_dict(top=3)
+        assert report["records"] == 500
+        fields = report["fields"]
+        assert fields["id"]["min"] == 0
+        assert fields["id"]["max"] == 499
+        assert fields["id"]["types"] == {"int": 500}
+        assert fields["score"]["nulls"] == 167
+        assert fields["note"]["nulls"] == 250
+        assert fields["email"]["distinct"] == 7
+        assert fields["email"]["top"][0][1] == 72
+
+    def test_field_specs(self):
+        """Test inferred types, required flags and validators."""
+        profile = DatasetProfile(seed=0)
+        profile.update(RECORDS)
+        specs = profile.field_specs()
+        assert specs["id"] == {
+            "type": "int",
+            "required": True,
+            "validators": [],
+        }
+        assert specs["email"]["validators"] == ["email"]
+        assert specs["joined"]["validators"] == ["date"]
+        assert specs["score"]["type"] == "float"
+        assert not specs["score"]["required"]
+        assert not specs["note"]["required"]
+
+    def test_mixed_types(self):
+        """Test that fields with several types are typed as object."""
+        profile = DatasetProfile()
+        profile.update([{"x": 1}, {"x": "a"}, {"x": [1]}])
+        assert profile.field_specs()["x"]["type"] == "object"
+        assert profile.to_dict()["fields"]["x"]["distinct"] == 3
+
+    def test_int_and_float(self):
+        """Test that ints and floats mix into a float field."""
+        records = [{"x": 1}, {"x": 2.5}]
+        schema = infer_schema(records)
+        assert schema.fields["x"].field_type is float
+        assert not any(schema.validate(record) for record in records)
+
+    def test_merge_matches_single_pass(self):
+        """Test that merged partial profiles equal a single pass."""
+        whole = DatasetProfile(seed=0)
+        whole.update(RECORDS)
+        first, second = DatasetProfile(seed=1), DatasetProfile(seed=2)
+        first.update(RECORDS[:200])
+        second.update(RECORDS[200:])
+        merged = first.merge(second)
+        assert exact_stats(merged) == exact_stats(whole)
+        assert merged.field_specs() == whole.field_specs()
+
+    def test_infer_schema(self):
+        """Test that the inferred schema validates the records."""
+        schema = infer_schema(RECORDS, seed=0)
+        assert not any(schema.validate(record) for record in RECORDS)
+        errors = schema.validate({"id": 1, "email": "nope"})
+        assert set(errors) == {"email", "joined"}
+
+
+class TestFiles:
+    """Test suite for profiling CSV and NDJSON files."""
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("", None),
+            ("42", 42),
+            ("-1.5", -1.5),
+            ("1e3", 1000.0),
+            ("true", True),
+            ("False", False),
+            ("007a", "007a"),
+            ("0", 0),
+            ("01234", "01234"),
+            ("123456789012345", 123456789012345),
+            ("4111111111111111", "4111111111111111"),
+        ],
+    )
+    def test_convert_cell(self, text, expected):
+        """Test the conversion of CSV cells."""
+        assert convert_cell(text) == expected
+        assert type(convert_cell(text)) is type(expected)
+
+    def test_csv(self, tmp_path):
+        """Test profiling a CSV file."""
+        path = tmp_path / "people.csv"
+        path.write_text("name,age,email\nann,30,a@b.co\nbob,,b@c.io\n")
+        profile = profile_file(path)
+        specs = profile.field_specs()
+        assert profile.records == 2
+        assert specs["age"] == {
+            "type": "int",
+            "required": False,
+            "validators": [],
+        }
+        assert specs["email"]["validators"] == ["email"]
+
+    def test_csv_column_types(self, tmp_path):
+        """Test that column types keep ZIP codes and card numbers."""
+        path = tmp_path / "orders.csv"
+        path.write_text(
+            "zip,card,price\n"
+            "01234,4111111111111111,3\n"
+            "90210,5500000000000004,4.5\n"
+        )
+        profile = profile_file(path)
+        stats = profile.to_dict()["fields"]
+        specs = profile.field_specs()
+        assert stats["zip"]["min"] == "01234"
+        assert stats["zip"]["max"] == "90210"
+        assert specs["zip"]["type"] == "str"
+        assert specs["price"]["type"] == "float"
+        assert specs["card"] == {
+            "type": "str",
+            "required": True,
+            "validators": ["credit_card"],
+        }
+
+    def test_csv_ragged_rows(self, tmp_path):
+        """Test rows with more or fewer cells than the header."""
+        path = tmp_path / "ragged.csv"
+        path.write_text("a,b\n1,x\n2,y,extra\n3\n")
+        profile = profile_file(path)
+        stats = profile.to_dict()["fields"]
+        assert profile.records == 3
+        assert set(stats) == {"a", "b"}
+        assert stats["a"]["max"] == 3
+        assert stats["b"]["nulls"] == 1
+
+    def test_ndjson_ranges(self, tmp_path):
+        """Test that byte ranges split lines exactly once."""
+        path = write_ndjson(tmp_path / "records.ndjson", RECORDS)
+        size = path.stat().st_size
+        whole = profile_file(path, seed=0)
+        merged = DatasetProfile(seed=0)
+        bounds = [0, 1, size // 3, size // 2, size]
+        for start, end in pairwise(bounds):
+            merged.merge(profile_ndjson_range(path, start, end, seed=0))
+        assert merged.records == len(RECORDS)
+        assert exact_stats(merged) == exact_stats(whole)
+
+    def test_malformed_line(self, tmp_path):
+        """Test that lines that are not JSON objects are rejected."""
+        path = tmp_path / "bad.jsonl"
+        path.write_text('{"a": 1}\n[1, 2]\n')
+        with pytest.raises(ValueError):
+            profile_file(path)
+
+    def test_unsupported_file(self, tmp_path):
+        """Test that unknown file types are rejected."""
+        path = tmp_path / "data.txt"
+        path.write_text("a,b\n")
+        with pytest.raises(ValueError, match="Unsupported"):
+            profile_file(path)
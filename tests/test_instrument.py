@@ -0,0 +1,72 @@
+"""Tests for the instrumentation API."""
+
+import pytest
+
+from dataval import instrument
+from dataval.analyzer import is_email, is_number_in_range
+from dataval.transformer import convert_keys
+from textkit.transformers import slugify
+from textkit.validators import word_frequency
+
+
+@pytest.fixture(autouse=True)
+def fixture_recording():
+    """Record stages for the duration of a test only."""
+    instrument.reset()
+    instrument.enable()
+    yield
+    instrument.enable(False)
+    instrument.reset()
+
+
+class TestInstrument:
+    """Test suite for stage timing."""
+
+    def test_library_functions_are_timed(self):
+        """Test that decorated library functions record calls."""
+        word_frequency("a b a")
+        word_frequency("c")
+        convert_keys({"someKey": 1})
+        report = instrument.report()
+        assert report["textkit.validators.word_frequency"]["calls"] == 2
+        assert report["dataval.transformer.convert_keys"]["calls"] == 1
+
+    def test_scalar_helpers_are_not_wrapped(self):
+        """Test that per-value helpers pay no wrapper call."""
+        for func in (is_email, is_number_in_range, slugify):
+            assert not hasattr(func, "__wrapped__")
+        is_email("a@b.co")
+        assert not instrument.report()
+
+    def test_stage_and_decorator(self):
+        """Test the context manager and a named decorator."""
+
+        @instrument.timed(name="custom")
+        def work():
+            return sum(range(1000))
+
+        with instrument.stage("block"):
+            assert work() == 499500
+        report = instrument.report()
+        assert report["block"]["calls"] == report["custom"]["calls"] == 1
+        assert report["block"]["wall_ms"] >= report["custom"]["wall_ms"]
+        assert "block" in instrument.format_report()
+
+    def test_disabled_records_nothing(self):
+        """Test that nothing is recorded while disabled."""
+        instrument.enable(False)
+        word_frequency("a")
+        with instrument.stage("block"):
+            pass
+        assert not instrument.report()
+
+    def test_exceptions_are_recorded(self):
+        """Test that failing calls still count."""
+
+        @instrument.timed
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            fail()
+        assert instrument.report()[f"{__name__}.{fail.__qualname__}"]
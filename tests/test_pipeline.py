@@ -0,0 +1,52 @@
+"""Tests for line-oriented transform pipelines."""
+
+import io
+import json
+
+import pytest
+
+from textkit.pipeline import Pipeline
+
+
+class TestPipeline:
+    """Test suite for compiled transform pipelines."""
+
+    def test_parse_and_apply(self, tmp_path):
+        """Test compiling a specification with a replacement table."""
+        table = tmp_path / "map.json"
+        table.write_text(json.dumps({"colour": "color"}), encoding="utf-8")
+        pipeline = Pipeline.parse(f"lower|replace:{table}|slugify|truncate:12")
+        assert len(pipeline.steps) == 4
+        assert pipeline("Favourite COLOUR!") == "favourite..."
+        assert Pipeline.parse(f"replace:{table}|upper")("colour") == "COLOR"
+
+    def test_invalid_steps(self, tmp_path):
+        """Test errors for unknown steps and bad arguments."""
+        with pytest.raises(ValueError, match="Unknown step"):
+            Pipeline.parse("lower|shout")
+        with pytest.raises(ValueError, match="takes no argument"):
+            Pipeline.parse("lower:1")
+        with pytest.raises(ValueError, match="needs a length"):
+            Pipeline.parse("truncate")
+        with pytest.raises(ValueError, match="at least 5"):
+            Pipeline.parse("truncate:2")
+        table = tmp_path / "list.json"
+        table.write_text("[1, 2]", encoding="utf-8")
+        with pytest.raises(ValueError, match="JSON object"):
+            Pipeline.parse(f"replace:{table}")
+        with pytest.raises(OSError):
+            Pipeline.parse(f"replace:{tmp_path / 'missing.json'}")
+
+    def test_run_keeps_line_endings(self):
+        """Test streaming lines with mixed endings and small buffers."""
+        lines = ["Hello World\n", "Foo Bar\r\n", "\n", "Last Line"]
+        output = io.StringIO()
+        count = Pipeline.parse("slugify").run(lines, output, buffer_lines=2)
+        assert count == 4
+        assert output.getvalue() == "hello-world\nfoo-bar\r\n\nlast-line"
+
+    def test_run_empty(self):
+        """Test streaming an empty input."""
+        output = io.StringIO()
+        assert Pipeline.parse("upper").run([], output) == 0
+        assert output.getvalue() == ""
@@ -0,0 +1,43 @@
+"""Tests for batched readability scoring."""
+
+import pytest
+
+from textkit.advanced.validator import calculate_readability
+from textkit.document import Document
+
+np = pytest.importorskip("numpy")
+
+from textkit.advanced.readability import (  # noqa: E402
+    calculate_readability_batch,
+)
+
+DOCS = [
+    "This is a test. It has two sentences!",
+    "",
+    "no terminator here",
+    Document("Short words win. Long sentences with many words lose?"),
+]
+
+
+class TestReadabilityBatch:
+    """Test suite for calculate_readability_batch."""
+
+    def test_matches_scalar_function(self):
+        """Test that every row equals calculate_readability."""
+        batch = calculate_readability_batch(DOCS)
+        assert len(batch) == len(DOCS)
+        for i, doc in enumerate(DOCS):
+            assert batch.row(i) == calculate_readability(doc)
+
+    def test_short_documents_are_masked(self):
+        """Test the valid mask and NaN metrics."""
+        batch = calculate_readability_batch(DOCS)
+        assert batch.valid.tolist() == [True, False, False, True]
+        assert np.isnan(batch.fk_grade_level[1:3]).all()
+        assert batch.word_count.tolist() == [8, 0, 3, 9]
+
+    def test_empty_batch(self):
+        """Test a batch without documents."""
+        batch = calculate_readability_batch([])
+        assert len(batch) == 0
+        assert batch.fk_grade_level.shape == (0,)
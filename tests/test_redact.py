@@ -0,0 +1,45 @@
+"""Tests for streaming PII redaction."""
+
+import io
+
+import pytest
+
+from textkit.redact import Redactor
+
+TEXT = (
+    "user=john.doe@example.com card=4111 1111 1111 1111 "
+    "order=1234567812345678 ts=2024-01-01 alt=5500-0000-0000-0004\n"
+)
+
+
+class TestRedactor:
+    """Test suite for the redaction engine."""
+
+    def test_redact(self):
+        """Test that only emails and Luhn-valid cards are masked."""
+        redactor = Redactor()
+        assert redactor.redact(TEXT) == (
+            "user=[EMAIL] card=[CARD] order=1234567812345678 "
+            "ts=2024-01-01 alt=[CARD]\n"
+        )
+        assert (redactor.emails, redactor.cards) == (1, 2)
+
+    def test_non_ascii(self):
+        """Test card offsets in text with non-ASCII characters."""
+        text = "Größe – 4111 1111 1111 1111 ✓ ID 12345678901234 café"
+        assert Redactor().redact(text) == (
+            "Größe – [CARD] ✓ ID 12345678901234 café"
+        )
+
+    def test_keep_kind(self):
+        """Test disabling one kind of redaction."""
+        assert "[EMAIL]" not in Redactor(email_mask=None).redact(TEXT)
+        with pytest.raises(ValueError):
+            Redactor(None, None)
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 50, 4096])
+    def test_stream_matches_whole_text(self, chunk_size):
+        """Test values crossing chunk boundaries."""
+        text = TEXT * 20
+        pieces = Redactor().redact_stream(io.StringIO(text), chunk_size)
+        assert "".join(pieces) == Redactor().redact(text)
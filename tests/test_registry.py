@@ -0,0 +1,63 @@
+"""Tests for the validator registry."""
+
+import pytest
+
+from dataval.registry import REGISTRY, ValidatorRegistry
+from dataval.validation.summarizer import Field, Schema
+
+
+class TestValidatorRegistry:
+    """Test suite for named, cached validators."""
+
+    def test_cached_results_and_stats(self):
+        """Test that repeated values hit the cache."""
+        calls = []
+
+        def is_even(value):
+            calls.append(value)
+            return value % 2 == 0
+
+        registry = ValidatorRegistry({"even": is_even}, cache_size=2)
+        check = registry.get("even")
+        assert [check(v) for v in (2, 2, 3, 2)] == [True, True, False, True]
+        assert calls == [2, 3]
+        stats = registry.stats()["even"]
+        assert (stats["hits"], stats["misses"], stats["size"]) == (2, 2, 2)
+        assert stats["hit_rate"] == 0.5
+
+        registry.clear_caches()
+        assert registry.stats()["even"]["hits"] == 0
+
+    def test_uncached_and_unhashable_values(self):
+        """Test validators without a cache and unhashable values."""
+        registry = ValidatorRegistry(cache_size=0)
+        registry.register("short", lambda v: len(v) < 3)
+        registry.register("empty", lambda v: not v, cache_size=8)
+        assert registry.validate("short", "ab")
+        assert "short" not in registry.stats()
+        assert registry.validate("empty", [])
+        assert sorted(registry) == ["empty", "short"]
+
+    def test_unknown_names(self):
+        """Test errors for unregistered names."""
+        with pytest.raises(ValueError, match="Unknown validator: nope"):
+            REGISTRY.get("nope")
+        with pytest.raises(ValueError):
+            Field(str, validators=["nope"])
+
+    def test_builtin_validators(self):
+        """Test the shared registry and schema fields using names."""
+        assert {"email", "url", "credit_card", "date"} <= set(REGISTRY)
+        assert REGISTRY.validate("email", "user@example.com")
+        assert not REGISTRY.validate("date", "2023-02-30")
+        schema = Schema(
+            {
+                "email": Field(str, validators=["email"]),
+                "age": Field(int, validators=[lambda n: n >= 18]),
+            }
+        )
+        assert schema.is_valid({"email": "a@b.co", "age": 30})
+        assert set(schema.validate({"email": "bad", "age": 3})) == {
+            "email",
+            "age",
+        }
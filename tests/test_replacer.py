@@ -0,0 +1,30 @@
+"""Tests for the compiled multi-pattern replacer."""
+
+from textkit.transformers import Replacer, replace_all
+
+
+class TestReplacer:
+    """Test suite for Aho-Corasick based replacement."""
+
+    def test_leftmost_longest(self):
+        """Test that the longest key at the leftmost position wins."""
+        replacer = Replacer({"he": "X", "hello": "Y", "lo w": "Z"})
+        assert replacer.replace("hello world") == "Y world"
+        assert replacer.replace("help hello") == "Xlp Y"
+
+    def test_no_chaining(self):
+        """Test that replaced text is not replaced again."""
+        replacements = {"cat": "dog", "dog": "bird"}
+        assert replace_all("cat dog", replacements) == "dog bird"
+
+    def test_overlapping_suffix(self):
+        """Test a short key nested inside an unmatched long key."""
+        replacer = Replacer({"abcd": "1", "bc": "2"})
+        assert replacer.replace("abce abcd") == "a2e 1"
+
+    def test_reuse_and_edge_cases(self):
+        """Test reuse across calls, empty keys and empty tables."""
+        replacer = Replacer({"": "!", "a": "b"})
+        assert replacer.replace("banana") == "bbnbnb"
+        assert replacer.replace("") == ""
+        assert Replacer({}).replace("text") == "text"
@@ -0,0 +1,59 @@
+"""Tests for sentence segmentation."""
+
+import io
+
+import pytest
+
+from textkit.document import Document
+from textkit.segment import sentence_ends, sentence_spans
+from textkit.streaming import iter_sentence_spans
+from textkit.validators import sentence_count
+
+TEXT = (
+    'Dr. Smith paid $3.50 for it. Really?! He said "yes."  '
+    "The U.S. team won, e.g. in 2020. Open tail"
+)
+SENTENCES = [
+    "Dr. Smith paid $3.50 for it.",
+    "Really?!",
+    'He said "yes."',
+    "The U.S. team won, e.g. in 2020.",
+    "Open tail",
+]
+
+
+class TestSegment:
+    """Test suite for the sentence segmenter."""
+
+    def test_spans(self):
+        """Test abbreviations, decimals, quotes and the open tail."""
+        spans = list(sentence_spans(TEXT))
+        assert [TEXT[start:end] for start, end in spans] == SENTENCES
+        assert list(sentence_spans(TEXT, tail=False)) == spans[:-1]
+
+    def test_counters_agree(self):
+        """Test that counting uses terminated sentences only."""
+        assert sentence_count(TEXT) == len(list(sentence_ends(TEXT))) == 4
+        assert sentence_count("Ends with etc.") == 1
+        assert sentence_count("") == 0
+        assert Document(TEXT).sentences == SENTENCES
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("We met at 5 p.m.\n", 1),
+            ("I saw Dr. No.  ", 1),
+            ("I said no. He left.", 2),
+            ("See No. 5 now. Done.", 2),
+        ],
+    )
+    def test_abbreviation_at_end(self, text, expected):
+        """Test abbreviations followed by whitespace only or by numbers."""
+        assert sentence_count(text) == expected
+
+    @pytest.mark.parametrize("chunk_size", [1, 4, 16, 10_000])
+    @pytest.mark.parametrize("text", [TEXT, "Met Dr. No. at 5 p.m. \n"])
+    def test_stream_matches_text(self, text, chunk_size):
+        """Test that streamed spans match whole-text spans."""
+        spans = iter_sentence_spans(io.StringIO(text), chunk_size)
+        assert list(spans) == list(sentence_spans(text))
@@ -0,0 +1,178 @@
+"""Tests for the HTTP service."""
+
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from dataval.validation.inference import DatasetProfile  # noqa: E402
+from textkit.service import (  # noqa: E402
+    FieldSpec,
+    MicroBatcher,
+    build_schema,
+    create_app,
+    run_requests,
+)
+
+
+@pytest.fixture(name="client")
+def fixture_client():
+    """Test client backed by a thread pool."""
+    with ThreadPoolExecutor(2) as executor:
+        with TestClient(create_app(executor=executor)) as client:
+            yield client
+
+
+class TestService:
+    """Test suite for the service endpoints."""
+
+    def test_text_endpoints(self, client):
+        """Test analyze, transform and extract."""
+        response = client.post(
+            "/analyze", json={"text": "Hello world. Hello!", "top": 1}
+        )
+        assert response.status_code == 200
+        assert response.json()["top_words"] == [["hello", 2]]
+
+        response = client.post(
+            "/transform", json={"text": "Hello World", "slugify": True}
+        )
+        assert response.json() == {"text": "hello-world"}
+
+        response = client.post(
+            "/extract", json={"text": "mail a@b.co #tag", "kinds": ["email"]}
+        )
+        assert response.json()["counts"] == {"email": 1}
+
+    def test_missing_numpy(self, client, monkeypatch):
+        """Test that a NumPy-only request fails alone within its batch."""
+        # A None entry makes "import numpy" raise ImportError
+        monkeypatch.setitem(sys.modules, "numpy", None)
+        text = "Points one. Points two. Three. Four. Five."
+        results = run_requests(
+            [
+                ("analyze", text, {"top": 1}),
+                ("summarize", text, {"method": "tfidf", "sentences": 1}),
+            ]
+        )
+        assert results[0]["result"]["top_words"] == [("points", 2)]
+        assert results[1]["status"] == 501
+        assert "requires NumPy" in results[1]["error"]
+
+        response = client.post(
+            "/summarize",
+            json={"text": text, "sentences": 1, "method": "tfidf"},
+        )
+        assert response.status_code == 501
+
+    def test_validation_endpoints(self, client):
+        """Test single-value and schema validation."""
+        response = client.post(
+            "/validate", json={"value": "a@b.co", "validator": "email"}
+        )
+        assert response.json() == {"valid": True}
+        response = client.post(
+            "/validate", json={"value": "x", "validator": "nope"}
+        )
+        assert response.status_code == 422
+
+        response = client.post(
+            "/schema/validate",
+            json={
+                "fields": {
+                    "email": {"type": "str", "validators": ["email"]},
+                    "age": {"type": "int"},
+                },
+                "data": {"email": "nope"},
+            },
+        )
+        body = response.json()
+        assert body["valid"] is False
+        assert set(body["errors"]) == {"email", "age"}
+
+    def test_inferred_schema(self, client):
+        """Test that inferred field descriptions are accepted."""
+        records = [{"a": 1, "b": None, "c": "x"}, {"a": 2.5, "c": [1]}]
+        profile = DatasetProfile()
+        profile.update(records)
+        specs = profile.to_dict()["schema"]
+        assert [spec["type"] for spec in specs.values()] == [
+            "float",
+            "object",
+            "object",
+        ]
+        schema = build_schema(
+            {name: FieldSpec(**spec) for name, spec in specs.items()}
+        )
+        assert not any(schema.validate(record) for record in records)
+
+        response = client.post(
+            "/schema/validate", json={"fields": specs, "data": records[0]}
+        )
+        assert response.json() == {"valid": True, "errors": {}}
+
+    def test_metrics(self, client):
+        """Test latency percentiles and batching counters."""
+        for _ in range(3):
+            client.post("/transform", json={"text": "x"})
+        metrics = client.get("/metrics").json()
+        transform = metrics["latency"]["/transform"]
+        assert transform["count"] == 3
+        assert 0 <= transform["p50_ms"] <= transform["p99_ms"]
+        assert metrics["batching"]["requests"] == 3
+        assert "email" in metrics["validators"]
+
+
+class TestMicroBatcher:
+    """Test suite for request batching."""
+
+    def test_concurrent_requests_are_merged(self):
+        """Test that concurrent submissions share one call."""
+        calls = []
+
+        def double(items):
+            calls.append(list(items))
+            return [2 * item for item in items]
+
+        async def main():
+            batcher = MicroBatcher(double, max_batch=4, max_delay=0.05)
+            return await asyncio.gather(*(batcher.submit(i) for i in range(6)))
+
+        assert asyncio.run(main()) == [0, 2, 4, 6, 8, 10]
+        assert sorted(map(len, calls)) == [2, 4]
+
+    def test_errors_reach_every_caller(self):
+        """Test that a failing batch fails all of its requests."""
+
+        def fail(items):
+            raise RuntimeError("boom")
+
+        async def main():
+            batcher = MicroBatcher(fail, max_delay=0)
+            return await asyncio.gather(
+                batcher.submit(1), batcher.submit(2), return_exceptions=True
+            )
+
+        results = asyncio.run(main())
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    def test_result_count_mismatch(self):
+        """Test that a batch returning too few results fails its callers."""
+
+        def drop_one(items):
+            return items[1:]
+
+        async def main():
+            batcher = MicroBatcher(drop_one, max_delay=0)
+            return await asyncio.gather(
+                batcher.submit(1), batcher.submit(2), return_exceptions=True
+            )
+
+        results = asyncio.run(main())
+        assert all(isinstance(r, ValueError) for r in results)
@@ -0,0 +1,102 @@
+"""Tests for bounded-memory sketches."""
+
+import io
+import random
+from collections import Counter
+
+import pytest
+
+from textkit.sketches import HyperLogLog, SpaceSaving, approx_top_words
+from textkit.streaming import ApproxTextStats, analyze_stream
+
+
+def zipf_words(count, vocabulary, seed=0):
+    """Generate a skewed stream of words."""
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(vocabulary)]
+    return rng.choices([f"w{i}" for i in range(vocabulary)], weights, k=count)
+
+
+class TestSpaceSaving:
+    """Test suite for the Space-Saving summary."""
+
+    def test_exact_below_capacity(self):
+        """Test that counts are exact while under capacity."""
+        summary = SpaceSaving(10)
+        summary.update("a b c a b a".split())
+        assert summary.top(2) == [("a", 3), ("b", 2)]
+        assert summary.error("a") == 0
+
+    def test_error_bounds(self):
+        """Test the documented overestimation bounds."""
+        words = zipf_words(20_000, 2_000)
+        exact = Counter(words)
+        summary = SpaceSaving(100)
+        for start in range(0, len(words), 1_000):
+            summary.update(words[start : start + 1_000])
+
+        assert len(summary) == 100
+        bound = len(words) / 100
+        for word, estimate in summary.counts.items():
+            assert exact[word] <= estimate <= exact[word] + summary.error(word)
+            assert summary.error(word) <= bound
+        for word, count in exact.items():
+            if count > bound:
+                assert word in summary.counts
+
+    def test_merge(self):
+        """Test that merged summaries keep the heavy hitters."""
+        words = zipf_words(10_000, 500)
+        left, right = SpaceSaving(50), SpaceSaving(50)
+        left.update(words[:5_000])
+        right.update(words[5_000:])
+        merged = left.merge(right)
+        assert merged.total == 10_000
+        assert [w for w, _ in merged.top(3)] == ["w0", "w1", "w2"]
+
+
+class TestHyperLogLog:
+    """Test suite for the HyperLogLog estimator."""
+
+    @pytest.mark.parametrize("distinct", [10, 1_000, 50_000])
+    def test_estimate(self, distinct):
+        """Test the estimate is within a few standard errors."""
+        hll = HyperLogLog(12)
+        hll.update(f"item-{i}" for i in range(distinct))
+        assert abs(hll.count() - distinct) <= max(2, distinct * 0.05)
+
+    @pytest.mark.parametrize(
+        "precision,expected", [(4, 11026), (5, 22839), (6, 46465), (7, 93752)]
+    )
+    def test_bias_correction(self, precision, expected):
+        """Test the bias constant used for each register count."""
+        hll = HyperLogLog(precision)
+        hll.registers[:] = bytes([10]) * len(hll.registers)
+        assert hll.count() == expected
+
+    def test_merge(self):
+        """Test merging estimators over overlapping sets."""
+        left, right = HyperLogLog(), HyperLogLog()
+        left.update(str(i) for i in range(6_000))
+        right.update(str(i) for i in range(4_000, 10_000))
+        assert abs(left.merge(right).count() - 10_000) <= 300
+
+        with pytest.raises(ValueError):
+            left.merge(HyperLogLog(10))
+
+
+class TestApproxStats:
+    """Test suite for sketch-based text statistics."""
+
+    def test_approx_top_words(self):
+        """Test the library helper."""
+        assert approx_top_words("a b a c a b".split(), n=1) == [("a", 3)]
+
+    def test_analyze_stream_approx(self):
+        """Test streaming analysis with sketches."""
+        text = "one two two three three three " * 50
+        stats = analyze_stream(io.StringIO(text), 16, approx_capacity=10)
+        assert isinstance(stats, ApproxTextStats)
+        assert stats.word_count == 300
+        assert stats.distinct_words == 3
+        assert stats.top_words(1) == [("three", 150)]
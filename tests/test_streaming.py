@@ -0,0 +1,52 @@
+"""Tests for chunked text analysis."""
+
+import io
+
+import pytest
+
+from textkit.streaming import TextStats, analyze_stream, iter_word_chunks
+from textkit.validators import (
+    average_word_length,
+    get_top_words,
+    sentence_count,
+)
+
+SAMPLE = (
+    "The quick brown fox jumps over the lazy dog. "
+    "Is the dog really lazy? Yes!\nThe fox, however, is quick.  "
+)
+
+
+class TestStreaming:
+    """Test suite for streaming analysis."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 10_000])
+    def test_stream_matches_whole_text(self, chunk_size):
+        """Test that chunked results match whole-text analysis."""
+        stats = analyze_stream(io.StringIO(SAMPLE), chunk_size=chunk_size)
+        assert stats.word_count == len(SAMPLE.split())
+        assert stats.char_count == len(SAMPLE)
+        assert stats.sentence_count == sentence_count(SAMPLE)
+        assert stats.average_word_length == average_word_length(SAMPLE)
+        assert stats.top_words(5) == get_top_words(SAMPLE, n=5)
+
+    def test_chunks_do_not_split_words(self):
+        """Test that chunk boundaries fall on whitespace."""
+        chunks = list(iter_word_chunks(io.StringIO("alpha beta gamma"), 4))
+        assert "".join(chunks) == "alpha beta gamma"
+        assert [c.split() for c in chunks] == [["alpha"], ["beta"], ["gamma"]]
+
+    def test_overlong_word_is_flushed(self):
+        """Test that input without whitespace keeps the carry bounded."""
+        text = "x" * 100 + " tail"
+        chunks = list(iter_word_chunks(io.StringIO(text), 4, max_word=10))
+        assert "".join(chunks) == text
+        assert max(map(len, chunks)) < 10 + 4
+        assert chunks[-1] == "tail"
+
+    def test_merge(self):
+        """Test merging partial results."""
+        merged = TextStats.from_text("a b. ").merge(TextStats.from_text("b c"))
+        assert merged.word_count == 4
+        assert merged.sentence_count == 1
+        assert merged.frequencies == {"a": 1, "b": 2, "c": 1}
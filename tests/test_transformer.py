@@ -0,0 +1,134 @@
+"""Tests for the dataval transformers."""
+
+import sys
+
+import pytest
+
+from dataval.transformer import (
+    _KEY_STYLES,
+    convert_keys,
+    to_camel_case,
+    to_snake_case,
+)
+
+
+class TestCaseConversion:
+    """Test suite for string case conversion."""
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("HelloWorld", "hello_world"),
+            ("User Name", "user_name"),
+            ("userID2Value", "user_id2_value"),
+            ("--already__snake--", "already_snake"),
+            ("", ""),
+        ],
+    )
+    def test_to_snake_case(self, text, expected):
+        """Test snake_case conversion."""
+        assert to_snake_case(text) == expected
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("hello world", "helloWorld"),
+            ("first_second_third", "firstSecondThird"),
+            ("__", ""),
+        ],
+    )
+    def test_to_camel_case(self, text, expected):
+        """Test camelCase conversion."""
+        assert to_camel_case(text) == expected
+
+
+class TestConvertKeys:
+    """Test suite for deep key conversion."""
+
+    PAYLOAD = {
+        "userId": 1,
+        "billingAddress": {"postalCode": "123", "tags": ["a", "b"]},
+        "orderItems": [{"itemId": 1}, [{"unitPrice": 2.5}], "plain"],
+        7: None,
+    }
+
+    def test_snake(self):
+        """Test converting nested dictionaries and lists."""
+        assert convert_keys(self.PAYLOAD) == {
+            "user_id": 1,
+            "billing_address": {"postal_code": "123", "tags": ["a", "b"]},
+            "order_items": [{"item_id": 1}, [{"unit_price": 2.5}], "plain"],
+            7: None,
+        }
+
+    def test_styles(self):
+        """Test the camel and title styles."""
+        data = [{"first_name": {"last-name": 1}}]
+        assert convert_keys(data, "camel") == [{"firstName": {"lastName": 1}}]
+        assert convert_keys(data, "title") == [
+            {"First_name": {"Last-name": 1}}
+        ]
+
+    def test_copies_containers(self):
+        """Test that the input is left untouched and never shared."""
+        data = {"a": {"b": []}, "c": [[]]}
+        result = convert_keys(data)
+        assert result == data
+        assert result["a"] is not data["a"]
+        assert result["a"]["b"] is not data["a"]["b"]
+        assert result["c"][0] is not data["c"][0]
+
+    def test_scalars(self):
+        """Test that non-container values are returned as is."""
+        value = ("aB", 1)
+        assert convert_keys(value) is value
+        assert convert_keys("someKey") == "someKey"
+
+    def test_deep_nesting(self):
+        """Test nesting deeper than the recursion limit."""
+        depth = sys.getrecursionlimit() * 2
+        data: dict = {}
+        node = data
+        for _ in range(depth):
+            node["childNode"] = [{}]
+            node = node["childNode"][0]
+        node["leafValue"] = 1
+
+        result = convert_keys(data)
+        for _ in range(depth):
+            result = result["child_node"][0]
+        assert result == {"leaf_value": 1}
+
+    def test_shared_containers(self):
+        """Test that a container referenced twice is copied twice."""
+        shared = {"innerKey": 1}
+        result = convert_keys({"firstRef": shared, "secondRef": [shared]})
+        assert result == {
+            "first_ref": {"inner_key": 1},
+            "second_ref": [{"inner_key": 1}],
+        }
+
+    @pytest.mark.parametrize("kind", [dict, list])
+    def test_cycle(self, kind):
+        """Test that self-referencing containers are rejected."""
+        data: dict = {"childNode": [{}]}
+        if kind is dict:
+            data["childNode"][0]["parentNode"] = data
+        else:
+            data["childNode"].append(data["childNode"])
+        with pytest.raises(ValueError, match="cyclic"):
+            convert_keys(data)
+
+    def test_key_cache(self):
+        """Test that repeated keys are converted once."""
+        cache = _KEY_STYLES["snake"]
+        cache.cache_clear()
+        convert_keys([{"someKey": i} for i in range(100)])
+        info = cache.cache_info()
+        assert info.misses == 1
+        assert info.hits == 99
+
+    def test_unknown_style(self):
+        """Test that unknown styles are rejected."""
+        with pytest.raises(ValueError, match="Unknown key style"):
+            convert_keys({}, "kebab")
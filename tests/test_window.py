@@ -0,0 +1,61 @@
+"""Tests for sliding-window word frequencies."""
+
+import io
+
+from textkit.validators import get_top_words
+from textkit.window import SlidingWindowCounter, follow_lines
+
+
+class TestSlidingWindow:
+    """Test suite for the sliding-window counter."""
+
+    def test_line_window_matches_recount(self):
+        """Test that a line-bounded window matches a full recount."""
+        lines = [f"w{i % 4} w{i % 7} common" for i in range(50)]
+        counter = SlidingWindowCounter(max_lines=10)
+        for line in lines:
+            counter.add(line, now=0.0)
+
+        assert len(counter) == 10
+        assert counter.counts == dict(
+            get_top_words(" ".join(lines[-10:]), n=100)
+        )
+
+    def test_age_window(self):
+        """Test that old lines are evicted by age."""
+        counter = SlidingWindowCounter(max_age=10)
+        counter.add("old words", now=0.0)
+        counter.add("new words", now=8.0)
+        counter.evict(now=12.0)
+        assert counter.counts == {"new": 1, "words": 1}
+        counter.evict(now=20.0)
+        assert not counter.counts
+
+    def test_follow_lines_pipe(self):
+        """Test that non-seekable streams stop at end of input."""
+
+        class Pipe(io.StringIO):
+            def seekable(self):
+                return False
+
+        assert list(follow_lines(Pipe("a\nb"))) == ["a\n", "b"]
+
+    def test_follow_lines_starts_at_end(self, tmp_path):
+        """Test that files are followed from their end by default."""
+        path = tmp_path / "log.txt"
+        path.write_text("old line\n", encoding="utf-8")
+        with open(path, encoding="utf-8") as stream:
+            lines = follow_lines(stream, poll_interval=0)
+            assert next(lines) == ""
+            with open(path, "a", encoding="utf-8") as writer:
+                writer.write("new line\n")
+            assert next(lines) == "new line\n"
+
+    def test_follow_lines_from_start(self, tmp_path):
+        """Test reading a followed file from the beginning."""
+        path = tmp_path / "log.txt"
+        path.write_text("old line\n", encoding="utf-8")
+        with open(path, encoding="utf-8") as stream:
+            lines = follow_lines(stream, poll_interval=0, from_start=True)
+            assert next(lines) == "old line\n"
+            assert next(lines) == ""